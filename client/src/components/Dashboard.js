@@ -58,10 +58,7 @@ function Dashboard() {
   const [error, setError] = useState(null);
   const [seasonStats, setSeasonStats] = useState({
     totalRaces: 0,
-    totalSprints: 0,
-    podiumFinishes: {},
-    polePositions: {},
-    sprintWins: {}
+    drivers: []
   });
 
   const handleChange = (event, newValue) => {
@@ -77,17 +74,11 @@ function Dashboard() {
       try {
         setLoading(true);
         
-        // Fetch driver standings
-        const driversResponse = await axios.get('/api/drivers/standings');
-        setDriverStandings(driversResponse.data);
-
-        // Fetch constructor standings
-        const constructorsResponse = await axios.get('/api/teams/standings');
-        setConstructorStandings(constructorsResponse.data);
-
-        // Fetch season statistics
-        const statsResponse = await axios.get('/api/season/statistics');
-        setSeasonStats(statsResponse.data);
+        // Standings and season statistics arrive in a single request
+        const response = await axios.get('/api/dashboard');
+        setDriverStandings(response.data.driver_standings);
+        setConstructorStandings(response.data.team_standings);
+        setSeasonStats(response.data.statistics);
 
         setLoading(false);
       } catch (err) {
@@ -251,10 +242,10 @@ function Dashboard() {
               </TableRow>
             </TableHead>
             <TableBody>
-              {Object.entries(seasonStats.polePositions).map(([driver, count]) => (
-                <TableRow key={driver}>
-                  <TableCell>{driver}</TableCell>
-                  <TableCell>{count}</TableCell>
+              {seasonStats.drivers.filter((driver) => driver.poles > 0).map((driver) => (
+                <TableRow key={driver.driver_id}>
+                  <TableCell>{driver.name}</TableCell>
+                  <TableCell>{driver.poles}</TableCell>
                 </TableRow>
               ))}
             </TableBody>
@@ -262,7 +253,7 @@ function Dashboard() {
         </TableContainer>
 
         <Typography variant="h6" gutterBottom>Podium Finishes</Typography>
-        <TableContainer component={Paper}>
+        <TableContainer component={Paper} sx={{ mb: 4 }}>
           <Table>
             <TableHead>
               <TableRow>
@@ -271,10 +262,40 @@ function Dashboard() {
               </TableRow>
             </TableHead>
             <TableBody>
-              {Object.entries(seasonStats.podiumFinishes).map(([driver, count]) => (
-                <TableRow key={driver}>
-                  <TableCell>{driver}</TableCell>
-                  <TableCell>{count}</TableCell>
+              {seasonStats.drivers.filter((driver) => driver.podiums > 0).map((driver) => (
+                <TableRow key={driver.driver_id}>
+                  <TableCell>{driver.name}</TableCell>
+                  <TableCell>{driver.podiums}</TableCell>
+                </TableRow>
+              ))}
+            </TableBody>
+          </Table>
+        </TableContainer>
+
+        <Typography variant="h6" gutterBottom>Driver Performance</Typography>
+        <TableContainer component={Paper}>
+          <Table>
+            <TableHead>
+              <TableRow>
+                <TableCell>Driver</TableCell>
+                <TableCell>Starts</TableCell>
+                <TableCell>Points / Start</TableCell>
+                <TableCell>Avg. Places Gained</TableCell>
+                <TableCell>DNF Rate</TableCell>
+                <TableCell>DSQ Rate</TableCell>
+                <TableCell>Laps</TableCell>
+              </TableRow>
+            </TableHead>
+            <TableBody>
+              {seasonStats.drivers.map((driver) => (
+                <TableRow key={driver.driver_id}>
+                  <TableCell>{driver.name}</TableCell>
+                  <TableCell>{driver.starts}</TableCell>
+                  <TableCell>{driver.points_per_start.toFixed(2)}</TableCell>
+                  <TableCell>{driver.avg_positions_gained ?? '-'}</TableCell>
+                  <TableCell>{(driver.dnf_rate * 100).toFixed(0)}%</TableCell>
+                  <TableCell>{(driver.dsq_rate * 100).toFixed(0)}%</TableCell>
+                  <TableCell>{driver.laps_completed}</TableCell>
                 </TableRow>
               ))}
             </TableBody>
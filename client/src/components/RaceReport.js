@@ -17,35 +17,47 @@ import {
 import { useParams } from 'react-router-dom';
 import axios from '../axiosConfig';
 import PrintIcon from '@mui/icons-material/Print';
+import { useAuth } from '../AuthContext';
 
 function RaceReport() {
     const [raceReport, setRaceReport] = useState(null);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const { raceId } = useParams();
+    const { isAdmin } = useAuth();
 
-    useEffect(() => {
-        const fetchRaceReport = async () => {
-            try {
-                setLoading(true);
-                const response = await axios.get(`/api/races/${raceId}/report`);
-                setRaceReport(response.data);
-                setLoading(false);
-            } catch (err) {
-                setError('Failed to fetch race report: ' + (err.response?.data?.error || err.message));
-                setLoading(false);
-            }
-        };
+    const fetchRaceReport = async () => {
+        try {
+            setLoading(true);
+            const response = await axios.get(`/api/races/${raceId}/report`);
+            setRaceReport(response.data);
+            setLoading(false);
+        } catch (err) {
+            setError('Failed to fetch race report: ' + (err.response?.data?.error || err.message));
+            setLoading(false);
+        }
+    };
 
+    useEffect(() => {
         if (raceId) {
             fetchRaceReport();
         }
+        // eslint-disable-next-line react-hooks/exhaustive-deps
     }, [raceId]);
 
     const handlePrint = () => {
         window.print();
     };
 
+    const handleFinalize = async () => {
+        try {
+            await axios.post(`/api/races/${raceId}/finalize`);
+            fetchRaceReport();
+        } catch (err) {
+            setError('Failed to finalize race: ' + (err.response?.data?.error || err.message));
+        }
+    };
+
     if (loading) {
         return (
             <Box display="flex" justifyContent="center" alignItems="center" minHeight="80vh">
@@ -76,14 +88,20 @@ function RaceReport() {
                 <Typography variant="h4" component="h1">
                     {raceReport.race_details.name} {raceReport.race_details.season}
                 </Typography>
-                <Button
-                    variant="contained"
-                    startIcon={<PrintIcon />}
-                    onClick={handlePrint}
-                    sx={{ '@media print': { display: 'none' } }}
-                >
-                    Print Report
-                </Button>
+                <Box display="flex" gap={2} sx={{ '@media print': { display: 'none' } }}>
+                    {isAdmin && !raceReport.race_details.finalized_at && (
+                        <Button variant="outlined" onClick={handleFinalize}>
+                            Finalize Race
+                        </Button>
+                    )}
+                    <Button
+                        variant="contained"
+                        startIcon={<PrintIcon />}
+                        onClick={handlePrint}
+                    >
+                        Print Report
+                    </Button>
+                </Box>
             </Box>
 
             <Grid container spacing={3} mb={4}>
@@ -108,6 +126,12 @@ function RaceReport() {
                                     <TableCell component="th">Red Flags</TableCell>
                                     <TableCell>{raceReport.race_details.red_flags}</TableCell>
                                 </TableRow>
+                                <TableRow>
+                                    <TableCell component="th">Status</TableCell>
+                                    <TableCell>
+                                        {raceReport.race_details.finalized_at ? 'Final' : 'Provisional'}
+                                    </TableCell>
+                                </TableRow>
                             </TableBody>
                         </Table>
                     </Paper>
@@ -131,7 +155,7 @@ function RaceReport() {
                     <TableBody>
                         {raceReport.results.map((result) => (
                             <TableRow key={result.driver.code}>
-                                <TableCell>{result.performance.finish_position}</TableCell>
+                                <TableCell>{result.performance.finish_position ?? result.performance.status}</TableCell>
                                 <TableCell>
                                     <Box>
                                         <Typography variant="body1">
@@ -162,6 +186,62 @@ function RaceReport() {
                     </TableBody>
                 </Table>
             </TableContainer>
+
+            {raceReport.qualifying.length > 0 && (
+                <TableContainer component={Paper} sx={{ mt: 4 }}>
+                    <Typography variant="h6" sx={{ p: 2 }}>Qualifying</Typography>
+                    <Table size="small">
+                        <TableHead>
+                            <TableRow>
+                                <TableCell>Pos</TableCell>
+                                <TableCell>Driver</TableCell>
+                                <TableCell>Q1</TableCell>
+                                <TableCell>Q2</TableCell>
+                                <TableCell>Q3</TableCell>
+                            </TableRow>
+                        </TableHead>
+                        <TableBody>
+                            {raceReport.qualifying.map((entry) => (
+                                <TableRow key={entry.driver.driver_id}>
+                                    <TableCell>{entry.position}</TableCell>
+                                    <TableCell>{entry.driver.name} ({entry.driver.code})</TableCell>
+                                    <TableCell>{entry.q1_time}</TableCell>
+                                    <TableCell>{entry.q2_time}</TableCell>
+                                    <TableCell>{entry.q3_time}</TableCell>
+                                </TableRow>
+                            ))}
+                        </TableBody>
+                    </Table>
+                </TableContainer>
+            )}
+
+            {raceReport.pit_stops.length > 0 && (
+                <TableContainer component={Paper} sx={{ mt: 4 }}>
+                    <Typography variant="h6" sx={{ p: 2 }}>Pit Stops</Typography>
+                    <Table size="small">
+                        <TableHead>
+                            <TableRow>
+                                <TableCell>Driver</TableCell>
+                                <TableCell>Stop</TableCell>
+                                <TableCell>Lap</TableCell>
+                                <TableCell>Time (s)</TableCell>
+                                <TableCell>Tyre</TableCell>
+                            </TableRow>
+                        </TableHead>
+                        <TableBody>
+                            {raceReport.pit_stops.map((stop) => (
+                                <TableRow key={`${stop.driver_id}-${stop.stop_number}`}>
+                                    <TableCell>{stop.driver_code}</TableCell>
+                                    <TableCell>{stop.stop_number}</TableCell>
+                                    <TableCell>{stop.lap_number}</TableCell>
+                                    <TableCell>{stop.stop_time}</TableCell>
+                                    <TableCell>{stop.tire_compound}</TableCell>
+                                </TableRow>
+                            ))}
+                        </TableBody>
+                    </Table>
+                </TableContainer>
+            )}
         </Container>
     );
 }
@@ -28,6 +28,7 @@ import axios from '../axiosConfig';
 
 const RaceResults = ({ isAdmin }) => {
   const [results, setResults] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [openDialog, setOpenDialog] = useState(false);
   const [editingResult, setEditingResult] = useState(null);
   const [races, setRaces] = useState([]);
@@ -46,11 +47,23 @@ const RaceResults = ({ isAdmin }) => {
     gap_to_leader: '',
   });
 
-  // Fetch race results
+  // Fetch race results (first page)
   const fetchResults = async () => {
     try {
       const response = await axios.get('/api/race-results');
-      setResults(response.data);
+      setResults(response.data.results);
+      setNextCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error('Error fetching race results:', error);
+    }
+  };
+
+  // Fetch the page after the last one loaded
+  const fetchMoreResults = async () => {
+    try {
+      const response = await axios.get('/api/race-results', { params: { cursor: nextCursor } });
+      setResults(prev => [...prev, ...response.data.results]);
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error('Error fetching race results:', error);
     }
@@ -59,15 +72,11 @@ const RaceResults = ({ isAdmin }) => {
   // Fetch dropdown data
   const fetchDropdownData = async () => {
     try {
-      const [racesRes, driversRes, teamsRes] = await Promise.all([
-        axios.get('/api/races'),
-        axios.get('/api/drivers'),
-        axios.get('/api/teams')
-      ]);
+      const response = await axios.get('/api/race-results/form-options');
 
-      setRaces(racesRes.data);
-      setDrivers(driversRes.data);
-      setTeams(teamsRes.data);
+      setRaces(response.data.races);
+      setDrivers(response.data.drivers);
+      setTeams(response.data.teams);
     } catch (error) {
       console.error('Error fetching dropdown data:', error);
     }
@@ -140,6 +149,10 @@ const RaceResults = ({ isAdmin }) => {
       const response = await axios[method](url, formData);
       
       if (response.status === 200 || response.status === 201) {
+        const override = response.data.points_overridden;
+        if (override) {
+          alert(`Points were scored by the season's scoring system: ${override.points_earned} instead of ${override.submitted}`);
+        }
         fetchResults();
         handleCloseDialog();
       }
@@ -229,6 +242,14 @@ const RaceResults = ({ isAdmin }) => {
         </Table>
       </TableContainer>
 
+      {nextCursor && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+          <Button variant="outlined" onClick={fetchMoreResults}>
+            Load More
+          </Button>
+        </Box>
+      )}
+
       <Dialog open={openDialog} onClose={handleCloseDialog}>
         <DialogTitle>{editingResult ? 'Edit Race Result' : 'Add New Race Result'}</DialogTitle>
         <DialogContent>
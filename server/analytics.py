@@ -0,0 +1,205 @@
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import bindparam, text
+
+# Scopes whose data_version rows change whenever a snapshot would go stale;
+# 'epoch' changes when the database is rebuilt and the counters restart
+SNAPSHOT_SCOPES = ('epoch', 'results', 'race-results', 'races', 'drivers')
+
+# Positions and laps use 0 for "no value"; real positions start at 1
+MISSING = 0
+
+
+class ResultsSnapshot:
+    """Columnar, read-only copy of race_result joined with its race.
+
+    Every column is a NumPy array of the same length, ordered by race date,
+    so aggregations are vectorized group-bys instead of SQL round trips.
+    """
+
+    def __init__(self, columns, statuses, race_ids, race_seasons, drivers, version):
+        self.result_id = columns['result_id']
+        self.race_id = columns['race_id']
+        self.season = columns['season']
+        self.round_number = columns['round_number']
+        self.driver_id = columns['driver_id']
+        self.team_id = columns['team_id']
+        self.car_id = columns['car_id']
+        self.grid_position = columns['grid_position']
+        self.finish_position = columns['finish_position']
+        self.laps_completed = columns['laps_completed']
+        self.points = columns['points']
+        self.status_code = columns['status_code']
+        self.pole = columns['pole']
+        self.statuses = statuses
+        self.race_ids = race_ids
+        self.race_seasons = race_seasons
+        self.drivers = drivers
+        self.version = version
+        self.built_at = time.time()
+
+    def __len__(self):
+        return len(self.result_id)
+
+    @property
+    def nbytes(self):
+        arrays = (self.result_id, self.race_id, self.season, self.round_number, self.driver_id,
+                  self.team_id, self.car_id, self.grid_position, self.finish_position,
+                  self.laps_completed, self.points, self.status_code, self.pole, self.race_ids,
+                  self.race_seasons)
+        return sum(a.nbytes for a in arrays)
+
+    @classmethod
+    def load(cls, connection, version=None):
+        rows = connection.execute(text("""
+            SELECT rr.result_id, rr.race_id, r.season, r.round_number, rr.driver_id,
+                   rr.team_id, rr.car_id, rr.grid_position, rr.finish_position,
+                   rr.laps_completed, rr.points_earned, rr.status,
+                   CASE WHEN qs.race_id IS NOT NULL THEN CASE WHEN rr.driver_id = qs.pole_driver_id THEN 1 ELSE 0 END
+                        WHEN rr.grid_position = 1 THEN 1 ELSE 0 END AS pole
+            FROM race_result rr
+            JOIN race r ON r.race_id = rr.race_id
+            LEFT JOIN qualifying_session qs ON qs.race_id = rr.race_id
+            ORDER BY r.date, r.race_id, rr.result_id
+        """)).all()
+        fields = list(zip(*rows)) if rows else [()] * 13
+
+        def ints(values):
+            return np.fromiter((MISSING if v is None else v for v in values), dtype=np.int32, count=len(values))
+
+        labels = [status or '' for status in fields[11]]
+        statuses = sorted(set(labels))
+        codes = {status: i for i, status in enumerate(statuses)}
+        status_code = np.fromiter((codes[s] for s in labels), dtype=np.int32, count=len(labels))
+        columns = {
+            'result_id': ints(fields[0]),
+            'race_id': ints(fields[1]),
+            'season': ints(fields[2]),
+            'round_number': ints(fields[3]),
+            'driver_id': ints(fields[4]),
+            'team_id': ints(fields[5]),
+            'car_id': ints(fields[6]),
+            'grid_position': ints(fields[7]),
+            'finish_position': ints(fields[8]),
+            'laps_completed': ints(fields[9]),
+            'points': np.fromiter((v or 0.0 for v in fields[10]), dtype=np.float64, count=len(fields[10])),
+            'status_code': status_code,
+            # Topped qualifying, or started first where there is no qualifying data
+            'pole': np.fromiter(fields[12], dtype=bool, count=len(fields[12])),
+        }
+
+        races = connection.execute(text("SELECT race_id, season FROM race")).all()
+        race_ids = np.array([r[0] for r in races], dtype=np.int32)
+        race_seasons = np.array([r[1] for r in races], dtype=np.int32)
+        drivers = {
+            row[0]: (row[1], row[2])
+            for row in connection.execute(text("SELECT driver_id, name, code FROM driver"))
+        }
+        return cls(columns, statuses, race_ids, race_seasons, drivers, version)
+
+    def status_mask(self, status):
+        """Boolean mask of rows whose status equals the given label"""
+        if status not in self.statuses:
+            return np.zeros(len(self), dtype=bool)
+        return self.status_code == self.statuses.index(status)
+
+    def season_mask(self, season):
+        return self.season == season
+
+    def season_statistics(self, season):
+        """Per-driver season statistics, matching app.season_statistics()"""
+        mask = self.season_mask(season)
+        total_races = int(np.count_nonzero(self.race_seasons == season))
+        if not mask.any():
+            return {'season': season, 'totalRaces': total_races, 'drivers': []}
+
+        driver_ids, group = np.unique(self.driver_id[mask], return_inverse=True)
+        n = len(driver_ids)
+        grid = self.grid_position[mask]
+        finish = self.finish_position[mask]
+        finished = self.status_mask('Finished')[mask]
+
+        def count(rows):
+            return np.bincount(group, weights=rows.astype(np.float64), minlength=n).astype(np.int64)
+
+        def total(values):
+            return np.bincount(group, weights=values.astype(np.float64), minlength=n)
+
+        classified = (grid != MISSING) & (finish != MISSING)
+        gained_sum = total(np.where(classified, grid - finish, 0))
+        gained_count = count(classified)
+
+        stats = {
+            'starts': count(np.ones(len(group), dtype=bool)),
+            'points': total(self.points[mask]),
+            'wins': count((finish == 1) & finished),
+            'poles': count(self.pole[mask]),
+            'podiums': count((finish != MISSING) & (finish <= 3) & finished),
+            'dnfs': count(self.status_mask('DNF')[mask]),
+            'dsqs': count(self.status_mask('DSQ')[mask]),
+            'laps_completed': total(self.laps_completed[mask]).astype(np.int64),
+        }
+
+        order = np.lexsort((driver_ids, -stats['points']))
+        drivers = []
+        for i in order:
+            starts = int(stats['starts'][i])
+            row = {name: values[i].item() for name, values in stats.items()}
+            row['avg_positions_gained'] = (
+                round(float(gained_sum[i] / gained_count[i]), 2) if gained_count[i] else None
+            )
+            row['dnf_rate'] = round(row['dnfs'] / starts, 3) if starts else 0.0
+            row['dsq_rate'] = round(row['dsqs'] / starts, 3) if starts else 0.0
+            row['points_per_start'] = round(row['points'] / starts, 3) if starts else 0.0
+            driver_id = int(driver_ids[i])
+            name, code = self.drivers.get(driver_id, (None, None))
+            drivers.append({'driver_id': driver_id, 'name': name, 'code': code, **row})
+        return {'season': season, 'totalRaces': total_races, 'drivers': drivers}
+
+
+class SnapshotCache:
+    """Holds the current ResultsSnapshot and rebuilds it when data changes.
+
+    Checking freshness costs one lookup on data_version; the result tables
+    are only read again after a write has bumped one of SNAPSHOT_SCOPES.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    @staticmethod
+    def current_version(connection):
+        rows = connection.execute(
+            text("SELECT scope, version FROM data_version WHERE scope IN :scopes")
+            .bindparams(bindparam('scopes', expanding=True)),
+            {'scopes': list(SNAPSHOT_SCOPES)}
+        ).all()
+        versions = dict(rows)
+        return tuple(versions.get(scope, 0) for scope in SNAPSHOT_SCOPES)
+
+    def get(self, connection):
+        version = self.current_version(connection)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = ResultsSnapshot.load(connection, version)
+                self._snapshot = snapshot
+                self.builds += 1
+            return snapshot
+
+    def stats(self):
+        snapshot = self._snapshot
+        return {
+            'rows': len(snapshot) if snapshot is not None else 0,
+            'bytes': snapshot.nbytes if snapshot is not None else 0,
+            'version': list(snapshot.version) if snapshot is not None else None,
+            'built_at': snapshot.built_at if snapshot is not None else None,
+            'builds': self.builds
+        }
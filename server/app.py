@@ -1,26 +1,147 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g, stream_with_context, has_request_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime, date
+from flask_sqlalchemy.session import Session
+from datetime import datetime, date, timezone
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import object_session, aliased
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from flask_bcrypt import Bcrypt
-from sqlalchemy import text
+from flask_migrate import Migrate
+from functools import wraps
+import hashlib
+import secrets
+from cache import ResponseCache, UserCache
+from analytics import SnapshotCache
+from simulation import ChampionshipSimulator, RunThrottle, championship_field
+from passwords import PasswordHasher, PasswordHasherBusy
+from events import EventPublisher
+from serialization import json_provider, row_encoder
+from scoring_systems import SCORING_SYSTEMS
+import compression
+from sqlalchemy import text, select, insert, update, delete, func, case, event, bindparam, literal_column, tuple_
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import sqlite3
+import click
+import json
+import base64
+import csv
+import io
+import sys
+import os
+
+# Pragmas applied to every new SQLite connection, per engine profile. WAL
+# lets readers carry on while a writer holds the lock, and busy_timeout makes
+# a second writer wait for it instead of failing with "database is locked".
+SQLITE_PROFILES = {
+    'tuned': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,  # milliseconds
+        'cache_size': -65536,  # negative means KiB, i.e. 64 MiB
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY'
+    },
+    'default': {}
+}
+
+def engine_options(uri):
+    """Pool settings for the configured database, overridable from the environment"""
+    url = make_url(uri)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}  # a single shared in-memory connection, nothing to size
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 3600))
+    }
 
 app = Flask(__name__)
 CORS(app, supports_credentials=True)  # Enable CORS with credentials support
 
 # Database configuration
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///f1_database.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///f1_database.db')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+# Optional read replica; routes marked @read_only query it instead of the primary
+if os.environ.get('DATABASE_REPLICA_URL'):
+    app.config['SQLALCHEMY_BINDS'] = {
+        'replica': {'url': os.environ['DATABASE_REPLICA_URL'], **engine_options(os.environ['DATABASE_REPLICA_URL'])}
+    }
+app.config['SQLITE_PROFILE'] = os.environ.get('SQLITE_PROFILE', 'tuned')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'ASCPAKEN@#$^@32435da'  # Change this to a secure secret key
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'  # Allow cookies in cross-origin requests
 app.config['SESSION_COOKIE_SECURE'] = False  # Set to True in production with HTTPS
-db = SQLAlchemy(app)
+app.config['RESPONSE_CACHE_MAX_ENTRIES'] = 512
+app.config['RESPONSE_CACHE_TTL'] = 300  # seconds
+app.config['USER_CACHE_TTL'] = 60  # seconds; bounds staleness across worker processes
+app.config['STATISTICS_ENGINE'] = 'snapshot'  # 'snapshot' (in-memory NumPy) or 'sql'
+app.config['SIMULATION_WORKERS'] = int(os.environ.get('SIMULATION_WORKERS', os.cpu_count() or 1))
+app.config['SIMULATION_FORM_RACES'] = 10  # recent results each driver's outcomes are drawn from
+app.config['SIMULATION_DEFAULT_RUNS'] = 100000
+app.config['SIMULATION_MAX_RUNS'] = 200000
+app.config['SIMULATION_USER_INTERVAL'] = 10  # seconds between a user's runs with their own runs, seed or rounds
+app.config['AUTO_SCORE_RESULTS'] = False  # score each result written through the API by its season's scoring system
+app.config['JSON_PROVIDER'] = os.environ.get('JSON_PROVIDER', 'auto')  # 'auto' (orjson if installed), 'orjson' or 'stdlib'
+app.config['COMPRESSION_MIN_SIZE'] = 1024  # bytes; smaller bodies are sent as they are
+app.config['BCRYPT_LOG_ROUNDS'] = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))  # existing hashes are upgraded on login
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+app.config['PASSWORD_HASH_MAX_PENDING'] = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 8))
+app.config['PASSWORD_HASH_TIMEOUT'] = 10  # seconds
+app.config['STREAM_HEARTBEAT_SECONDS'] = 15
+app.config['STREAM_QUEUE_SIZE'] = 100  # events a client may fall behind before it is told to resync
+# Each open stream holds a server thread; keep this below the threads the server runs
+app.config['STREAM_MAX_CLIENTS'] = int(os.environ.get('STREAM_MAX_CLIENTS', 200))
+class RoutingSession(Session):
+    """Session that reads from the replica engine during read-only requests.
+
+    Flushes, and therefore every write, always go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing and has_request_context()
+                and g.get('read_only') and 'replica' in self._db.engines):
+            return self._db.engines['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+app.json = json_provider(app)
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
 bcrypt = Bcrypt(app)
+migrate = Migrate(app, db)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
+app.extensions['response_cache'] = ResponseCache(
+    app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+    app.config['RESPONSE_CACHE_TTL']
+)
+app.extensions['results_snapshot'] = SnapshotCache()
+app.extensions['championship_simulator'] = ChampionshipSimulator(app.config['SIMULATION_WORKERS'])
+app.extensions['simulation_throttle'] = RunThrottle(app.config['SIMULATION_USER_INTERVAL'])
+app.extensions['user_cache'] = UserCache(app.config['USER_CACHE_TTL'])
+app.extensions['password_hasher'] = PasswordHasher(
+    bcrypt,
+    rounds=app.config['BCRYPT_LOG_ROUNDS'],
+    workers=app.config['PASSWORD_HASH_WORKERS'],
+    max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+    timeout=app.config['PASSWORD_HASH_TIMEOUT']
+)
+app.extensions['event_publisher'] = EventPublisher(
+    app.config['STREAM_QUEUE_SIZE'], app.config['STREAM_MAX_CLIENTS'], dumps=app.json.dumps
+)
+
+@event.listens_for(Engine, 'connect')
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection according to SQLITE_PROFILE"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PROFILES[app.config['SQLITE_PROFILE']].items():
+        cursor.execute(f'PRAGMA {name} = {value}')
+    cursor.close()
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -29,14 +150,41 @@ class User(UserMixin, db.Model):
     is_admin = db.Column(db.Boolean, default=False)
 
     def set_password(self, password):
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password_hash = app.extensions['password_hasher'].hash(password)
 
     def check_password(self, password):
-        return bcrypt.check_password_hash(self.password_hash, password)
+        return app.extensions['password_hasher'].check(self.password_hash, password)
+
+class SessionUser(UserMixin):
+    """The logged-in user as seen by request handlers, detached from the session"""
+
+    def __init__(self, id, username, is_admin):
+        self.id = id
+        self.username = username
+        self.is_admin = bool(is_admin)
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    user_id = int(user_id)
+    cache = app.extensions['user_cache']
+    user = cache.get(user_id)
+    if user is None:
+        row = db.session.execute(
+            select(User.id, User.username, User.is_admin).where(User.id == user_id)
+        ).first()
+        if row is None:
+            return None
+        user = SessionUser(row.id, row.username, row.is_admin)
+        cache.set(user_id, user)
+    return user
+
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def track_user_change(mapper, connection, target):
+    """Drop the user's cached session entry once the change commits"""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('user_changes', set()).add(target.id)
 
 class Driver(db.Model):
     driver_id = db.Column(db.Integer, primary_key=True)
@@ -100,6 +248,10 @@ class Race(db.Model):
     race_results = db.relationship('RaceResult', back_populates='race')
     qualifying = db.relationship('Qualifying', back_populates='race')
     pit_stops = db.relationship('PitStop', back_populates='race')
+    __table_args__ = (
+        db.Index('ix_race_season_date', 'season', 'date'),
+        db.Index('ix_race_date_id', 'date', 'race_id'),
+    )
 
 class RaceResult(db.Model):
     result_id = db.Column(db.Integer, primary_key=True)
@@ -113,30 +265,36 @@ class RaceResult(db.Model):
     laps_completed = db.Column(db.Integer)
     status = db.Column(db.String(50))  # Finished, DNF, DSQ, DNS
     gap_to_leader = db.Column(db.String(20))  # Time or number of laps
+    fastest_lap = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     # Relationships
     race = db.relationship('Race', back_populates='race_results')
     driver = db.relationship('Driver', back_populates='race_results')
     team = db.relationship('Team', back_populates='race_results')
     car = db.relationship('Car', back_populates='race_results')
+    # The driver/team indexes carry the aggregated columns so the standings
+    # refresh is answered from the index alone
+    __table_args__ = (
+        db.Index('ix_race_result_race_position', 'race_id', 'finish_position'),
+        db.Index('ix_race_result_driver_totals', 'driver_id', 'race_id',
+                 'points_earned', 'finish_position', 'grid_position'),
+        db.Index('ix_race_result_team_totals', 'team_id', 'race_id',
+                 'points_earned', 'finish_position', 'grid_position'),
+        db.Index('ix_race_result_car_id', 'car_id'),
+    )
 
-    def update_driver_wins(self):
-        """Update the driver's total race wins after a result is added or modified"""
-        if self.finish_position == 1 and self.status == 'Finished' and self.driver is not None:
-            self.driver.race_wins = db.session.query(RaceResult).filter(
-                RaceResult.driver_id == self.driver_id,
-                RaceResult.finish_position == 1,
-                RaceResult.status == 'Finished'
-            ).count()
-            db.session.commit()
-
-# SQLAlchemy event listeners to automatically update race wins
-@db.event.listens_for(RaceResult, 'after_insert')
-def update_wins_after_insert(mapper, connection, target):
-    target.update_driver_wins()
+# DNF/DSQ rows have no finish position; this sorts them after every finisher.
+# The constant is inlined rather than bound so queries ordering by
+# RESULT_ORDER_POSITION match the expression in ix_race_result_race_order.
+UNCLASSIFIED_POSITION = 1000000
+RESULT_ORDER_POSITION = func.coalesce(RaceResult.finish_position, literal_column(str(UNCLASSIFIED_POSITION)))
+# Walks one race's results in results-list order without a sort
+db.Index('ix_race_result_race_order', RaceResult.race_id, RESULT_ORDER_POSITION, RaceResult.result_id)
 
-@db.event.listens_for(RaceResult, 'after_update')
-def update_wins_after_update(mapper, connection, target):
-    target.update_driver_wins()
+class RaceReport(db.Model):
+    """Rendered JSON report of a finalized race, kept current by refresh_derived_data"""
+    race_id = db.Column(db.Integer, db.ForeignKey('race.race_id'), primary_key=True)
+    report = db.Column(db.Text, nullable=False)
+    finalized_at = db.Column(db.DateTime, nullable=False)
 
 class Qualifying(db.Model):
     qualifying_id = db.Column(db.Integer, primary_key=True)
@@ -151,6 +309,28 @@ class Qualifying(db.Model):
     # Relationships
     race = db.relationship('Race', back_populates='qualifying')
     driver = db.relationship('Driver', back_populates='qualifying_results')
+    __table_args__ = (
+        db.Index('ix_qualifying_race_position', 'race_id', 'final_position'),
+    )
+
+class QualifyingSession(db.Model):
+    """Pole and field size of a race's qualifying, kept current by refresh_derived_data"""
+    race_id = db.Column(db.Integer, db.ForeignKey('race.race_id'), primary_key=True)
+    pole_driver_id = db.Column(db.Integer, db.ForeignKey('driver.driver_id'), nullable=False)
+    pole_team_id = db.Column(db.Integer, db.ForeignKey('team.team_id'))
+    pole_time = db.Column(db.Float)  # in seconds
+    entries = db.Column(db.Integer, nullable=False)
+
+class QualifyingSummary(db.Model):
+    """Per-driver qualifying outcome: best time, gap to pole and teammate head-to-head"""
+    race_id = db.Column(db.Integer, db.ForeignKey('race.race_id'), primary_key=True)
+    driver_id = db.Column(db.Integer, db.ForeignKey('driver.driver_id'), primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.team_id'))
+    position = db.Column(db.Integer)
+    best_time = db.Column(db.Float)  # fastest lap of the last session the driver took part in
+    gap_to_pole = db.Column(db.Float)
+    teammate_id = db.Column(db.Integer, db.ForeignKey('driver.driver_id'))  # only for two-car teams
+    ahead_of_teammate = db.Column(db.Boolean)
 
 class Car(db.Model):
     car_id = db.Column(db.Integer, primary_key=True)
@@ -163,6 +343,9 @@ class Car(db.Model):
     # Relationships
     team = db.relationship('Team', back_populates='cars')
     race_results = db.relationship('RaceResult', back_populates='car')
+    __table_args__ = (
+        db.Index('ix_car_team_season', 'team_id', 'season'),
+    )
 
 class PitStop(db.Model):
     pitstop_id = db.Column(db.Integer, primary_key=True)
@@ -174,6 +357,9 @@ class PitStop(db.Model):
     tire_compound = db.Column(db.String(20))
     # Relationships
     race = db.relationship('Race', back_populates='pit_stops')
+    __table_args__ = (
+        db.Index('ix_pit_stop_race_driver_stop', 'race_id', 'driver_id', 'stop_number'),
+    )
 
 class DriverTeamContract(db.Model):
     contract_id = db.Column(db.Integer, primary_key=True)
@@ -185,6 +371,638 @@ class DriverTeamContract(db.Model):
     # Relationships
     driver = db.relationship('Driver', back_populates='team_contracts')
     team = db.relationship('Team', back_populates='driver_contracts')
+    __table_args__ = (
+        db.Index('ix_driver_team_contract_driver_status', 'driver_id', 'status'),
+    )
+
+class DriverStanding(db.Model):
+    """Per-season driver totals, kept in step with every RaceResult write"""
+    season = db.Column(db.Integer, primary_key=True)
+    driver_id = db.Column(db.Integer, db.ForeignKey('driver.driver_id'), primary_key=True)
+    points = db.Column(db.Float, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    poles = db.Column(db.Integer, nullable=False, default=0)
+    podiums = db.Column(db.Integer, nullable=False, default=0)
+    __table_args__ = (
+        db.Index('ix_driver_standing_season_points', 'season', 'points'),
+    )
+
+class TeamStanding(db.Model):
+    """Per-season constructor totals, kept in step with every RaceResult write"""
+    season = db.Column(db.Integer, primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.team_id'), primary_key=True)
+    points = db.Column(db.Float, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    poles = db.Column(db.Integer, nullable=False, default=0)
+    podiums = db.Column(db.Integer, nullable=False, default=0)
+    __table_args__ = (
+        db.Index('ix_team_standing_season_points', 'season', 'points'),
+    )
+
+class ScoringSystem(db.Model):
+    """A championship points system; see scoring_systems.py for the historical ones"""
+    scoring_system_id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    fastest_lap_points = db.Column(db.Float, nullable=False, default=0)
+    fastest_lap_max_position = db.Column(db.Integer)  # None: awarded wherever the driver finishes
+    dsq_scores_zero = db.Column(db.Boolean, nullable=False, default=True)
+
+class ScoringPosition(db.Model):
+    """Points for a finishing position in a race or sprint under a scoring system"""
+    scoring_system_id = db.Column(db.Integer, db.ForeignKey('scoring_system.scoring_system_id'), primary_key=True)
+    session = db.Column(db.String(10), primary_key=True)  # race, sprint
+    position = db.Column(db.Integer, primary_key=True)
+    points = db.Column(db.Float, nullable=False)
+
+class SeasonScoring(db.Model):
+    """Seasons first_season..last_season (open-ended if None) score under a system"""
+    first_season = db.Column(db.Integer, primary_key=True)
+    last_season = db.Column(db.Integer)
+    scoring_system_id = db.Column(db.Integer, db.ForeignKey('scoring_system.scoring_system_id'), nullable=False)
+
+class SprintResult(db.Model):
+    """Sprint classification; its points are added to the weekend's race result"""
+    race_id = db.Column(db.Integer, db.ForeignKey('race.race_id'), primary_key=True)
+    driver_id = db.Column(db.Integer, db.ForeignKey('driver.driver_id'), primary_key=True)
+    finish_position = db.Column(db.Integer)
+    status = db.Column(db.String(50))  # Finished, DNF, DSQ, DNS
+
+class DataVersion(db.Model):
+    """Monotonic change counter per data scope, e.g. 'season:2025' or 'race:3'"""
+    scope = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+# Random per-database version, written whenever data_version is (re)created.
+# Every ETag and results snapshot includes it, so after a reseed restarts
+# the counters an old ETag cannot match different data.
+DATA_EPOCH_SCOPE = 'epoch'
+
+def new_data_epoch():
+    return secrets.randbelow(2 ** 31 - 1) + 1
+
+@db.event.listens_for(DataVersion.__table__, 'after_create')
+def start_data_epoch(table, connection, **kwargs):
+    connection.execute(insert(table).values(
+        scope=DATA_EPOCH_SCOPE, version=new_data_epoch(), updated_at=datetime.now(timezone.utc)
+    ))
+
+# A result is a pole if its driver topped qualifying; races without
+# qualifying data fall back to the starting grid. Needs an outer join
+# of QualifyingSession on the result's race.
+IS_POLE = db.or_(
+    db.and_(QualifyingSession.race_id.is_not(None), RaceResult.driver_id == QualifyingSession.pole_driver_id),
+    db.and_(QualifyingSession.race_id.is_(None), RaceResult.grid_position == 1)
+)
+
+def _standings_aggregate(group_column, seasons=None, ids=None):
+    """Build the per-season GROUP BY that feeds a standings table"""
+    query = select(
+        Race.season,
+        group_column,
+        func.coalesce(func.sum(RaceResult.points_earned), 0),
+        func.count(case((RaceResult.finish_position == 1, 1))),
+        func.count(case((IS_POLE, 1))),
+        func.count(case((RaceResult.finish_position <= 3, 1)))
+    ).join(Race, RaceResult.race_id == Race.race_id).outerjoin(
+        QualifyingSession, QualifyingSession.race_id == RaceResult.race_id
+    )
+    if seasons is not None:
+        query = query.where(Race.season.in_(seasons))
+    if ids is not None:
+        query = query.where(group_column.in_(ids))
+    return query.group_by(Race.season, group_column)
+
+def refresh_standings(connection, seasons=None, driver_ids=None, team_ids=None):
+    """Recompute standings rows for the given seasons, drivers and teams.
+
+    A filter left as None covers everything along that axis, so calling this
+    with no arguments rebuilds both tables from scratch.
+    """
+    targets = (
+        (DriverStanding, DriverStanding.driver_id, RaceResult.driver_id, driver_ids),
+        (TeamStanding, TeamStanding.team_id, RaceResult.team_id, team_ids)
+    )
+    for model, key_column, source_column, ids in targets:
+        if ids is not None and not ids:
+            continue
+        stmt = delete(model)
+        if seasons is not None:
+            stmt = stmt.where(model.season.in_(seasons))
+        if ids is not None:
+            stmt = stmt.where(key_column.in_(ids))
+        connection.execute(stmt)
+        connection.execute(insert(model).from_select(
+            ['season', key_column.key, 'points', 'wins', 'poles', 'podiums'],
+            _standings_aggregate(source_column, seasons, ids)
+        ))
+
+def refresh_result_counters(connection, driver_ids=None, car_ids=None):
+    """Recompute the denormalized win, point and pole counters on Driver and Car.
+
+    Each table gets one correlated UPDATE covering every affected row, so a
+    whole grid costs two statements rather than a count query per result.
+    """
+    is_win = db.and_(RaceResult.finish_position == 1, RaceResult.status == 'Finished')
+    if driver_ids is None or driver_ids:
+        stmt = update(Driver).values(
+            race_wins=select(func.count()).where(
+                RaceResult.driver_id == Driver.driver_id, is_win
+            ).scalar_subquery(),
+            total_points=select(func.coalesce(func.sum(RaceResult.points_earned), 0)).where(
+                RaceResult.driver_id == Driver.driver_id
+            ).scalar_subquery()
+        )
+        if driver_ids is not None:
+            stmt = stmt.where(Driver.driver_id.in_(driver_ids))
+        connection.execute(stmt)
+    if car_ids is None or car_ids:
+        stmt = update(Car).values(
+            total_wins=select(func.count()).where(
+                RaceResult.car_id == Car.car_id, is_win
+            ).scalar_subquery(),
+            total_poles=select(func.count()).select_from(RaceResult).outerjoin(
+                QualifyingSession, QualifyingSession.race_id == RaceResult.race_id
+            ).where(
+                RaceResult.car_id == Car.car_id, IS_POLE
+            ).scalar_subquery()
+        )
+        if car_ids is not None:
+            stmt = stmt.where(Car.car_id.in_(car_ids))
+        connection.execute(stmt)
+
+def refresh_qualifying_summary(connection, race_ids=None):
+    """Rebuild qualifying_summary and qualifying_session for race_ids (None: all races).
+
+    One INSERT ... SELECT with window functions per table: the gap to pole
+    comes from the race's position 1 time, and teammates are the other
+    entry of a two-car team (from the race result, else the contract that
+    covers the race date).
+    """
+    if race_ids is not None and not race_ids:
+        return
+    where = 'WHERE q.race_id IN :race_ids' if race_ids is not None else ''
+    params = {'race_ids': list(race_ids)} if race_ids is not None else {}
+
+    def run(sql):
+        statement = text(sql)
+        if race_ids is not None:
+            statement = statement.bindparams(bindparam('race_ids', expanding=True))
+        connection.execute(statement, params)
+
+    for model in (QualifyingSession, QualifyingSummary):
+        stmt = delete(model)
+        if race_ids is not None:
+            stmt = stmt.where(model.race_id.in_(race_ids))
+        connection.execute(stmt)
+    run(f"""
+        INSERT INTO qualifying_summary
+            (race_id, driver_id, team_id, position, best_time, gap_to_pole, teammate_id, ahead_of_teammate)
+        WITH entries AS (
+            SELECT q.race_id, q.driver_id, q.final_position AS position,
+                   COALESCE(q.q3_time, q.q2_time, q.q1_time) AS best_time,
+                   COALESCE(rr.team_id, (
+                       SELECT c.team_id FROM driver_team_contract c
+                       WHERE c.driver_id = q.driver_id AND c.start_date <= r.date
+                         AND (c.end_date IS NULL OR c.end_date >= r.date)
+                       ORDER BY c.start_date DESC LIMIT 1
+                   )) AS team_id
+            FROM qualifying q
+            JOIN race r ON r.race_id = q.race_id
+            -- One result per driver, even if a race has a duplicate entry
+            LEFT JOIN race_result rr ON rr.result_id = (
+                SELECT MIN(x.result_id) FROM race_result x
+                WHERE x.race_id = q.race_id AND x.driver_id = q.driver_id
+            )
+            {where}
+        ), team_entries AS (
+            SELECT entries.*,
+                   COUNT(*) OVER (PARTITION BY race_id, team_id) AS team_size,
+                   COUNT(position) OVER (PARTITION BY race_id, team_id) AS team_positions,
+                   SUM(driver_id) OVER (PARTITION BY race_id, team_id) AS team_driver_sum,
+                   SUM(position) OVER (PARTITION BY race_id, team_id) AS team_position_sum
+            FROM entries
+        )
+        SELECT race_id, driver_id, team_id, position, best_time,
+               best_time - MIN(CASE WHEN position = 1 THEN best_time END) OVER (PARTITION BY race_id),
+               CASE WHEN team_id IS NOT NULL AND team_size = 2 THEN team_driver_sum - driver_id END,
+               CASE WHEN team_id IS NOT NULL AND team_positions = 2 THEN position < team_position_sum - position END
+        FROM team_entries
+    """)
+    run(f"""
+        INSERT INTO qualifying_session (race_id, pole_driver_id, pole_team_id, pole_time, entries)
+        WITH field AS (
+            SELECT q.race_id, q.driver_id, q.team_id, q.best_time, q.position,
+                   COUNT(*) OVER (PARTITION BY q.race_id) AS entries
+            FROM qualifying_summary q
+            {where}
+        )
+        SELECT race_id, driver_id, team_id, best_time, entries
+        FROM field
+        WHERE position = 1
+    """)
+
+def refresh_derived_data(connection, race_ids=None, driver_ids=None, team_ids=None, car_ids=None):
+    """Bring standings and counters up to date for a set of changed results.
+
+    Arguments mirror the RaceResult foreign keys; None means "all of them".
+    Returns the seasons that were refreshed (None when every season was).
+    """
+    seasons = None
+    if race_ids is not None:
+        if not race_ids:
+            return []
+        seasons = connection.execute(
+            select(Race.season).where(Race.race_id.in_(race_ids)).distinct()
+        ).scalars().all()
+    refresh_qualifying_summary(connection, race_ids)
+    refresh_standings(connection, seasons, driver_ids, team_ids)
+    refresh_result_counters(connection, driver_ids, car_ids)
+    refresh_race_reports(connection, race_ids)
+    return seasons
+
+def scored_points_query(seasons=None, race_ids=None, result_ids=None):
+    """Select every result whose stored points differ from its scoring system's.
+
+    One pass over the results joined to their season's system, the points
+    for their race and sprint positions and the fastest lap rule. Results in
+    seasons without a scoring system are left out.
+    """
+    race_points = aliased(ScoringPosition)
+    sprint_points = aliased(ScoringPosition)
+    fastest_lap_bonus = case((db.and_(
+        RaceResult.fastest_lap,
+        db.or_(ScoringSystem.fastest_lap_max_position.is_(None),
+               RaceResult.finish_position <= ScoringSystem.fastest_lap_max_position)
+    ), ScoringSystem.fastest_lap_points), else_=0)
+    race_total = case(
+        (db.and_(RaceResult.status == 'DSQ', ScoringSystem.dsq_scores_zero), 0),
+        else_=func.coalesce(race_points.points, 0) + fastest_lap_bonus
+    )
+    sprint_total = case(
+        (db.and_(SprintResult.status == 'DSQ', ScoringSystem.dsq_scores_zero), 0),
+        else_=func.coalesce(sprint_points.points, 0)
+    )
+    scored = select(
+        RaceResult.result_id, RaceResult.race_id, Race.season, RaceResult.driver_id, RaceResult.team_id,
+        RaceResult.points_earned.label('old_points'), (race_total + sprint_total).label('points')
+    ).join(Race, RaceResult.race_id == Race.race_id).join(SeasonScoring, db.and_(
+        Race.season >= SeasonScoring.first_season,
+        db.or_(SeasonScoring.last_season.is_(None), Race.season <= SeasonScoring.last_season)
+    )).join(
+        ScoringSystem, ScoringSystem.scoring_system_id == SeasonScoring.scoring_system_id
+    ).outerjoin(race_points, db.and_(
+        race_points.scoring_system_id == ScoringSystem.scoring_system_id,
+        race_points.session == 'race', race_points.position == RaceResult.finish_position
+    )).outerjoin(SprintResult, db.and_(
+        SprintResult.race_id == RaceResult.race_id, SprintResult.driver_id == RaceResult.driver_id
+    )).outerjoin(sprint_points, db.and_(
+        sprint_points.scoring_system_id == ScoringSystem.scoring_system_id,
+        sprint_points.session == 'sprint', sprint_points.position == SprintResult.finish_position
+    ))
+    if seasons is not None:
+        scored = scored.where(Race.season.in_(seasons))
+    if race_ids is not None:
+        scored = scored.where(RaceResult.race_id.in_(race_ids))
+    if result_ids is not None:
+        scored = scored.where(RaceResult.result_id.in_(result_ids))
+    scored = scored.subquery()
+    return select(scored).where(scored.c.points.is_distinct_from(scored.c.old_points))
+
+def recompute_points(connection, seasons=None, race_ids=None, result_ids=None, preview=False):
+    """Rescore results from their scoring systems; None filters mean all history.
+
+    Returns the changed rows (result_id, race_id, season, driver_id, team_id,
+    old_points, points). With preview set nothing is written; otherwise a
+    single UPDATE ... FROM applies them. Standings are left to the caller.
+    """
+    if any(ids is not None and not ids for ids in (seasons, race_ids, result_ids)):
+        return []
+    query = scored_points_query(seasons, race_ids, result_ids)
+    changes = connection.execute(query.order_by('season', 'race_id', 'result_id')).all()
+    if changes and not preview:
+        changed = query.subquery()
+        connection.execute(
+            update(RaceResult).where(RaceResult.result_id == changed.c.result_id)
+            .values(points_earned=changed.c.points)
+        )
+    return changes
+
+def install_scoring_systems(connection, systems=SCORING_SYSTEMS):
+    """Replace the stored scoring systems and their seasons with the given definitions"""
+    connection.execute(delete(SeasonScoring))
+    connection.execute(delete(ScoringPosition))
+    connection.execute(delete(ScoringSystem))
+    for scoring_system_id, system in enumerate(systems, start=1):
+        connection.execute(insert(ScoringSystem).values(
+            scoring_system_id=scoring_system_id,
+            name=system['name'],
+            fastest_lap_points=system.get('fastest_lap_points', 0),
+            fastest_lap_max_position=system.get('fastest_lap_max_position'),
+            dsq_scores_zero=system.get('dsq_scores_zero', True)
+        ))
+        connection.execute(insert(ScoringPosition), [
+            {'scoring_system_id': scoring_system_id, 'session': session, 'position': position, 'points': points}
+            for session in ('race', 'sprint')
+            for position, points in enumerate(system.get(session, []), start=1)
+        ])
+        connection.execute(insert(SeasonScoring).values(
+            first_season=system['first_season'],
+            last_season=system.get('last_season'),
+            scoring_system_id=scoring_system_id
+        ))
+    return len(systems)
+
+def result_change_tags(race_ids=None, seasons=None):
+    """Data scopes covering every response derived from the given results"""
+    if race_ids is None or seasons is None:
+        return {'results'}
+    tags = {'race-results'}
+    tags.update(f'race:{race_id}' for race_id in race_ids)
+    tags.update(f'season:{season}' for season in seasons)
+    return tags
+
+# INSERT ... ON CONFLICT for the dialects that support it
+UPSERT_INSERTS = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}
+
+def bump_data_versions(connection, scopes):
+    """Increment the version of each scope, creating missing ones at 1.
+
+    One INSERT ... ON CONFLICT DO UPDATE, so two transactions bumping the
+    same new scope at once both succeed instead of one hitting the unique key.
+    """
+    if not scopes:
+        return
+    now = datetime.now(timezone.utc)
+    upsert = UPSERT_INSERTS.get(connection.dialect.name)
+    if upsert is None:
+        for scope in sorted(scopes):
+            bumped = connection.execute(
+                update(DataVersion).where(DataVersion.scope == scope).values(
+                    version=DataVersion.version + 1, updated_at=now
+                )
+            )
+            if bumped.rowcount == 0:
+                connection.execute(insert(DataVersion).values(scope=scope, version=1, updated_at=now))
+        return
+    # Sorted, so concurrent writers lock the rows in the same order
+    stmt = upsert(DataVersion).values([
+        {'scope': scope, 'version': 1, 'updated_at': now} for scope in sorted(scopes)
+    ])
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=[DataVersion.scope],
+        set_={'version': DataVersion.version + 1, 'updated_at': stmt.excluded.updated_at}
+    ))
+
+def record_data_change(session, tags):
+    """Bump the data versions for tags now and drop their cached responses on commit"""
+    bump_data_versions(session.connection(), tags)
+    session.info.setdefault('cache_tags', set()).update(tags)
+
+STREAM_STANDINGS = (('drivers', DriverStanding, DriverStanding.driver_id),
+                    ('teams', TeamStanding, TeamStanding.team_id))
+
+def standings_positions(connection, seasons):
+    """{(season, kind): {id: (position, points)}} from the materialized standings"""
+    positions = {}
+    for season in seasons:
+        for kind, model, key in STREAM_STANDINGS:
+            rows = connection.execute(
+                select(key, model.points).where(model.season == season).order_by(model.points.desc(), key)
+            )
+            positions[(season, kind)] = {
+                row[0]: (position, float(row[1])) for position, row in enumerate(rows, start=1)
+            }
+    return positions
+
+def standings_before_change(session, race_ids):
+    """Standings of the races' seasons ahead of a refresh, for stage_result_event.
+
+    Returns None, without reading anything, while no client is connected
+    to /api/stream.
+    """
+    if not app.extensions['event_publisher'].clients or not race_ids:
+        return None
+    connection = session.connection()
+    seasons = connection.execute(select(Race.season).where(Race.race_id.in_(race_ids)).distinct()).scalars()
+    return standings_positions(connection, set(seasons))
+
+def stage_result_event(session, race_ids, seasons, before, result_ids=None):
+    """Queue a stream event for changed results, published once the session commits.
+
+    The event carries the changed results (when their ids are known), ids of
+    deleted ones and, per affected season, only the driver and team standings
+    rows whose position or points differ from `before`; a row that left the
+    standings has a null position. Does nothing when `before` is None.
+    """
+    if before is None:
+        return
+    connection = session.connection()
+    data = {'race_ids': sorted(race_ids)}
+    if result_ids is not None:
+        rows = connection.execute(
+            select(*RACE_RESULT_COLUMNS).where(RaceResult.result_id.in_(result_ids)).order_by(RaceResult.result_id)
+        ).all() if result_ids else []
+        data['results'] = [encode_race_result(row) for row in rows]
+        data['deleted_result_ids'] = sorted(set(result_ids) - {row.result_id for row in rows})
+    after = standings_positions(connection, {season for season, _ in before} | set(seasons or ()))
+    standings = []
+    for season in sorted({season for season, _ in after}):
+        changes = {'season': season}
+        for kind, _, key in STREAM_STANDINGS:
+            old, new = before.get((season, kind), {}), after[(season, kind)]
+            rows = [{key.key: id_, 'position': position, 'points': points}
+                    for id_, (position, points) in new.items() if old.get(id_) != (position, points)]
+            rows += [{key.key: id_, 'position': None, 'points': 0.0} for id_ in old if id_ not in new]
+            changes[kind] = sorted(rows, key=lambda row: (row['position'] is None, row['position'] or 0))
+        if changes['drivers'] or changes['teams']:
+            standings.append(changes)
+    data['standings'] = standings
+    session.info.setdefault('stream_events', []).append(data)
+
+def _track_result_change(target):
+    """Remember which races, drivers, teams and cars a flushed RaceResult touched"""
+    session = object_session(target)
+    if session is None:
+        return
+    pending = session.info.setdefault('result_changes', {
+        'result_id': set(), 'race_id': set(), 'driver_id': set(), 'team_id': set(), 'car_id': set()
+    })
+    state = db.inspect(target)
+    for attr, ids in pending.items():
+        # Old values matter too: moving a result must also fix its previous owner
+        ids.update(v for v in state.attrs[attr].history.deleted if v is not None)
+        value = getattr(target, attr)
+        if value is not None:
+            ids.add(value)
+
+@db.event.listens_for(RaceResult, 'after_insert')
+def track_result_after_insert(mapper, connection, target):
+    _track_result_change(target)
+
+@db.event.listens_for(RaceResult, 'after_update')
+def track_result_after_update(mapper, connection, target):
+    _track_result_change(target)
+
+@db.event.listens_for(RaceResult, 'after_delete')
+def track_result_after_delete(mapper, connection, target):
+    _track_result_change(target)
+
+@db.event.listens_for(db.session, 'before_commit')
+def apply_result_changes(session):
+    """Refresh everything derived from the results changed in this transaction"""
+    # before_commit runs ahead of the final flush, so collect its changes first
+    session.flush()
+    pending = session.info.pop('result_changes', None)
+    if not pending:
+        return
+    before = standings_before_change(session, pending['race_id'])
+    if app.config['AUTO_SCORE_RESULTS']:
+        # Only the rows written here: the rest of the race may carry points
+        # the systems do not model, such as the archive's half-points races
+        recompute_points(session.connection(), result_ids=pending['result_id'])
+    seasons = refresh_derived_data(
+        session.connection(),
+        pending['race_id'], pending['driver_id'], pending['team_id'], pending['car_id']
+    )
+    record_data_change(session, result_change_tags(pending['race_id'], seasons))
+    stage_result_event(session, pending['race_id'], seasons, before, pending['result_id'])
+
+@db.event.listens_for(db.session, 'after_commit')
+def invalidate_cached_responses(session):
+    # Only after commit, so a concurrent reader cannot re-cache the old data
+    tags = session.info.pop('cache_tags', None)
+    if tags:
+        app.extensions['response_cache'].invalidate_tags(tags)
+    users = session.info.pop('user_changes', None)
+    if users:
+        app.extensions['user_cache'].invalidate(users)
+    for data in session.info.pop('stream_events', ()):
+        app.extensions['event_publisher'].publish('results', data)
+
+@db.event.listens_for(db.session, 'after_rollback')
+def discard_result_changes(session):
+    session.info.pop('result_changes', None)
+    session.info.pop('cache_tags', None)
+    session.info.pop('user_changes', None)
+    session.info.pop('stream_events', None)
+
+def data_version_etag(key, tags):
+    """Strong ETag and Last-Modified for a response depending on the given scopes.
+
+    Costs one primary-key lookup on data_version; the result tables are not read.
+    """
+    scopes = sorted(set(tags) | {DATA_EPOCH_SCOPE})
+    rows = db.session.execute(
+        select(DataVersion.scope, DataVersion.version, DataVersion.updated_at)
+        .where(DataVersion.scope.in_(scopes))
+    ).all()
+    versions = {row.scope: row.version for row in rows}
+    fingerprint = key + '|' + ','.join(f'{scope}={versions.get(scope, 0)}' for scope in scopes)
+    etag = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:20]
+    last_modified = max((row.updated_at for row in rows), default=None)
+    return etag, last_modified
+
+def read_only(view):
+    """Run the view's queries against the read replica, if one is configured"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.read_only = True
+        return view(*args, **kwargs)
+    return wrapper
+
+def cached_response(cache_key, store=True):
+    """Serve a JSON view conditionally and, if store is set, from the response cache.
+
+    cache_key(**view_args) returns (key, tags). The tags' data versions give
+    the response a strong ETag, so a matching If-None-Match gets a 304 before
+    the view runs. Only 200 responses are stored, keyed by ETag so a worker
+    never serves a body older than the versions it just read.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**kwargs):
+            key, tags = cache_key(**kwargs)
+            etag, last_modified = data_version_etag(key, tags)
+            if request.if_none_match:
+                not_modified = any(request.if_none_match.contains(tag) for tag in compression.etag_variants(etag))
+            else:
+                not_modified = (last_modified is not None and request.if_modified_since is not None
+                                and last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= request.if_modified_since)
+            if not_modified:
+                response = app.response_class(status=304)
+            else:
+                cache = app.extensions['response_cache']
+                versioned_key = f'{key}@{etag}'
+                if store:
+                    # Lets compress_response cache its encoded copies alongside
+                    g.cached_body = (versioned_key, tags)
+                body = cache.get(versioned_key) if store else None
+                if body is not None:
+                    response = app.response_class(body, mimetype='application/json')
+                else:
+                    response = app.make_response(view(**kwargs))
+                    if response.status_code != 200:
+                        return response
+                    if store:
+                        cache.set(versioned_key, response.get_data(), tags)
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+            # Let browsers keep the body but revalidate it on every use
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
+
+@app.after_request
+def compress_response(response):
+    """gzip or brotli encode sizeable text responses the client accepts.
+
+    Bodies that went through the response cache are compressed once and the
+    encoded bytes are cached under the same tags.
+    """
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or response.mimetype not in compression.COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if response.content_length is not None and response.content_length < app.config['COMPRESSION_MIN_SIZE']:
+        return response
+    encoding = compression.negotiate(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    cached = g.get('cached_body')
+    if cached is not None:
+        cache = app.extensions['response_cache']
+        key = f'{cached[0]}|{encoding}'
+        body = cache.get(key)
+        if body is None:
+            body = compression.compress(response.get_data(), encoding)
+            cache.set(key, body, cached[1])
+    else:
+        body = compression.compress(response.get_data(), encoding)
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(compression.encoded_etag(etag, encoding), weak)
+    return response
+
+def _requested_season():
+    """Season requested via ?season=, defaulting to the most recent one"""
+    if 'requested_season' not in g:
+        season = request.args.get('season', type=int)
+        if season is None:
+            season = db.session.query(func.max(Race.season)).scalar()
+        g.requested_season = season
+    return g.requested_season
+
+def _standings_cache_key(kind):
+    season = _requested_season()
+    return f'{kind}-standings:{season}', {'results', f'season:{season}'}
 
 # Create all database tables
 with app.app_context():
@@ -194,117 +1012,220 @@ with app.app_context():
 def hello_world():
     return {'hello': "Welcome to F1 Race Management System!"}
 
+def points_value(value):
+    return float(value) if value else 0.0
+
+# Row encoders for the list endpoints, built once at import
+encode_driver_standing = row_encoder(
+    ('driver_id', 'name', 'nationality', 'number', 'code', 'total_points', 'total_wins', 'pole_positions', 'podiums'),
+    {'driver_id': 'driver_id', 'name': 'name', 'nationality': 'nationality', 'number': 'number', 'code': 'code',
+     'total_points': (float, 'total_points'), 'total_wins': 'total_wins', 'pole_positions': 'pole_positions',
+     'podiums': 'podiums'}
+)
+encode_team_standing = row_encoder(
+    ('team_id', 'name', 'nationality', 'total_points', 'total_wins', 'pole_positions', 'podiums'),
+    {'team_id': 'team_id', 'name': 'name', 'nationality': 'nationality', 'total_points': (float, 'total_points'),
+     'total_wins': 'total_wins', 'pole_positions': 'pole_positions', 'podiums': 'podiums'}
+)
+
+def driver_standings_list(season):
+    """Driver standings for a season, read from the materialized table"""
+    query = text("""
+        SELECT 
+            d.driver_id,
+            d.name,
+            d.nationality,
+            d.number,
+            d.code,
+            s.points as total_points,
+            s.wins as total_wins,
+            s.poles as pole_positions,
+            s.podiums
+        FROM driver_standing s
+        JOIN driver d ON d.driver_id = s.driver_id
+        WHERE s.season = :season
+        ORDER BY s.points DESC, s.driver_id
+    """)
+    
+    return [encode_driver_standing(row) for row in db.session.execute(query, {'season': season})]
+
+def team_standings_list(season):
+    """Constructor standings for a season, read from the materialized table"""
+    query = text("""
+        SELECT 
+            t.team_id,
+            t.name,
+            t.nationality,
+            s.points as total_points,
+            s.wins as total_wins,
+            s.poles as pole_positions,
+            s.podiums
+        FROM team_standing s
+        JOIN team t ON t.team_id = s.team_id
+        WHERE s.season = :season
+        ORDER BY s.points DESC, s.team_id
+    """)
+    
+    return [encode_team_standing(row) for row in db.session.execute(query, {'season': season})]
+
 @app.route('/api/drivers/standings')
+@read_only
+@cached_response(lambda: _standings_cache_key('driver'))
 def get_driver_standings():
     try:
-        # Using prepared statement for complex standings calculation
-        query = text("""
-            SELECT 
-                d.driver_id,
-                d.name,
-                d.nationality,
-                d.number,
-                d.code,
-                COALESCE(SUM(r.points_earned), 0) as total_points,
-                COUNT(CASE WHEN r.finish_position = 1 THEN 1 END) as total_wins,
-                COUNT(CASE WHEN r.grid_position = 1 THEN 1 END) as pole_positions,
-                COUNT(CASE WHEN r.finish_position <= 3 THEN 1 END) as podiums
-            FROM driver d
-            LEFT JOIN race_result r ON d.driver_id = r.driver_id
-            GROUP BY d.driver_id, d.name, d.nationality, d.number, d.code
-            ORDER BY total_points DESC
-        """)
-        
-        results = db.session.execute(query)
-        standings = [
-            {
-                'driver_id': r.driver_id,
-                'name': r.name,
-                'nationality': r.nationality,
-                'number': r.number,
-                'code': r.code,
-                'total_points': float(r.total_points),
-                'total_wins': r.total_wins,
-                'pole_positions': r.pole_positions,
-                'podiums': r.podiums
-            } for r in results
-        ]
-        
-        return jsonify(standings)
+        return jsonify(driver_standings_list(_requested_season()))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/teams/standings')
+@read_only
+@cached_response(lambda: _standings_cache_key('team'))
 def get_team_standings():
     try:
-        # Using prepared statement for complex standings calculation
-        query = text("""
-            SELECT 
-                t.team_id,
-                t.name,
-                t.nationality,
-                COALESCE(SUM(r.points_earned), 0) as total_points,
-                COUNT(CASE WHEN r.finish_position = 1 THEN 1 END) as total_wins,
-                COUNT(CASE WHEN r.grid_position = 1 THEN 1 END) as pole_positions,
-                COUNT(CASE WHEN r.finish_position <= 3 THEN 1 END) as podiums
-            FROM team t
-            LEFT JOIN race_result r ON t.team_id = r.team_id
-            GROUP BY t.team_id, t.name, t.nationality
-            ORDER BY total_points DESC
-        """)
-        
-        results = db.session.execute(query)
-        standings = [
-            {
-                'team_id': r.team_id,
-                'name': r.name,
-                'nationality': r.nationality,
-                'total_points': float(r.total_points),
-                'total_wins': r.total_wins,
-                'pole_positions': r.pole_positions,
-                'podiums': r.podiums
-            } for r in results
-        ]
-        
-        return jsonify(standings)
+        return jsonify(team_standings_list(_requested_season()))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Everything the dashboard shows, in one request
+@app.route('/api/dashboard')
+@read_only
+@cached_response(lambda: (f'dashboard:{_requested_season()}',
+                          {'results', 'races', f'season:{_requested_season()}'}))
+def get_dashboard():
+    try:
+        season = _requested_season()
+        return jsonify({
+            'season': season,
+            'driver_standings': driver_standings_list(season),
+            'team_standings': team_standings_list(season),
+            'statistics': season_statistics(season)
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Live result and standings changes as Server-Sent Events
+@app.route('/api/stream')
+def stream_events():
+    publisher = app.extensions['event_publisher']
+    subscription = publisher.subscribe()
+    if subscription is None:
+        response = jsonify({'error': 'Too many open streams, try again later'})
+        response.headers['Retry-After'] = str(app.config['STREAM_HEARTBEAT_SECONDS'])
+        return response, 503
+    heartbeat = app.config['STREAM_HEARTBEAT_SECONDS']
+
+    # No request or app context is kept, so an open stream holds no database connection
+    def messages():
+        yield b'retry: 5000\n\n'
+        while True:
+            yield b''.join(publisher.wait(subscription, heartbeat))
+
+    response = Response(messages(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # stop nginx from buffering the stream
+    })
+    # Runs when the server closes the response, including before the first message
+    response.call_on_close(lambda: publisher.unsubscribe(subscription))
+    return response
+
+# Per-driver season aggregates over race_result. They are all evaluated in
+# the same GROUP BY, so adding one here costs no extra round trip.
+SEASON_STATISTICS = {
+    'starts': func.count(RaceResult.result_id),
+    'points': func.coalesce(func.sum(RaceResult.points_earned), 0),
+    'wins': func.count(case((db.and_(RaceResult.finish_position == 1, RaceResult.status == 'Finished'), 1))),
+    'poles': func.count(case((IS_POLE, 1))),
+    'podiums': func.count(case((db.and_(RaceResult.finish_position <= 3, RaceResult.status == 'Finished'), 1))),
+    'dnfs': func.count(case((RaceResult.status == 'DNF', 1))),
+    'dsqs': func.count(case((RaceResult.status == 'DSQ', 1))),
+    'laps_completed': func.coalesce(func.sum(RaceResult.laps_completed), 0),
+    # AVG skips the NULLs left by unclassified finishes
+    'avg_positions_gained': func.avg(RaceResult.grid_position - RaceResult.finish_position),
+}
+
+# Statistics computed in Python from the aggregates above
+DERIVED_SEASON_STATISTICS = {
+    'dnf_rate': lambda s: s['dnfs'] / s['starts'] if s['starts'] else 0.0,
+    'dsq_rate': lambda s: s['dsqs'] / s['starts'] if s['starts'] else 0.0,
+    'points_per_start': lambda s: s['points'] / s['starts'] if s['starts'] else 0.0,
+}
+
+def results_snapshot():
+    """Columnar snapshot of all results, rebuilt only after results change"""
+    return app.extensions['results_snapshot'].get(db.session.connection())
+
+def season_statistics(season):
+    """Per-driver statistics for a season, keyed by driver_id.
+
+    By default they come from the in-memory results snapshot; with
+    STATISTICS_ENGINE = 'sql' they are computed in a single database scan.
+    """
+    if app.config['STATISTICS_ENGINE'] == 'snapshot':
+        return results_snapshot().season_statistics(season)
+    return season_statistics_sql(season)
+
+def season_statistics_sql(season):
+    """Compute every per-driver statistic for a season in a single scan"""
+    total_races = select(func.count(Race.race_id)).where(Race.season == season).scalar_subquery()
+    query = select(
+        Driver.driver_id,
+        Driver.name,
+        Driver.code,
+        total_races.label('total_races'),
+        *[expr.label(name) for name, expr in SEASON_STATISTICS.items()]
+    ).select_from(RaceResult).join(
+        Race, RaceResult.race_id == Race.race_id
+    ).join(
+        Driver, RaceResult.driver_id == Driver.driver_id
+    ).outerjoin(
+        QualifyingSession, QualifyingSession.race_id == RaceResult.race_id
+    ).where(
+        Race.season == season
+    ).group_by(
+        Driver.driver_id, Driver.name, Driver.code
+    ).order_by(text('points DESC'), Driver.driver_id)
+
+    rows = db.session.execute(query).mappings().all()
+    drivers = []
+    for row in rows:
+        stats = {name: row[name] for name in SEASON_STATISTICS}
+        stats['points'] = float(stats['points'])
+        if stats['avg_positions_gained'] is not None:
+            stats['avg_positions_gained'] = round(float(stats['avg_positions_gained']), 2)
+        for name, compute in DERIVED_SEASON_STATISTICS.items():
+            stats[name] = round(compute(stats), 3)
+        drivers.append({'driver_id': row['driver_id'], 'name': row['name'], 'code': row['code'], **stats})
+
+    if rows:
+        total = rows[0]['total_races']
+    else:
+        # No results yet, but the calendar may already have races
+        total = db.session.query(func.count(Race.race_id)).filter(Race.season == season).scalar()
+    return {'season': season, 'totalRaces': total, 'drivers': drivers}
+
 @app.route('/api/season/statistics')
+@read_only
+@cached_response(lambda: (f'season-statistics:{_requested_season()}',
+                          {'results', 'races', f'season:{_requested_season()}'}))
 def get_season_statistics():
     try:
-        # Get total races
-        total_races = db.session.query(Race).count()
-
-        # Get pole positions per driver
-        pole_positions = db.session.query(
-            Driver.name,
-            db.func.count(RaceResult.result_id).label('count')
-        ).join(RaceResult).filter(
-            RaceResult.grid_position == 1
-        ).group_by(Driver.name).all()
-
-        # Get podium finishes per driver
-        podium_finishes = db.session.query(
-            Driver.name,
-            db.func.count(RaceResult.result_id).label('count')
-        ).join(RaceResult).filter(
-            RaceResult.finish_position <= 3,
-            RaceResult.status == 'Finished'
-        ).group_by(Driver.name).all()
-
-        # Format the response
-        stats = {
-            'totalRaces': total_races,
-            'polePositions': {name: count for name, count in pole_positions},
-            'podiumFinishes': {name: count for name, count in podium_finishes}
-        }
-        
-        return jsonify(stats)
+        return jsonify(season_statistics(_requested_season()))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Helper function to convert RaceResult to dictionary
+RACE_RESULT_COLUMNS = (
+    RaceResult.result_id, RaceResult.race_id, RaceResult.driver_id, RaceResult.team_id, RaceResult.car_id,
+    RaceResult.grid_position, RaceResult.finish_position, RaceResult.points_earned, RaceResult.laps_completed,
+    RaceResult.status, RaceResult.gap_to_leader, RaceResult.fastest_lap
+)
+encode_race_result = row_encoder([c.key for c in RACE_RESULT_COLUMNS], {
+    'result_id': 'result_id', 'race_id': 'race_id', 'driver_id': 'driver_id', 'team_id': 'team_id',
+    'car_id': 'car_id', 'grid_position': 'grid_position', 'finish_position': 'finish_position',
+    'points_earned': (points_value, 'points_earned'), 'laps_completed': 'laps_completed',
+    'status': 'status', 'gap_to_leader': 'gap_to_leader', 'fastest_lap': (bool, 'fastest_lap')
+})
+
 def race_result_to_dict(result):
     return {
         'result_id': result.result_id,
@@ -317,19 +1238,46 @@ def race_result_to_dict(result):
         'points_earned': float(result.points_earned) if result.points_earned else 0.0,
         'laps_completed': result.laps_completed,
         'status': result.status,
-        'gap_to_leader': result.gap_to_leader
+        'gap_to_leader': result.gap_to_leader,
+        'fastest_lap': bool(result.fastest_lap)
     }
 
+def points_override(data, result):
+    """Submitted and stored points when the scoring engine replaced a submitted points_earned.
+
+    With AUTO_SCORE_RESULTS on, points come from the season's scoring system
+    whatever the request says; this lets the response say so. Returns None
+    when nothing was replaced.
+    """
+    submitted = data.get('points_earned')
+    if submitted in (None, '') or isinstance(submitted, bool):
+        return None
+    try:
+        submitted = float(submitted)
+    except (TypeError, ValueError):
+        return None
+    scored = points_value(result.points_earned)
+    if submitted == scored:
+        return None
+    return {'submitted': submitted, 'points_earned': scored}
+
 # Get a single race result by ID
 @app.route('/api/race-results/<int:result_id>', methods=['GET'])
+@read_only
+@cached_response(lambda result_id: (f'race-result:{result_id}', {'results', 'race-results'}), store=False)
 def get_race_result(result_id):
     try:
-        result = RaceResult.query.get_or_404(result_id)
-        return jsonify(race_result_to_dict(result))
+        row = db.session.execute(
+            select(*RACE_RESULT_COLUMNS).where(RaceResult.result_id == result_id)
+        ).first()
+        if row is None:
+            return jsonify({'error': 'Race result not found'}), 404
+        return jsonify(encode_race_result(row))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-# Create a new race result
+# Create a new race result. points_earned is rescored when AUTO_SCORE_RESULTS
+# is on; a submitted value that differs is reported in "points_overridden"
 @app.route('/api/race-results', methods=['POST'])
 @login_required
 def create_race_result():
@@ -341,6 +1289,17 @@ def create_race_result():
         for field in required_fields:
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
+
+        # Same rule as the bulk validator: one result per driver and race
+        duplicate = db.session.execute(
+            select(RaceResult.result_id)
+            .where(RaceResult.race_id == data['race_id'], RaceResult.driver_id == data['driver_id'])
+        ).first()
+        if duplicate is not None:
+            return jsonify({
+                'error': f"Driver {data['driver_id']} already has a result for race {data['race_id']}",
+                'result_id': duplicate.result_id
+            }), 409
         
         new_result = RaceResult(
             race_id=data['race_id'],
@@ -352,13 +1311,18 @@ def create_race_result():
             points_earned=data.get('points_earned', 0.0),
             laps_completed=data.get('laps_completed'),
             status=data.get('status', 'Finished'),
-            gap_to_leader=data.get('gap_to_leader')
+            gap_to_leader=data.get('gap_to_leader'),
+            fastest_lap=bool(data.get('fastest_lap', False))
         )
         
         db.session.add(new_result)
         db.session.commit()
         
-        return jsonify(race_result_to_dict(new_result)), 201
+        body = race_result_to_dict(new_result)
+        override = points_override(data, new_result)
+        if override:
+            body['points_overridden'] = override
+        return jsonify(body), 201
     except IntegrityError:
         db.session.rollback()
         return jsonify({'error': 'Invalid foreign key or constraint violation'}), 400
@@ -366,7 +1330,7 @@ def create_race_result():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-# Update an existing race result
+# Update an existing race result; points_earned is handled as on create
 @app.route('/api/race-results/<int:result_id>', methods=['PUT'])
 @login_required
 def update_race_result(result_id):
@@ -374,6 +1338,8 @@ def update_race_result(result_id):
         result = RaceResult.query.get_or_404(result_id)
         data = request.get_json()
         
+        # race_id and driver_id are not editable, so an update cannot create
+        # a second result for the same driver and race
         # Update fields if they exist in the request
         if 'grid_position' in data:
             result.grid_position = data['grid_position']
@@ -387,12 +1353,15 @@ def update_race_result(result_id):
             result.status = data['status']
         if 'gap_to_leader' in data:
             result.gap_to_leader = data['gap_to_leader']
-        
-        # Update driver wins
-        result.update_driver_wins()
+        if 'fastest_lap' in data:
+            result.fastest_lap = bool(data['fastest_lap'])
         
         db.session.commit()
-        return jsonify(race_result_to_dict(result))
+        body = race_result_to_dict(result)
+        override = points_override(data, result)
+        if override:
+            body['points_overridden'] = override
+        return jsonify(body)
     except IntegrityError:
         db.session.rollback()
         return jsonify({'error': 'Invalid foreign key or constraint violation'}), 400
@@ -413,106 +1382,418 @@ def delete_race_result(result_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-# Get all race results
+RESULT_INT_FIELDS = ('race_id', 'driver_id', 'team_id', 'car_id',
+                     'grid_position', 'finish_position', 'laps_completed')
+RESULT_REQUIRED_FIELDS = ('race_id', 'driver_id', 'team_id', 'car_id')
+
+def flatten_bulk_results(data):
+    """Normalise a bulk payload into a flat list of result rows.
+
+    Accepts a bare list of rows, {'results': [...]}, or
+    {'races': [{'race_id': ..., 'results': [...]}, ...]} where each nested row
+    inherits its race's race_id.
+    """
+    if isinstance(data, list):
+        return data
+    if not isinstance(data, dict):
+        raise ValueError('Payload must be a list of results or an object')
+    rows = list(data.get('results', []))
+    for race in data.get('races', []):
+        for row in race.get('results', []):
+            rows.append({'race_id': race.get('race_id'), **row})
+    return rows
+
+def validate_bulk_results(rows):
+    """Check every row up front and return (clean_rows, errors).
+
+    Foreign keys are verified with one IN query per table rather than per row,
+    and a driver may only appear once per race across the batch and the table.
+    """
+    clean, errors = [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({'index': index, 'error': 'Result must be an object'})
+            continue
+        missing = [f for f in RESULT_REQUIRED_FIELDS if row.get(f) is None]
+        if missing:
+            errors.append({'index': index, 'error': f'Missing required field: {missing[0]}'})
+            continue
+        bad = [f for f in RESULT_INT_FIELDS
+               if row.get(f) is not None and (isinstance(row[f], bool) or not isinstance(row[f], int))]
+        if bad:
+            errors.append({'index': index, 'error': f'Field must be an integer: {bad[0]}'})
+            continue
+        points = row.get('points_earned', 0.0)
+        if isinstance(points, bool) or not isinstance(points, (int, float)):
+            errors.append({'index': index, 'error': 'Field must be a number: points_earned'})
+            continue
+        if not isinstance(row.get('fastest_lap', False), bool):
+            errors.append({'index': index, 'error': 'Field must be a boolean: fastest_lap'})
+            continue
+        clean.append((index, {
+            'race_id': row['race_id'],
+            'driver_id': row['driver_id'],
+            'team_id': row['team_id'],
+            'car_id': row['car_id'],
+            'grid_position': row.get('grid_position'),
+            'finish_position': row.get('finish_position'),
+            'points_earned': float(points),
+            'laps_completed': row.get('laps_completed'),
+            'status': row.get('status', 'Finished'),
+            'gap_to_leader': row.get('gap_to_leader'),
+            'fastest_lap': row.get('fastest_lap', False)
+        }))
+
+    known = {}
+    for field, column in (('race_id', Race.race_id), ('driver_id', Driver.driver_id),
+                          ('team_id', Team.team_id), ('car_id', Car.car_id)):
+        ids = {r[field] for _, r in clean}
+        known[field] = set(db.session.execute(select(column).where(column.in_(ids))).scalars()) if ids else set()
+
+    race_ids = known['race_id']
+    taken = set(db.session.execute(
+        select(RaceResult.race_id, RaceResult.driver_id).where(RaceResult.race_id.in_(race_ids))
+    ).tuples()) if race_ids else set()
+
+    valid = []
+    for index, row in clean:
+        unknown = [f for f in RESULT_REQUIRED_FIELDS if row[f] not in known[f]]
+        if unknown:
+            errors.append({'index': index, 'error': f'Unknown {unknown[0]}: {row[unknown[0]]}'})
+            continue
+        key = (row['race_id'], row['driver_id'])
+        if key in taken:
+            errors.append({'index': index, 'error': f'Driver {key[1]} already has a result for race {key[0]}'})
+            continue
+        taken.add(key)
+        valid.append(row)
+    errors.sort(key=lambda e: e['index'])
+    return valid, errors
+
+def import_race_results(rows):
+    """Validate and insert a batch of results in a single transaction.
+
+    Returns (inserted_count, errors). Nothing is written if any row fails,
+    and standings and counters are refreshed once for the whole batch.
+    """
+    valid, errors = validate_bulk_results(rows)
+    if errors:
+        return 0, errors
+    if not valid:
+        return 0, []
+    # Core insert with a parameter list runs as a single executemany and
+    # bypasses the per-row mapper events, so refresh derived data ourselves
+    race_ids = {r['race_id'] for r in valid}
+    before = standings_before_change(db.session, race_ids)
+    db.session.execute(insert(RaceResult.__table__), valid)
+    driver_ids = {r['driver_id'] for r in valid}
+    team_ids = {r['team_id'] for r in valid}
+    if app.config['AUTO_SCORE_RESULTS']:
+        # Score the batch's own rows, found by their (race, driver) pairs
+        written = select(RaceResult.result_id).where(
+            tuple_(RaceResult.race_id, RaceResult.driver_id).in_([(r['race_id'], r['driver_id']) for r in valid])
+        )
+        recompute_points(db.session.connection(), result_ids=db.session.execute(written).scalars().all())
+    seasons = refresh_derived_data(
+        db.session.connection(),
+        race_ids,
+        driver_ids,
+        team_ids,
+        {r['car_id'] for r in valid}
+    )
+    record_data_change(db.session, result_change_tags(race_ids, seasons))
+    # executemany does not return the new ids, so clients reload these races
+    stage_result_event(db.session, race_ids, seasons, before)
+    db.session.commit()
+    return len(valid), []
+
+# Create many race results at once
+@app.route('/api/race-results/bulk', methods=['POST'])
+@login_required
+def create_race_results_bulk():
+    try:
+        rows = flatten_bulk_results(request.get_json())
+        inserted, errors = import_race_results(rows)
+        if errors:
+            return jsonify({'error': 'Validation failed', 'errors': errors}), 400
+        return jsonify({'inserted': inserted}), 201
+    except (ValueError, AttributeError, TypeError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'Invalid payload: {str(e)}'}), 400
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Invalid foreign key or constraint violation'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+RESULTS_PAGE_SIZE = 50
+RESULTS_MAX_PAGE_SIZE = 200
+
+def encode_cursor(values):
+    """Pack a keyset position into an opaque URL-safe token"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+def decode_cursor(token):
+    """Unpack a token produced by encode_cursor, raising ValueError if malformed"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+# Get race results, newest race first, one keyset page at a time
+# Plain columns rather than RaceResult entities: the list never needs identity-mapped objects
+RESULT_LIST_COLUMNS = RACE_RESULT_COLUMNS + (
+    Race.date, Race.grand_prix_name, Driver.name.label('driver_name'), Team.name.label('team_name')
+)
+encode_result_list_row = row_encoder([c.key for c in RESULT_LIST_COLUMNS], {
+    'result_id': 'result_id', 'race_id': 'race_id', 'race_name': 'grand_prix_name',
+    'driver_id': 'driver_id', 'driver_name': 'driver_name', 'team_id': 'team_id', 'team_name': 'team_name',
+    'car_id': 'car_id', 'grid_position': 'grid_position', 'finish_position': 'finish_position',
+    'points_earned': (points_value, 'points_earned'), 'laps_completed': 'laps_completed',
+    'status': 'status', 'gap_to_leader': 'gap_to_leader'
+})
+
 @app.route('/api/race-results', methods=['GET'])
+@read_only
+@cached_response(lambda: (f'race-results?{request.query_string.decode()}', {'results', 'race-results'}), store=False)
 def get_race_results():
     try:
-        results = db.session.query(
-            RaceResult,
-            Race.grand_prix_name,
-            Driver.name.label('driver_name'),
-            Team.name.label('team_name')
-        ).join(
-            Race, RaceResult.race_id == Race.race_id
+        limit = request.args.get('limit', RESULTS_PAGE_SIZE, type=int)
+        limit = min(max(limit, 1), RESULTS_MAX_PAGE_SIZE)
+        position_key = RESULT_ORDER_POSITION
+
+        # A page walks races newest first through ix_race_date_id (or
+        # ix_race_season_date), and each race's results in page order through
+        # ix_race_result_race_order, stopping at limit + 1 rows with no sort.
+        # Left to its own estimates SQLite would rather read every matching
+        # result and sort them all on every page. The "+ 0" stops it from
+        # looking races up by primary key per result, which leaves the race
+        # walk as the only plan.
+        query = db.session.query(*RESULT_LIST_COLUMNS).join(
+            Race, RaceResult.race_id == Race.race_id + 0
         ).join(
             Driver, RaceResult.driver_id == Driver.driver_id
         ).join(
             Team, RaceResult.team_id == Team.team_id
-        ).order_by(
+        )
+
+        # Server-side filters
+        for param, column in (('season', Race.season), ('race_id', Race.race_id),
+                              ('driver_id', RaceResult.driver_id), ('team_id', RaceResult.team_id)):
+            value = request.args.get(param, type=int)
+            if value is not None:
+                query = query.filter(column == value)
+        if request.args.get('status'):
+            query = query.filter(RaceResult.status == request.args['status'])
+
+        # Resume strictly after the last row of the previous page; the bare
+        # date bound is where the race index seek starts
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                race_date, race_id, position, result_id = decode_cursor(cursor)
+                race_date = date.fromisoformat(race_date)
+            except (ValueError, TypeError):
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query = query.filter(Race.date <= race_date, db.or_(
+                Race.date < race_date,
+                db.and_(Race.date == race_date, db.or_(
+                    Race.race_id < race_id,
+                    db.and_(Race.race_id == race_id, db.or_(
+                        position_key > position,
+                        db.and_(position_key == position, RaceResult.result_id > result_id)
+                    ))
+                ))
+            ))
+
+        results = query.order_by(
             Race.date.desc(),
-            RaceResult.finish_position
-        ).all()
-
-        # Convert to list of dictionaries with additional information
-        results_list = [{
-            'result_id': result.RaceResult.result_id,
-            'race_id': result.RaceResult.race_id,
-            'race_name': result.grand_prix_name,
-            'driver_id': result.RaceResult.driver_id,
-            'driver_name': result.driver_name,
-            'team_id': result.RaceResult.team_id,
-            'team_name': result.team_name,
-            'car_id': result.RaceResult.car_id,
-            'grid_position': result.RaceResult.grid_position,
-            'finish_position': result.RaceResult.finish_position,
-            'points_earned': float(result.RaceResult.points_earned) if result.RaceResult.points_earned else 0.0,
-            'laps_completed': result.RaceResult.laps_completed,
-            'status': result.RaceResult.status,
-            'gap_to_leader': result.RaceResult.gap_to_leader
-        } for result in results]
-        
-        return jsonify(results_list)
+            Race.race_id.desc(),
+            position_key,
+            RaceResult.result_id
+        ).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            last = results[-1]
+            next_cursor = encode_cursor([
+                last.date.isoformat(),
+                last.race_id,
+                last.finish_position if last.finish_position is not None else UNCLASSIFIED_POSITION,
+                last.result_id
+            ])
+
+        return jsonify({'results': [encode_result_list_row(row) for row in results], 'next_cursor': next_cursor})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+encode_race_option = row_encoder(('race_id', 'grand_prix_name', 'season'), {
+    'race_id': 'race_id', 'name': (lambda name, season: f"{name} {season}", 'grand_prix_name', 'season')
+})
+encode_driver_option = row_encoder(('driver_id', 'name', 'code'), {
+    'driver_id': 'driver_id', 'name': (lambda name, code: f"{name} ({code})", 'name', 'code')
+})
+encode_team_option = row_encoder(('team_id', 'name'), {'team_id': 'team_id', 'name': 'name'})
+
+def races_list():
+    races = db.session.execute(
+        select(Race.race_id, Race.grand_prix_name, Race.season).order_by(Race.date.desc())
+    )
+    return [encode_race_option(race) for race in races]
+
+def drivers_list():
+    drivers = db.session.execute(
+        select(Driver.driver_id, Driver.name, Driver.code).order_by(Driver.name)
+    )
+    return [encode_driver_option(driver) for driver in drivers]
+
+def teams_list():
+    teams = db.session.execute(
+        select(Team.team_id, Team.name).order_by(Team.name)
+    )
+    return [encode_team_option(team) for team in teams]
+
 # Get list of all races
 @app.route('/api/races', methods=['GET'])
+@read_only
+@cached_response(lambda: ('races', {'races'}))
 def get_races():
     try:
-        races = db.session.query(
-            Race.race_id,
-            Race.grand_prix_name,
-            Race.season
-        ).order_by(Race.date.desc()).all()
-        
-        races_list = [{
-            'race_id': race.race_id,
-            'name': f"{race.grand_prix_name} {race.season}"
-        } for race in races]
-        
-        return jsonify(races_list)
+        return jsonify(races_list())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Get list of all drivers
 @app.route('/api/drivers', methods=['GET'])
+@read_only
+@cached_response(lambda: ('drivers', {'drivers'}))
 def get_drivers():
     try:
-        drivers = db.session.query(
-            Driver.driver_id,
-            Driver.name,
-            Driver.code
-        ).order_by(Driver.name).all()
-        
-        drivers_list = [{
-            'driver_id': driver.driver_id,
-            'name': f"{driver.name} ({driver.code})"
-        } for driver in drivers]
-        
-        return jsonify(drivers_list)
+        return jsonify(drivers_list())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Get list of all teams
 @app.route('/api/teams', methods=['GET'])
+@read_only
+@cached_response(lambda: ('teams', {'teams'}))
 def get_teams():
     try:
-        teams = db.session.query(
-            Team.team_id,
-            Team.name
-        ).order_by(Team.name).all()
-        
-        teams_list = [{
-            'team_id': team.team_id,
-            'name': team.name
-        } for team in teams]
-        
-        return jsonify(teams_list)
+        return jsonify(teams_list())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Get the races, drivers and teams the race result form needs, in one request
+@app.route('/api/race-results/form-options', methods=['GET'])
+@read_only
+@cached_response(lambda: ('form-options', {'races', 'drivers', 'teams'}))
+def get_race_result_form_options():
+    try:
+        return jsonify({
+            'races': races_list(),
+            'drivers': drivers_list(),
+            'teams': teams_list()
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+EXPORT_COLUMNS = (
+    'result_id', 'race_id', 'season', 'round_number', 'race_name', 'race_date',
+    'driver_id', 'driver_name', 'team_id', 'team_name', 'car_id', 'grid_position',
+    'finish_position', 'points_earned', 'laps_completed', 'status', 'gap_to_leader'
+)
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def export_result_rows(season=None):
+    """Yield every race result as a plain row, oldest race first.
+
+    Rows are fetched through a server-side cursor in batches of
+    EXPORT_BATCH_SIZE, so memory stays flat however much history there is.
+    """
+    query = select(
+        RaceResult.result_id,
+        RaceResult.race_id,
+        Race.season,
+        Race.round_number,
+        Race.grand_prix_name.label('race_name'),
+        Race.date.label('race_date'),
+        RaceResult.driver_id,
+        Driver.name.label('driver_name'),
+        RaceResult.team_id,
+        Team.name.label('team_name'),
+        RaceResult.car_id,
+        RaceResult.grid_position,
+        RaceResult.finish_position,
+        RaceResult.points_earned,
+        RaceResult.laps_completed,
+        RaceResult.status,
+        RaceResult.gap_to_leader
+    ).join(
+        Race, RaceResult.race_id == Race.race_id
+    ).join(
+        Driver, RaceResult.driver_id == Driver.driver_id
+    ).join(
+        Team, RaceResult.team_id == Team.team_id
+    ).order_by(Race.date, Race.race_id, RaceResult.result_id)
+    if season is not None:
+        query = query.where(Race.season == season)
+
+    result = db.session.execute(
+        query.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    )
+    try:
+        yield from result
+    finally:
+        result.close()
+
+def export_chunks(rows, fmt):
+    """Encode rows as NDJSON or CSV text, one chunk per EXPORT_BATCH_SIZE rows"""
+    buffer = io.StringIO()
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        values = row._asdict()
+        values['race_date'] = values['race_date'].isoformat() if values['race_date'] else None
+        if writer is not None:
+            writer.writerow([values[column] for column in EXPORT_COLUMNS])
+        else:
+            buffer.write(json.dumps(values, separators=(',', ':')))
+            buffer.write('\n')
+        count += 1
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+# Stream every race result as NDJSON or CSV
+@app.route('/api/export/race-results', methods=['GET'])
+@read_only
+def export_race_results():
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unsupported format: {fmt}"}), 400
+    season = request.args.get('season', type=int)
+    filename = f"race-results-{season if season is not None else 'all'}.{fmt}"
+    return Response(
+        stream_with_context(export_chunks(export_result_rows(season), fmt)),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
 # Get driver's current team and car
 @app.route('/api/drivers/<int:driver_id>/current-team', methods=['GET'])
+@read_only
 def get_driver_current_team(driver_id):
     try:
         # Get the driver's most recent team contract
@@ -540,6 +1821,21 @@ def get_driver_current_team(driver_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/cache/stats', methods=['GET'])
+@login_required
+def get_cache_stats():
+    stats = app.extensions['response_cache'].stats()
+    stats['users'] = app.extensions['user_cache'].stats()
+    stats['snapshot'] = app.extensions['results_snapshot'].stats()
+    stats['stream'] = app.extensions['event_publisher'].stats()
+    return jsonify(stats)
+
+def password_hasher_busy(error):
+    """503 for logins turned away because the hashing pool is saturated"""
+    response = jsonify({'error': str(error)})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @app.route('/api/auth/register', methods=['POST'])
 def register():
     try:
@@ -556,6 +1852,9 @@ def register():
         db.session.commit()
 
         return jsonify({'message': 'User registered successfully'}), 201
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy(e)
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -569,9 +1868,16 @@ def login():
 
         user = User.query.filter_by(username=data['username']).first()
         if user and user.check_password(data['password']):
+            # Upgrade hashes made with an older BCRYPT_LOG_ROUNDS
+            if app.extensions['password_hasher'].needs_rehash(user.password_hash):
+                user.set_password(data['password'])
+                db.session.commit()
             login_user(user)
             return jsonify({'message': 'Logged in successfully', 'is_admin': user.is_admin}), 200
         return jsonify({'error': 'Invalid username or password'}), 401
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return password_hasher_busy(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -607,90 +1913,808 @@ def create_admin():
         db.session.rollback()
         print(f"Error creating admin user: {str(e)}")
 
+@app.cli.command("rebuild-standings")
+@click.option('--season', type=int, default=None, help='Only rebuild this season.')
+def rebuild_standings(season):
+    """Rebuild the qualifying summaries and the materialized driver and team standings."""
+    try:
+        seasons = [season] if season is not None else None
+        connection = db.session.connection()
+        race_ids = None
+        if season is not None:
+            race_ids = set(connection.execute(select(Race.race_id).where(Race.season == season)).scalars())
+        # Poles in the standings are read from the qualifying summary
+        refresh_qualifying_summary(connection, race_ids)
+        refresh_standings(connection, seasons)
+        db.session.commit()
+        print(f"Standings rebuilt for {'season ' + str(season) if season else 'all seasons'}.")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error rebuilding standings: {str(e)}")
+
+@app.cli.command("export-results")
+@click.option('--season', type=int, default=None, help='Only export this season.')
+@click.option('--format', 'fmt', type=click.Choice(sorted(EXPORT_FORMATS)), default='ndjson')
+@click.option('--output', type=click.Path(dir_okay=False), default=None, help='Defaults to stdout.')
+def export_results(season, fmt, output):
+    """Stream race results to a file or stdout as NDJSON or CSV."""
+    out = open(output, 'w', newline='') if output else sys.stdout
+    try:
+        for chunk in export_chunks(export_result_rows(season), fmt):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
+
+@app.cli.command("import-results")
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_results(path):
+    """Import race results from a JSON file in the bulk endpoint's format."""
+    try:
+        with open(path) as f:
+            rows = flatten_bulk_results(json.load(f))
+        inserted, errors = import_race_results(rows)
+        for error in errors:
+            print(f"Row {error['index']}: {error['error']}")
+        if errors:
+            print(f"Import aborted: {len(errors)} invalid row(s), nothing written.")
+        else:
+            print(f"Imported {inserted} race result(s).")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error importing results: {str(e)}")
+
+RACE_REPORT_COLUMNS = (
+    'race_id', 'grand_prix_name', 'season', 'date', 'weather_conditions', 'safety_car_appearances', 'red_flags',
+    'result_id', 'grid_position', 'finish_position', 'points_earned', 'laps_completed', 'status', 'gap_to_leader',
+    'driver_id', 'driver_name', 'driver_code', 'driver_nationality', 'driver_number',
+    'team_id', 'team_name', 'team_nationality'
+)
+encode_report_details = row_encoder(RACE_REPORT_COLUMNS, {
+    'name': 'grand_prix_name',
+    'season': 'season',
+    'date': (lambda value: value.isoformat() if isinstance(value, date) else value, 'date'),
+    'weather_conditions': 'weather_conditions',
+    'safety_car_appearances': 'safety_car_appearances',
+    'red_flags': 'red_flags'
+})
+encode_report_result = row_encoder(RACE_REPORT_COLUMNS, {
+    'driver': {'name': 'driver_name', 'code': 'driver_code', 'nationality': 'driver_nationality',
+               'number': 'driver_number'},
+    'team': {'name': 'team_name', 'nationality': 'team_nationality'},
+    'performance': {
+        'grid_position': 'grid_position', 'finish_position': 'finish_position',
+        'points_earned': (points_value, 'points_earned'), 'laps_completed': 'laps_completed',
+        'status': 'status', 'gap_to_leader': 'gap_to_leader'
+    }
+})
+
+QUALIFYING_REPORT_COLUMNS = ('final_position', 'driver_id', 'driver_name', 'driver_code', 'q1_time', 'q2_time', 'q3_time')
+encode_report_qualifying = row_encoder(QUALIFYING_REPORT_COLUMNS, {
+    'position': 'final_position',
+    'driver': {'driver_id': 'driver_id', 'name': 'driver_name', 'code': 'driver_code'},
+    'q1_time': 'q1_time', 'q2_time': 'q2_time', 'q3_time': 'q3_time'
+})
+PIT_STOP_REPORT_COLUMNS = ('driver_id', 'driver_code', 'stop_number', 'lap_number', 'stop_time', 'tire_compound')
+encode_report_pit_stop = row_encoder(PIT_STOP_REPORT_COLUMNS, {
+    'driver_id': 'driver_id', 'driver_code': 'driver_code', 'stop_number': 'stop_number',
+    'lap_number': 'lap_number', 'stop_time': 'stop_time', 'tire_compound': 'tire_compound'
+})
+
+def render_race_report(connection, race_id):
+    """Build the race report as a JSON string, or None if the race does not exist.
+
+    Classified finishers come first in finishing order, then retirements by
+    laps completed, then non-starters and finally disqualifications.
+    """
+    rows = connection.execute(text("""
+        SELECT 
+            r.race_id,
+            r.grand_prix_name,
+            r.season,
+            r.date,
+            r.weather_conditions,
+            r.safety_car_appearances,
+            r.red_flags,
+            rr.result_id,
+            rr.grid_position,
+            rr.finish_position,
+            rr.points_earned,
+            rr.laps_completed,
+            rr.status,
+            rr.gap_to_leader,
+            d.driver_id,
+            d.name as driver_name,
+            d.code as driver_code,
+            d.nationality as driver_nationality,
+            d.number as driver_number,
+            t.team_id,
+            t.name as team_name,
+            t.nationality as team_nationality
+        FROM race r
+        LEFT JOIN race_result rr ON r.race_id = rr.race_id
+        LEFT JOIN driver d ON rr.driver_id = d.driver_id
+        LEFT JOIN team t ON rr.team_id = t.team_id
+        WHERE r.race_id = :race_id
+        ORDER BY CASE WHEN rr.finish_position IS NULL THEN 1 ELSE 0 END,
+                 rr.finish_position,
+                 CASE rr.status WHEN 'DSQ' THEN 2 WHEN 'DNS' THEN 1 ELSE 0 END,
+                 COALESCE(rr.laps_completed, 0) DESC,
+                 rr.result_id
+    """), {'race_id': race_id}).all()
+    if not rows:
+        return None
+
+    qualifying = connection.execute(text("""
+        SELECT q.final_position, d.driver_id, d.name as driver_name, d.code as driver_code,
+               q.q1_time, q.q2_time, q.q3_time
+        FROM qualifying q
+        JOIN driver d ON d.driver_id = q.driver_id
+        WHERE q.race_id = :race_id
+        ORDER BY CASE WHEN q.final_position IS NULL THEN 1 ELSE 0 END, q.final_position, q.qualifying_id
+    """), {'race_id': race_id})
+    pit_stops = connection.execute(text("""
+        SELECT p.driver_id, d.code as driver_code, p.stop_number, p.lap_number, p.stop_time, p.tire_compound
+        FROM pit_stop p
+        JOIN driver d ON d.driver_id = p.driver_id
+        WHERE p.race_id = :race_id
+        ORDER BY p.driver_id, p.stop_number
+    """), {'race_id': race_id})
+    finalized_at = connection.execute(
+        select(RaceReport.finalized_at).where(RaceReport.race_id == race_id)
+    ).scalar()
+
+    details = encode_report_details(rows[0])
+    details['finalized_at'] = finalized_at.isoformat() if finalized_at else None
+    return app.json.dumps({
+        'race_details': details,
+        'results': [encode_report_result(row) for row in rows if row.result_id],
+        'qualifying': [encode_report_qualifying(row) for row in qualifying],
+        'pit_stops': [encode_report_pit_stop(row) for row in pit_stops]
+    }, separators=(',', ':'))
+
+def refresh_race_reports(connection, race_ids=None):
+    """Re-render the stored reports of finalized races among race_ids (None: all)"""
+    query = select(RaceReport.race_id)
+    if race_ids is not None:
+        query = query.where(RaceReport.race_id.in_(race_ids))
+    finalized = connection.execute(query).scalars().all()
+    for race_id in finalized:
+        connection.execute(
+            update(RaceReport).where(RaceReport.race_id == race_id)
+            .values(report=render_race_report(connection, race_id))
+        )
+    return finalized
+
 @app.route('/api/races/<int:race_id>/report', methods=['GET'])
+@read_only
+@cached_response(lambda race_id: (f'race-report:{race_id}', {'results', f'race:{race_id}'}))
 def get_race_report(race_id):
     try:
-        # Using prepared statement for race report
-        query = text("""
-            SELECT 
-                r.race_id,
-                r.grand_prix_name,
-                r.season,
-                r.date,
-                r.weather_conditions,
-                r.safety_car_appearances,
-                r.red_flags,
-                rr.result_id,
-                rr.grid_position,
-                rr.finish_position,
-                rr.points_earned,
-                rr.laps_completed,
-                rr.status,
-                rr.gap_to_leader,
-                d.driver_id,
-                d.name as driver_name,
-                d.code as driver_code,
-                d.nationality as driver_nationality,
-                d.number as driver_number,
-                t.team_id,
-                t.name as team_name,
-                t.nationality as team_nationality
+        # Finalized races are a primary-key lookup; others are rendered live
+        report = db.session.execute(
+            select(RaceReport.report).where(RaceReport.race_id == race_id)
+        ).scalar()
+        if report is None:
+            report = render_race_report(db.session.connection(), race_id)
+        if report is None:
+            return jsonify({'error': 'Race not found'}), 404
+        return app.response_class(report + '\n', mimetype='application/json')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def finalize_race(race_id):
+    """Store the rendered report of a race; returns False if the race does not exist"""
+    if db.session.get(Race, race_id) is None:
+        return False
+    report = db.session.get(RaceReport, race_id)
+    if report is None:
+        report = RaceReport(race_id=race_id, report='')
+        db.session.add(report)
+    report.finalized_at = datetime.now(timezone.utc)
+    db.session.flush()
+    report.report = render_race_report(db.session.connection(), race_id)
+    record_data_change(db.session, {f'race:{race_id}'})
+    db.session.commit()
+    return True
+
+# Freeze a race's report once it is classified
+@app.route('/api/races/<int:race_id>/finalize', methods=['POST'])
+@login_required
+def finalize_race_report(race_id):
+    if not current_user.is_admin:
+        return jsonify({'error': 'Admin access required'}), 403
+    try:
+        if not finalize_race(race_id):
+            return jsonify({'error': 'Race not found'}), 404
+        return jsonify({'message': f'Race {race_id} finalized'}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.cli.command("finalize-race")
+@click.argument('race_ids', nargs=-1, type=int, required=True)
+def finalize_race_command(race_ids):
+    """Store the precomputed report of one or more races."""
+    for race_id in race_ids:
+        try:
+            if finalize_race(race_id):
+                print(f"Race {race_id} finalized.")
+            else:
+                print(f"Race {race_id} not found.")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error finalizing race {race_id}: {str(e)}")
+
+POINTS_CHANGE_COLUMNS = ('result_id', 'race_id', 'season', 'driver_id', 'team_id', 'old_points', 'points')
+encode_points_change = row_encoder(POINTS_CHANGE_COLUMNS, {
+    'result_id': 'result_id', 'race_id': 'race_id', 'season': 'season', 'driver_id': 'driver_id',
+    'team_id': 'team_id', 'old_points': (points_value, 'old_points'), 'new_points': (points_value, 'points')
+})
+
+def rescore_seasons(seasons=None, preview=False):
+    """Recompute points for the given seasons (None: all history) and refresh the standings.
+
+    Returns the changed rows; with preview set they are computed but not written.
+    """
+    connection = db.session.connection()
+    changes = recompute_points(connection, seasons=seasons, preview=preview)
+    if changes and not preview:
+        race_ids = {change.race_id for change in changes}
+        # The points are already rewritten, but the standings are not refreshed yet
+        before = standings_before_change(db.session, race_ids)
+        changed_seasons = refresh_derived_data(
+            connection,
+            race_ids,
+            {change.driver_id for change in changes},
+            {change.team_id for change in changes},
+            set()  # car counters do not depend on points
+        )
+        record_data_change(db.session, result_change_tags(race_ids, changed_seasons))
+        stage_result_event(db.session, race_ids, changed_seasons, before, {change.result_id for change in changes})
+        db.session.commit()
+    return changes
+
+# Recompute points_earned from the stored scoring systems
+@app.route('/api/points/recompute', methods=['POST'])
+@login_required
+def recompute_season_points():
+    if not current_user.is_admin:
+        return jsonify({'error': 'Admin access required'}), 403
+    try:
+        data = request.get_json(silent=True) or {}
+        seasons = [data['season']] if 'season' in data else data.get('seasons')
+        if seasons is not None and (not isinstance(seasons, list) or
+                                    any(isinstance(s, bool) or not isinstance(s, int) for s in seasons)):
+            return jsonify({'error': 'season must be an integer and seasons a list of integers'}), 400
+        preview = bool(data.get('preview', False))
+        changes = rescore_seasons(seasons, preview)
+        return jsonify({
+            'preview': preview,
+            'changed': len(changes),
+            'changes': [encode_points_change(change) for change in changes]
+        })
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.cli.command("install-scoring")
+def install_scoring():
+    """Replace the stored scoring systems with the historical ones."""
+    try:
+        count = install_scoring_systems(db.session.connection())
+        db.session.commit()
+        print(f"Installed {count} scoring systems.")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error installing scoring systems: {str(e)}")
+
+@app.cli.command("recompute-points")
+@click.option('--season', 'seasons', type=int, multiple=True, help='Only this season; repeatable.')
+@click.option('--preview', is_flag=True, help='Show the changes without writing them.')
+def recompute_points_command(seasons, preview):
+    """Recompute points_earned from the scoring systems and update the standings."""
+    try:
+        changes = rescore_seasons(list(seasons) or None, preview)
+        for change in changes:
+            print(f"season {change.season} race {change.race_id} result {change.result_id}: "
+                  f"{points_value(change.old_points):g} -> {points_value(change.points):g}")
+        verb = 'would change' if preview else 'changed'
+        print(f"{len(changes)} result(s) {verb} in {'season(s) ' + ', '.join(map(str, seasons)) if seasons else 'all seasons'}.")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error recomputing points: {str(e)}")
+
+def race_points_table(connection, season):
+    """Points by race finishing position under the season's scoring system"""
+    points = connection.execute(
+        select(ScoringPosition.points).join(
+            SeasonScoring, ScoringPosition.scoring_system_id == SeasonScoring.scoring_system_id
+        ).where(
+            ScoringPosition.session == 'race',
+            SeasonScoring.first_season <= season,
+            db.or_(SeasonScoring.last_season.is_(None), SeasonScoring.last_season >= season)
+        ).order_by(ScoringPosition.position)
+    ).scalars().all()
+    if points:
+        return list(points)
+    # Scoring systems not installed yet: use the built-in definitions
+    for system in reversed(SCORING_SYSTEMS):
+        if system['first_season'] <= season:
+            return system['race']
+    return SCORING_SYSTEMS[0]['race']
+
+def simulate_championship(season, runs, seed=0, rounds=None):
+    """Title probabilities for a season after `rounds` more races (default: the rest of its calendar).
+
+    Returns None if the season has no results to start from.
+    """
+    snapshot = results_snapshot()
+    field = championship_field(snapshot, season, app.config['SIMULATION_FORM_RACES'])
+    if field is None:
+        return None
+    if rounds is None:
+        rounds = field['remaining_rounds']
+    points_table = race_points_table(db.session.connection(), season)
+    totals = app.extensions['championship_simulator'].run(field, points_table, rounds, runs, seed)
+
+    drivers = []
+    for i, driver_id in enumerate(field['driver_ids']):
+        name, code = snapshot.drivers.get(int(driver_id), (None, None))
+        drivers.append({
+            'driver_id': int(driver_id), 'name': name, 'code': code,
+            'team_id': int(field['team_ids'][field['driver_team'][i]]),
+            'points': float(field['driver_points'][i]),
+            'expected_points': round(float(totals['driver_points'][i]) / runs, 2),
+            'title_probability': round(int(totals['driver_titles'][i]) / runs, 5)
+        })
+    team_names = dict(db.session.execute(
+        select(Team.team_id, Team.name).where(Team.team_id.in_(field['team_ids'].tolist()))
+    ).tuples().all())
+    teams = [{
+        'team_id': int(team_id), 'name': team_names.get(int(team_id)),
+        'points': float(field['team_points'][i]),
+        'expected_points': round(float(totals['team_points'][i]) / runs, 2),
+        'title_probability': round(int(totals['team_titles'][i]) / runs, 5)
+    } for i, team_id in enumerate(field['team_ids'])]
+    drivers.sort(key=lambda d: (-d['title_probability'], -d['points'], d['driver_id']))
+    teams.sort(key=lambda t: (-t['title_probability'], -t['points'], t['team_id']))
+    return {
+        'season': season, 'runs': runs, 'seed': seed,
+        'completed_rounds': field['completed_rounds'], 'remaining_rounds': rounds,
+        'form_races': app.config['SIMULATION_FORM_RACES'],
+        'drivers': drivers, 'teams': teams
+    }
+
+def _simulation_params():
+    """runs, seed and rounds from the query string; rounds is None for the rest of the calendar"""
+    return (
+        request.args.get('runs', app.config['SIMULATION_DEFAULT_RUNS'], type=int),
+        request.args.get('seed', 0, type=int),
+        request.args.get('rounds', type=int)
+    )
+
+def _simulation_cache_key():
+    season = _requested_season()
+    runs, seed, rounds = _simulation_params()
+    return f'championship-simulation:{season}:{runs}:{seed}:{rounds}', {'results', 'races', f'season:{season}'}
+
+# Monte Carlo title probabilities for the rest of a season
+@app.route('/api/championship/simulation', methods=['GET'])
+@read_only
+@cached_response(_simulation_cache_key)
+def get_championship_simulation():
+    try:
+        runs, seed, rounds = _simulation_params()
+        if not 1 <= runs <= app.config['SIMULATION_MAX_RUNS']:
+            return jsonify({'error': f"runs must be between 1 and {app.config['SIMULATION_MAX_RUNS']}"}), 400
+        if rounds is not None and not 0 <= rounds <= 50:
+            return jsonify({'error': 'rounds must be between 0 and 50'}), 400
+        if seed < 0:
+            return jsonify({'error': 'seed must be a non-negative integer'}), 400
+        if (runs, seed, rounds) != (app.config['SIMULATION_DEFAULT_RUNS'], 0, None):
+            # Anyone may read the one default run per season; every other set
+            # of parameters is a new run, so those are for users, and throttled
+            if not current_user.is_authenticated:
+                return jsonify({'error': 'Log in to choose runs, seed or rounds'}), 401
+            wait = app.extensions['simulation_throttle'].acquire(current_user.id)
+            if wait:
+                response = jsonify({'error': 'Too many simulations, try again later'})
+                response.headers['Retry-After'] = str(wait)
+                return response, 429
+        result = simulate_championship(_requested_season(), runs, seed, rounds)
+        if result is None:
+            return jsonify({'error': 'No results for this season yet'}), 404
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.cli.command("simulate-championship")
+@click.option('--season', type=int, default=None, help='Defaults to the most recent season.')
+@click.option('--runs', type=click.IntRange(1), default=None, help='Simulated seasons.')
+@click.option('--seed', type=click.IntRange(0), default=0)
+@click.option('--rounds', type=click.IntRange(0), default=None, help='Defaults to the rounds left in the calendar.')
+def simulate_championship_command(season, runs, seed, rounds):
+    """Print title probabilities for the rest of a season."""
+    try:
+        if season is None:
+            season = db.session.query(func.max(Race.season)).scalar()
+        result = simulate_championship(season, runs or app.config['SIMULATION_DEFAULT_RUNS'], seed, rounds)
+        if result is None:
+            print(f"No results for season {season}.")
+            return
+        print(f"Season {season}: {result['completed_rounds']} rounds run, {result['remaining_rounds']} simulated "
+              f"{result['runs']} times (seed {seed})")
+        for kind in ('drivers', 'teams'):
+            print(f"\n{kind.capitalize()}:")
+            for row in result[kind]:
+                if row['title_probability'] > 0:
+                    print(f"  {row['name']:<30} {row['points']:>7g} pts  "
+                          f"expected {row['expected_points']:>7g}  title {row['title_probability']:.2%}")
+    except Exception as e:
+        print(f"Error simulating championship: {str(e)}")
+    finally:
+        app.extensions['championship_simulator'].shutdown()
+
+PIT_STOP_TIME_COLUMNS = ('team_id', 'team_name', 'stops', 'fastest_stop', 'median_stop')
+encode_pit_stop_times = row_encoder(PIT_STOP_TIME_COLUMNS, {
+    'team_id': 'team_id', 'name': 'team_name', 'stops': 'stops',
+    'fastest_stop': 'fastest_stop', 'median_stop': (lambda value: round(value, 3), 'median_stop')
+})
+UNDERCUT_COLUMNS = ('driver_id', 'driver_code', 'lap', 'stop_time', 'grid_position', 'finish_position',
+                    'rival_id', 'rival_code', 'rival_lap', 'rival_stop_time', 'rival_grid_position',
+                    'rival_finish_position')
+encode_undercut = row_encoder(UNDERCUT_COLUMNS, {
+    'driver': {'driver_id': 'driver_id', 'code': 'driver_code', 'lap': 'lap', 'stop_time': 'stop_time',
+               'grid_position': 'grid_position', 'finish_position': 'finish_position'},
+    'rival': {'driver_id': 'rival_id', 'code': 'rival_code', 'lap': 'rival_lap', 'stop_time': 'rival_stop_time',
+              'grid_position': 'rival_grid_position', 'finish_position': 'rival_finish_position'},
+    'gained': (lambda mine, theirs: mine is not None and (theirs is None or mine < theirs),
+               'finish_position', 'rival_finish_position')
+})
+
+def race_stints(race_id):
+    """Each driver's stints in a race, rebuilt from their pit stops.
+
+    A stint runs from the lap after a stop (or the start) to the lap of the
+    next stop, or to the driver's last lap. Compounds are the ones fitted at
+    each stop; the opening stint uses the qualifying tyre when it is known.
+    """
+    rows = db.session.execute(text("""
+        WITH starts AS (
+            SELECT rr.driver_id, 0 AS stop_number, 0 AS lap_number, q.tire_compound_used AS compound
+            FROM race_result rr
+            LEFT JOIN qualifying q ON q.race_id = rr.race_id AND q.driver_id = rr.driver_id
+            WHERE rr.race_id = :race_id
+            UNION ALL
+            SELECT p.driver_id, p.stop_number, p.lap_number, p.tire_compound
+            FROM pit_stop p
+            WHERE p.race_id = :race_id
+        )
+        SELECT starts.driver_id, d.code AS driver_code, starts.stop_number + 1 AS stint, starts.compound,
+               starts.lap_number + 1 AS start_lap,
+               COALESCE(LEAD(starts.lap_number) OVER (PARTITION BY starts.driver_id ORDER BY starts.stop_number),
+                        rr.laps_completed) AS end_lap
+        FROM starts
+        JOIN driver d ON d.driver_id = starts.driver_id
+        LEFT JOIN race_result rr ON rr.race_id = :race_id AND rr.driver_id = starts.driver_id
+        ORDER BY starts.driver_id, starts.stop_number
+    """), {'race_id': race_id})
+    drivers = []
+    for row in rows:
+        if not drivers or drivers[-1]['driver_id'] != row.driver_id:
+            drivers.append({'driver_id': row.driver_id, 'code': row.driver_code, 'stints': []})
+        drivers[-1]['stints'].append({
+            'stint': row.stint, 'compound': row.compound, 'start_lap': row.start_lap, 'end_lap': row.end_lap,
+            'laps': row.end_lap - row.start_lap + 1 if row.end_lap is not None else None
+        })
+    return drivers
+
+def pit_stop_times(season):
+    """Fastest and median stationary time per team over a season's pit stops"""
+    rows = db.session.execute(text("""
+        WITH stops AS (
+            SELECT rr.team_id, p.stop_time,
+                   ROW_NUMBER() OVER (PARTITION BY rr.team_id ORDER BY p.stop_time) AS stop_rank,
+                   COUNT(*) OVER (PARTITION BY rr.team_id) AS stop_count
             FROM race r
-            LEFT JOIN race_result rr ON r.race_id = rr.race_id
-            LEFT JOIN driver d ON rr.driver_id = d.driver_id
-            LEFT JOIN team t ON rr.team_id = t.team_id
-            WHERE r.race_id = :race_id
-            ORDER BY rr.finish_position
-        """)
-        
-        results = db.session.execute(query, {'race_id': race_id})
-        
-        # Process results
-        race_report = {
-            'race_details': None,
-            'results': []
-        }
-        
-        for row in results:
-            if not race_report['race_details']:
-                race_report['race_details'] = {
-                    'name': row.grand_prix_name,
-                    'season': row.season,
-                    'date': row.date,
-                    'weather_conditions': row.weather_conditions,
-                    'safety_car_appearances': row.safety_car_appearances,
-                    'red_flags': row.red_flags
-                }
-            
-            if row.result_id:  # Only add if there are results
-                race_report['results'].append({
-                    'driver': {
-                        'name': row.driver_name,
-                        'code': row.driver_code,
-                        'nationality': row.driver_nationality,
-                        'number': row.driver_number
-                    },
-                    'team': {
-                        'name': row.team_name,
-                        'nationality': row.team_nationality
-                    },
-                    'performance': {
-                        'grid_position': row.grid_position,
-                        'finish_position': row.finish_position,
-                        'points_earned': float(row.points_earned) if row.points_earned else 0.0,
-                        'laps_completed': row.laps_completed,
-                        'status': row.status,
-                        'gap_to_leader': row.gap_to_leader
-                    }
-                })
-        
-        if not race_report['race_details']:
+            JOIN pit_stop p ON p.race_id = r.race_id
+            JOIN race_result rr ON rr.race_id = p.race_id AND rr.driver_id = p.driver_id
+            WHERE r.season = :season
+        )
+        SELECT stops.team_id, t.name AS team_name, MAX(stops.stop_count) AS stops, MIN(stops.stop_time) AS fastest_stop,
+               AVG(CASE WHEN stops.stop_rank IN ((stops.stop_count + 1) / 2, (stops.stop_count + 2) / 2)
+                        THEN stops.stop_time END) AS median_stop
+        FROM stops
+        JOIN team t ON t.team_id = stops.team_id
+        GROUP BY stops.team_id, t.name
+        ORDER BY median_stop, stops.team_id
+    """), {'season': season})
+    return [encode_pit_stop_times(row) for row in rows]
+
+def race_undercuts(race_id, window):
+    """Stops made up to `window` laps before a rival who started ahead made theirs.
+
+    Without lap-by-lap positions the grid stands in for the running order;
+    `gained` says whether the earlier stopper finished ahead of the rival.
+    """
+    rows = db.session.execute(text("""
+        SELECT a.driver_id, da.code AS driver_code, a.lap_number AS lap, a.stop_time,
+               ra.grid_position, ra.finish_position,
+               b.driver_id AS rival_id, db.code AS rival_code, b.lap_number AS rival_lap,
+               b.stop_time AS rival_stop_time, rb.grid_position AS rival_grid_position,
+               rb.finish_position AS rival_finish_position
+        FROM pit_stop a
+        JOIN pit_stop b ON b.race_id = a.race_id AND b.driver_id <> a.driver_id
+                       AND b.lap_number > a.lap_number AND b.lap_number <= a.lap_number + :window
+        JOIN race_result ra ON ra.race_id = a.race_id AND ra.driver_id = a.driver_id
+        JOIN race_result rb ON rb.race_id = b.race_id AND rb.driver_id = b.driver_id
+        JOIN driver da ON da.driver_id = a.driver_id
+        JOIN driver db ON db.driver_id = b.driver_id
+        WHERE a.race_id = :race_id AND rb.grid_position < ra.grid_position
+        ORDER BY a.lap_number, a.driver_id, b.lap_number, b.driver_id
+    """), {'race_id': race_id, 'window': window})
+    return [encode_undercut(row) for row in rows]
+
+@app.route('/api/races/<int:race_id>/stints', methods=['GET'])
+@read_only
+@cached_response(lambda race_id: (f'race-stints:{race_id}', {'results', f'race:{race_id}'}))
+def get_race_stints(race_id):
+    try:
+        if db.session.get(Race, race_id) is None:
+            return jsonify({'error': 'Race not found'}), 404
+        return jsonify({'race_id': race_id, 'drivers': race_stints(race_id)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/races/<int:race_id>/undercuts', methods=['GET'])
+@read_only
+@cached_response(lambda race_id: (
+    f"race-undercuts:{race_id}:{request.args.get('window', 3, type=int)}", {'results', f'race:{race_id}'}
+))
+def get_race_undercuts(race_id):
+    try:
+        window = request.args.get('window', 3, type=int)
+        if not 1 <= window <= 10:
+            return jsonify({'error': 'window must be between 1 and 10 laps'}), 400
+        if db.session.get(Race, race_id) is None:
+            return jsonify({'error': 'Race not found'}), 404
+        return jsonify({'race_id': race_id, 'window': window, 'undercuts': race_undercuts(race_id, window)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/pit-stops/summary', methods=['GET'])
+@read_only
+@cached_response(lambda: (f'pit-stop-summary:{_requested_season()}', {'results', f'season:{_requested_season()}'}))
+def get_pit_stop_summary():
+    try:
+        season = _requested_season()
+        return jsonify({'season': season, 'teams': pit_stop_times(season)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+QUALIFYING_TIME_FIELDS = ('q1_time', 'q2_time', 'q3_time')
+
+def validate_qualifying(rows):
+    """Check a race's qualifying rows up front and return (clean_rows, errors).
+
+    Times are in seconds and may be null for sessions a driver did not
+    reach. Positions are optional, but must then be left out for the whole
+    field; they are derived knockout style: Q3 times first, then Q2, then Q1.
+    """
+    if not isinstance(rows, list):
+        raise ValueError('Payload must be a list of qualifying results or an object with "results"')
+    clean, errors = [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({'index': index, 'error': 'Result must be an object'})
+            continue
+        driver_id = row.get('driver_id')
+        if isinstance(driver_id, bool) or not isinstance(driver_id, int):
+            errors.append({'index': index, 'error': 'Field must be an integer: driver_id'})
+            continue
+        bad = [f for f in QUALIFYING_TIME_FIELDS if row.get(f) is not None and (
+            isinstance(row[f], bool) or not isinstance(row[f], (int, float)) or row[f] <= 0)]
+        if bad:
+            errors.append({'index': index, 'error': f'Field must be a positive number: {bad[0]}'})
+            continue
+        position = row.get('final_position')
+        if position is not None and (isinstance(position, bool) or not isinstance(position, int) or position < 1):
+            errors.append({'index': index, 'error': 'Field must be a positive integer: final_position'})
+            continue
+        clean.append((index, {
+            'driver_id': driver_id,
+            'q1_time': row.get('q1_time'),
+            'q2_time': row.get('q2_time'),
+            'q3_time': row.get('q3_time'),
+            'final_position': position,
+            'tire_compound_used': row.get('tire_compound_used'),
+            'weather_conditions': row.get('weather_conditions')
+        }))
+
+    driver_ids = {r['driver_id'] for _, r in clean}
+    known = set(db.session.execute(
+        select(Driver.driver_id).where(Driver.driver_id.in_(driver_ids))
+    ).scalars()) if driver_ids else set()
+    seen, positions, valid = set(), set(), []
+    for index, row in clean:
+        if row['driver_id'] not in known:
+            errors.append({'index': index, 'error': f"Unknown driver_id: {row['driver_id']}"})
+        elif row['driver_id'] in seen:
+            errors.append({'index': index, 'error': f"Driver {row['driver_id']} appears more than once"})
+        elif row['final_position'] is not None and row['final_position'] in positions:
+            errors.append({'index': index, 'error': f"Position {row['final_position']} appears more than once"})
+        else:
+            seen.add(row['driver_id'])
+            positions.add(row['final_position'])
+            valid.append(row)
+
+    given = [row['final_position'] is not None for row in valid]
+    if any(given) and not all(given):
+        errors.append({'index': None, 'error': 'final_position must be given for every driver or for none'})
+    elif valid and not any(given):
+        def knockout(row):
+            for session, time in enumerate((row['q3_time'], row['q2_time'], row['q1_time'])):
+                if time is not None:
+                    return (session, time)
+            return (3, 0)
+        for position, row in enumerate(sorted(valid, key=knockout), start=1):
+            row['final_position'] = position
+    errors.sort(key=lambda e: (e['index'] is None, e['index'] or 0))
+    return valid, errors
+
+def import_qualifying(race_id, rows):
+    """Replace a race's qualifying with rows in one transaction.
+
+    Returns (inserted_count, errors), or None if the race does not exist.
+    The qualifying summary, poles in the standings and counters, and a
+    finalized report of the race are refreshed before the commit.
+    """
+    if db.session.get(Race, race_id) is None:
+        return None
+    valid, errors = validate_qualifying(rows)
+    if errors:
+        return 0, errors
+    connection = db.session.connection()
+    previous = set(connection.execute(select(Qualifying.driver_id).where(Qualifying.race_id == race_id)).scalars())
+    connection.execute(delete(Qualifying).where(Qualifying.race_id == race_id))
+    if valid:
+        connection.execute(insert(Qualifying.__table__), [{'race_id': race_id, **row} for row in valid])
+    # Poles can move between any drivers of the race, old field or new
+    entries = connection.execute(
+        select(RaceResult.driver_id, RaceResult.team_id, RaceResult.car_id).where(RaceResult.race_id == race_id)
+    ).all()
+    driver_ids = previous | {row['driver_id'] for row in valid} | {entry.driver_id for entry in entries}
+    seasons = refresh_derived_data(
+        connection,
+        {race_id},
+        driver_ids,
+        {entry.team_id for entry in entries},
+        {entry.car_id for entry in entries}
+    )
+    record_data_change(db.session, result_change_tags({race_id}, seasons))
+    db.session.commit()
+    return len(valid), []
+
+# Replace the qualifying classification of a race
+@app.route('/api/races/<int:race_id>/qualifying', methods=['POST'])
+@login_required
+def create_race_qualifying(race_id):
+    try:
+        data = request.get_json()
+        rows = data.get('results') if isinstance(data, dict) else data
+        imported = import_qualifying(race_id, rows)
+        if imported is None:
             return jsonify({'error': 'Race not found'}), 404
-            
-        return jsonify(race_report)
+        inserted, errors = imported
+        if errors:
+            return jsonify({'error': 'Validation failed', 'errors': errors}), 400
+        return jsonify({'inserted': inserted}), 201
+    except (ValueError, AttributeError, TypeError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'Invalid payload: {str(e)}'}), 400
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Invalid foreign key or constraint violation'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+QUALIFYING_SUMMARY_COLUMNS = ('position', 'driver_id', 'driver_code', 'team_id', 'best_time', 'gap_to_pole',
+                              'q1_time', 'q2_time', 'q3_time', 'teammate_id', 'ahead_of_teammate')
+encode_qualifying_summary = row_encoder(QUALIFYING_SUMMARY_COLUMNS, {
+    'position': 'position',
+    'driver': {'driver_id': 'driver_id', 'code': 'driver_code'},
+    'team_id': 'team_id',
+    'q1_time': 'q1_time', 'q2_time': 'q2_time', 'q3_time': 'q3_time',
+    'best_time': 'best_time',
+    'gap_to_pole': (lambda value: round(value, 3) if value is not None else None, 'gap_to_pole'),
+    'teammate_id': 'teammate_id',
+    'ahead_of_teammate': (lambda value: bool(value) if value is not None else None, 'ahead_of_teammate')
+})
+HEAD_TO_HEAD_COLUMNS = ('driver_id', 'driver_name', 'teammate_id', 'teammate_name', 'team_id', 'sessions', 'ahead')
+encode_head_to_head = row_encoder(HEAD_TO_HEAD_COLUMNS, {
+    'driver': {'driver_id': 'driver_id', 'name': 'driver_name'},
+    'teammate': {'driver_id': 'teammate_id', 'name': 'teammate_name'},
+    'team_id': 'team_id', 'sessions': 'sessions', 'ahead': 'ahead'
+})
+
+@app.route('/api/races/<int:race_id>/qualifying', methods=['GET'])
+@read_only
+@cached_response(lambda race_id: (f'race-qualifying:{race_id}', {'results', f'race:{race_id}'}))
+def get_race_qualifying(race_id):
+    try:
+        if db.session.get(Race, race_id) is None:
+            return jsonify({'error': 'Race not found'}), 404
+        session = db.session.execute(
+            select(QualifyingSession.pole_driver_id, QualifyingSession.pole_team_id,
+                   QualifyingSession.pole_time, QualifyingSession.entries)
+            .where(QualifyingSession.race_id == race_id)
+        ).first()
+        rows = db.session.execute(text("""
+            SELECT s.position, s.driver_id, d.code AS driver_code, s.team_id, s.best_time, s.gap_to_pole,
+                   q.q1_time, q.q2_time, q.q3_time, s.teammate_id, s.ahead_of_teammate
+            FROM qualifying_summary s
+            JOIN qualifying q ON q.race_id = s.race_id AND q.driver_id = s.driver_id
+            JOIN driver d ON d.driver_id = s.driver_id
+            WHERE s.race_id = :race_id
+            ORDER BY CASE WHEN s.position IS NULL THEN 1 ELSE 0 END, s.position, s.driver_id
+        """), {'race_id': race_id})
+        return jsonify({
+            'race_id': race_id,
+            'pole': {'driver_id': session.pole_driver_id, 'team_id': session.pole_team_id,
+                     'time': session.pole_time} if session else None,
+            'entries': session.entries if session else 0,
+            'results': [encode_qualifying_summary(row) for row in rows]
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/qualifying/head-to-head', methods=['GET'])
+@read_only
+@cached_response(lambda: (f'qualifying-head-to-head:{_requested_season()}', {'results', f'season:{_requested_season()}'}))
+def get_qualifying_head_to_head():
+    try:
+        season = _requested_season()
+        rows = db.session.execute(text("""
+            SELECT s.driver_id, d.name AS driver_name, s.teammate_id, m.name AS teammate_name, s.team_id,
+                   COUNT(*) AS sessions,
+                   COUNT(CASE WHEN s.ahead_of_teammate THEN 1 END) AS ahead
+            FROM race r
+            JOIN qualifying_summary s ON s.race_id = r.race_id
+            JOIN driver d ON d.driver_id = s.driver_id
+            JOIN driver m ON m.driver_id = s.teammate_id
+            WHERE r.season = :season AND s.ahead_of_teammate IS NOT NULL
+            GROUP BY s.driver_id, d.name, s.teammate_id, m.name, s.team_id
+            ORDER BY s.team_id, s.driver_id, s.teammate_id
+        """), {'season': season})
+        return jsonify({'season': season, 'head_to_head': [encode_head_to_head(row) for row in rows]})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.cli.command("import-qualifying")
+@click.argument('race_id', type=int)
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_qualifying_command(race_id, path):
+    """Replace a race's qualifying with a JSON file in the endpoint's format."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        imported = import_qualifying(race_id, data.get('results') if isinstance(data, dict) else data)
+        if imported is None:
+            print(f"Race {race_id} not found.")
+            return
+        inserted, errors = imported
+        for error in errors:
+            print(f"Row {error['index']}: {error['error']}" if error['index'] is not None else error['error'])
+        if errors:
+            print(f"Import aborted: {len(errors)} error(s), nothing written.")
+        else:
+            print(f"Imported {inserted} qualifying result(s) for race {race_id}.")
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error importing qualifying: {str(e)}")
+
 application = app
 
 if __name__ == '__main__':
@@ -0,0 +1,327 @@
+"""Endpoint benchmarks over synthetic data sets of several sizes.
+
+    python benchmark.py --sizes 1x10,5x20,20x20 --output baseline.json
+    python benchmark.py --compare baseline.json
+
+Each size runs in its own process against a throwaway SQLite database
+(SEASONSxRACES, 20 drivers). For every route it records p50/p95 latency,
+SQL statements per request and peak Python memory, and writes them to a
+JSON file that can be compared with the run of another commit.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy.engine import make_url
+
+DEFAULT_SIZES = '1x10,5x20,20x20'
+DEFAULT_ITERATIONS = 30
+REGRESSION_THRESHOLD = 1.25
+
+# Routes that are deliberately not timed
+EXCLUDED_ROUTES = {
+    ('GET', '/static/<path:filename>'): 'served by Flask, not the API',
+    ('GET', '/api/auth/logout'): 'ends the benchmark session',
+    ('POST', '/api/auth/logout'): 'ends the benchmark session',
+    ('GET', '/api/stream'): 'an event stream that stays open; its cost lands on the result writes',
+}
+
+# Status every timed request must return; anything else marks the route failed
+EXPECTED_STATUS = {
+    ('POST', '/api/auth/register'): 201,
+    ('POST', '/api/race-results'): 201,
+    ('DELETE', '/api/race-results/<int:result_id>'): 204,
+    ('POST', '/api/race-results/bulk'): 201,
+    ('POST', '/api/races/<int:race_id>/qualifying'): 201,
+}
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def run_worker(seasons, races, iterations, warm):
+    """Build one data set, time every route against it and return the results"""
+    from app import app, db, User, Race, RaceResult, encode_cursor
+    from synthetic_data import generate
+    from sqlalchemy import event, func, insert
+    from datetime import date
+
+    started = time.perf_counter()
+    counts = generate(seasons, races, last_season=date.today().year)
+    generate_seconds = time.perf_counter() - started
+
+    with app.app_context():
+        admin = User(username='bench-admin', is_admin=True)
+        admin.set_password('bench-password')
+        db.session.add(admin)
+        db.session.commit()
+        last_season = db.session.query(func.max(Race.season)).scalar()
+        race_id = db.session.query(func.max(Race.race_id)).filter(Race.season == last_season).scalar()
+        result = db.session.query(RaceResult).filter(RaceResult.race_id == race_id).first()
+        sample = {
+            'season': last_season, 'race_id': race_id, 'result_id': result.result_id,
+            'driver_id': result.driver_id, 'team_id': result.team_id, 'car_id': result.car_id
+        }
+        # Empty races for the bulk and single result endpoints, one per request
+        first_spare = db.session.query(func.max(Race.race_id)).scalar() + 1
+        db.session.execute(insert(Race), [
+            {'race_id': first_spare + i, 'season': last_season, 'round_number': 100 + i,
+             'grand_prix_name': f'Benchmark GP {i}', 'circuit_id': 1, 'date': date(last_season, 12, 1)}
+            for i in range(2 * (iterations + 2))
+        ])
+        db.session.commit()
+        cursor = encode_cursor([f'{last_season}-06-01', race_id, 5, 0])
+
+    client = app.test_client()
+    client.post('/api/auth/login', json={'username': 'bench-admin', 'password': 'bench-password'})
+    created = []
+    spare_races = iter(range(first_spare, first_spare + iterations + 2))
+    single_races = iter(range(first_spare + iterations + 2, first_spare + 2 * (iterations + 2)))
+    users = iter(range(10 ** 6))
+
+    def bulk_payload():
+        race = next(spare_races)
+        return {'races': [{'race_id': race, 'results': [
+            {'driver_id': d, 'team_id': 1, 'car_id': sample['car_id'], 'finish_position': d,
+             'points_earned': 0.0, 'status': 'Finished'} for d in range(1, 21)
+        ]}]}
+
+    def qualifying_payload():
+        return {'results': [
+            {'driver_id': d, 'q1_time': 80.0 + d * 0.1, 'q2_time': 79.5 + d * 0.1 if d <= 15 else None,
+             'q3_time': 79.0 + d * 0.1 if d <= 10 else None} for d in range(1, 21)
+        ]}
+
+    def remember(response):
+        if response.status_code == 201:
+            created.append(response.get_json()['result_id'])
+
+    s = sample
+    routes = [
+        ('GET', '/hello', None, None),
+        ('GET', '/api/drivers/standings', None, None),
+        ('GET', '/api/teams/standings', None, None),
+        ('GET', '/api/dashboard', None, None),
+        ('GET', '/api/season/statistics', None, None),
+        ('GET', '/api/race-results', None, None),
+        ('GET', f'/api/race-results?season={s["season"]}&driver_id={s["driver_id"]}', None, None),
+        ('GET', f'/api/race-results?cursor={cursor}', None, None),
+        ('GET', f'/api/race-results/{s["result_id"]}', None, None),
+        ('GET', '/api/race-results/form-options', None, None),
+        ('GET', '/api/races', None, None),
+        ('GET', '/api/drivers', None, None),
+        ('GET', '/api/teams', None, None),
+        ('GET', f'/api/drivers/{s["driver_id"]}/current-team', None, None),
+        ('GET', f'/api/races/{s["race_id"]}/report', None, None),
+        ('GET', f'/api/races/{s["race_id"]}/stints', None, None),
+        ('GET', f'/api/races/{s["race_id"]}/undercuts', None, None),
+        ('GET', f'/api/pit-stops/summary?season={s["season"]}', None, None),
+        ('GET', f'/api/races/{s["race_id"]}/qualifying', None, None),
+        ('GET', f'/api/qualifying/head-to-head?season={s["season"]}', None, None),
+        ('GET', f'/api/export/race-results?season={s["season"]}', None, None),
+        ('GET', f'/api/championship/simulation?season={s["season"]}&runs=20000&rounds=5', None, None),
+        ('GET', '/api/export/race-results?format=csv', None, None),
+        ('GET', '/api/cache/stats', None, None),
+        ('GET', '/api/auth/status', None, None),
+        ('POST', '/api/auth/login', lambda: {'username': 'bench-admin', 'password': 'bench-password'}, None),
+        ('POST', '/api/auth/register', lambda: {'username': f'bench-{next(users)}', 'password': 'x'}, None),
+        ('PUT', f'/api/race-results/{s["result_id"]}', lambda: {'gap_to_leader': '+1.000'}, None),
+        ('POST', '/api/race-results', lambda: {
+            'race_id': next(single_races), 'driver_id': s['driver_id'], 'team_id': s['team_id'],
+            'car_id': s['car_id'], 'finish_position': 20, 'status': 'Finished'}, remember),
+        ('DELETE', '/api/race-results/{created}', None, None),
+        ('POST', '/api/race-results/bulk', bulk_payload, None),
+        ('POST', f'/api/races/{s["race_id"]}/finalize', None, None),
+        ('POST', f'/api/races/{s["race_id"]}/qualifying', qualifying_payload, None),
+        ('POST', '/api/points/recompute', lambda: {'season': s['season'], 'preview': True}, None),
+    ]
+
+    statements = []
+    def count_statement(*args):
+        statements.append(1)
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+
+    def call(method, url, body, after):
+        if '{created}' in url:
+            if not created:
+                return None  # the create route failed, so there is nothing to act on
+            url = url.format(created=created.pop())
+        response = client.open(url, method=method, json=body() if body else None)
+        response.get_data()
+        if after:
+            after(response)
+        return response
+
+    # Results are keyed by rule so runs on different data sets line up
+    adapter = app.url_map.bind('localhost')
+    def label(method, url):
+        path, _, query = url.partition('?')
+        rule, _ = adapter.match(path.format(created=0), method=method, return_rule=True)
+        query = '&'.join(part.split('=')[0] for part in query.split('&') if part)
+        return f'{method} {rule.rule}' + (f'?{query}' if query else '')
+
+    cache = app.extensions['response_cache']
+    report = {}
+    for method, url, body, after in routes:
+        name = label(method, url)
+        expected = EXPECTED_STATUS.get(tuple(name.split('?')[0].split(' ', 1)), 200)
+        timings, sql = [], []
+        status = None
+        for _ in range(iterations):
+            if not warm:
+                cache.clear()
+            statements.clear()
+            started = time.perf_counter()
+            response = call(method, url, body, after)
+            timings.append((time.perf_counter() - started) * 1000)
+            sql.append(len(statements))
+            status = response.status_code if response is not None else None
+            if status != expected:
+                break
+
+        if status == expected:
+            if not warm:
+                cache.clear()
+            tracemalloc.start()
+            response = call(method, url, body, after)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            status = response.status_code if response is not None else None
+
+        if status != expected:
+            # Timings of an error response are not a baseline for anything
+            report[name] = {'status': status, 'expected_status': expected, 'failed': True}
+            continue
+        report[name] = {
+            'status': status,
+            'p50_ms': round(percentile(timings, 0.5), 3),
+            'p95_ms': round(percentile(timings, 0.95), 3),
+            'sql_statements': round(sum(sql) / len(sql), 2),
+            'peak_kb': round(peak / 1024, 1)
+        }
+
+    # New routes should be added above; list the ones that are missing
+    benchmarked = set()
+    for method, url, _, _ in routes:
+        endpoint, _ = adapter.match(url.split('?')[0].format(created=0), method=method)
+        benchmarked.add((method, endpoint))
+    uncovered = [
+        f'{method} {rule.rule}'
+        for rule in app.url_map.iter_rules()
+        for method in sorted(rule.methods - {'HEAD', 'OPTIONS'})
+        if (method, rule.endpoint) not in benchmarked and (method, rule.rule) not in EXCLUDED_ROUTES
+    ]
+
+    return {
+        'rows': counts,
+        'failed_routes': [name for name, stats in report.items() if stats.get('failed')],
+        'generate_seconds': round(generate_seconds, 2),
+        'routes': report,
+        'uncovered_routes': uncovered
+    }
+
+def compare(old, new, threshold):
+    """Print per-route ratios between two runs; return the regressions found"""
+    regressions = []
+    for size, data in new['sizes'].items():
+        previous = old.get('sizes', {}).get(size)
+        if not previous:
+            print(f'{size}: not in baseline')
+            continue
+        print(f'\n{size}')
+        print(f"{'route':60} {'p50 old':>9} {'p50 new':>9} {'ratio':>6} {'sql old':>8} {'sql new':>8}")
+        for route, stats in data['routes'].items():
+            before = previous['routes'].get(route)
+            if stats.get('failed'):
+                print(f'{route:60} {"-":>9} {"failed":>9}')
+                continue
+            if before and before.get('failed'):
+                before = None  # a failed run is no baseline
+            if not before:
+                print(f'{route:60} {"-":>9} {stats["p50_ms"]:>9} {"new":>6}')
+                continue
+            ratio = stats['p50_ms'] / before['p50_ms'] if before['p50_ms'] else 1.0
+            flag = ''
+            if ratio > threshold or stats['sql_statements'] > before['sql_statements']:
+                flag = '  <-- regression'
+                regressions.append((size, route))
+            print(f"{route:60} {before['p50_ms']:>9} {stats['p50_ms']:>9} {ratio:>6.2f} "
+                  f"{before['sql_statements']:>8} {stats['sql_statements']:>8}{flag}")
+    return regressions
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma-separated SEASONSxRACES list.')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument('--warm', action='store_true', help='Keep the response cache between requests.')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare this run against a saved JSON file.')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument('--database-url', help='Run against this (throwaway!) database instead of '
+                                                   'temporary SQLite files; its contents are replaced.')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        seasons, races = (int(n) for n in args.worker.split('x'))
+        print(json.dumps(run_worker(seasons, races, args.iterations, args.warm)))
+        return
+
+    results = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'iterations': args.iterations,
+            'warm_cache': args.warm,
+            'database': make_url(args.database_url).get_backend_name() if args.database_url else 'sqlite'
+        },
+        'sizes': {}
+    }
+    for size in args.sizes.split(','):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, DATABASE_URL=args.database_url or f"sqlite:///{os.path.join(tmp, 'benchmark.db')}")
+            command = [sys.executable, os.path.abspath(__file__), '--worker', size,
+                       '--iterations', str(args.iterations)] + (['--warm'] if args.warm else [])
+            worker = subprocess.run(command, env=env, capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)))
+            if worker.returncode:
+                sys.exit(f'{size}: benchmark failed\n{worker.stderr}')
+            results['sizes'][size] = json.loads(worker.stdout.strip().splitlines()[-1])
+            data = results['sizes'][size]
+            print(f"{size}: {data['rows']['results']} results, generated in {data['generate_seconds']}s")
+            for route in data['uncovered_routes']:
+                print(f'  not benchmarked: {route}')
+            for route in data['failed_routes']:
+                stats = data['routes'][route]
+                print(f"  FAILED: {route} returned {stats['status']}, expected {stats['expected_status']}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Wrote {args.output}')
+
+    failed = any(data['failed_routes'] for data in results['sizes'].values())
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        if regressions:
+            sys.exit(1)
+    if failed:
+        sys.exit('Some routes did not return their expected status; their timings were not recorded.')
+
+if __name__ == '__main__':
+    main()
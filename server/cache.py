@@ -0,0 +1,167 @@
+from collections import OrderedDict
+import threading
+import time
+
+
+class CacheEntry:
+    """A cached response body plus the bookkeeping the cache needs for it"""
+    __slots__ = ('value', 'tags', 'expires_at', 'size', 'hits')
+
+    def __init__(self, value, tags, expires_at):
+        self.value = value
+        self.tags = frozenset(tags)
+        self.expires_at = expires_at
+        self.size = len(value)
+        self.hits = 0
+
+
+class ResponseCache:
+    """Bounded in-process LRU cache for serialized responses.
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted once `max_entries` is reached. Each entry carries tags such as
+    'race:3' or 'season:2025' so writers can drop exactly the responses
+    their change affects. Any object with the same get/set/invalidate/stats
+    methods can be dropped in as a replacement backend.
+
+    Per-key miss counts are bounded the same way: at most `max_entries` of
+    them, dropped together with their entry or oldest first.
+    """
+
+    def __init__(self, max_entries=512, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._misses = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._misses[key] = self._misses.pop(key, 0) + 1
+                if len(self._misses) > self.max_entries:
+                    self._misses.popitem(last=False)
+                return None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.hits += 1
+            return entry.value
+
+    def set(self, key, value, tags=()):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = CacheEntry(value, tags, time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._misses.pop(evicted, None)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._misses.pop(key, None)
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_tags(self, tags):
+        """Drop every entry carrying at least one of the given tags"""
+        tags = set(tags)
+        if not tags:
+            return
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry.tags & tags]
+            for key in stale:
+                del self._entries[key]
+                self._misses.pop(key, None)
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._misses.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'bytes': sum(entry.size for entry in self._entries.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'keys': {
+                    key: {
+                        'hits': entry.hits,
+                        'misses': self._misses.get(key, 0),
+                        'bytes': entry.size,
+                        'tags': sorted(entry.tags)
+                    } for key, entry in self._entries.items()
+                }
+            }
+
+
+class UserCache:
+    """Per-process TTL cache of the fields a session user needs.
+
+    Each worker process has its own copy, so a change made through another
+    worker is picked up at the latest after `ttl` seconds; changes made in
+    this process invalidate the entry as soon as they commit.
+    """
+
+    def __init__(self, ttl=60, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] <= time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def set(self, user_id, value):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v[1] > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[user_id] = (value, time.monotonic() + self.ttl)
+
+    def invalidate(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,163 @@
+"""Check that reads keep flowing while a writer holds the SQLite write lock.
+
+    python check_concurrency.py [--hold 1.0] [--readers 4] [--database-url URL]
+
+Runs against a throwaway database. One thread opens a write transaction
+and sits on it; reader threads hit the read endpoints meanwhile, and a
+second writer goes through the API. With the tuned profile every read
+finishes without waiting for the lock and the second write waits for it
+instead of failing. Exits non-zero otherwise; SQLITE_PROFILE=default shows
+the rollback-journal behaviour, where every read queues behind the writer.
+
+It also has two transactions bump the same new data_version scope at
+once; both must commit. With --database-url (e.g. a scratch PostgreSQL
+database, whose contents are replaced) only this second check runs,
+as the write lock check is about SQLite.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+def check_new_scope_bumps(app, db, hold):
+    """Two transactions create the same data_version scope at once; return the failures"""
+    from app import DataVersion, bump_data_versions
+
+    scope = f'concurrency-check:{time.time_ns()}'
+    bumped = threading.Event()
+    errors = []
+
+    def bump(wait, delay):
+        try:
+            with app.app_context():
+                if wait:
+                    bumped.wait()
+                with db.engine.begin() as connection:
+                    bump_data_versions(connection, {scope})
+                    bumped.set()
+                    time.sleep(delay)
+        except Exception as e:
+            errors.append(f'bumping a new scope: {e}')
+            bumped.set()
+
+    threads = [threading.Thread(target=bump, args=(False, hold)), threading.Thread(target=bump, args=(True, 0))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with app.app_context():
+        version = db.session.get(DataVersion, scope)
+        version = version.version if version is not None else None
+        db.session.query(DataVersion).filter(DataVersion.scope == scope).delete()
+        db.session.commit()
+    print(f'concurrent bumps of a new scope: version {version}')
+    if not errors and version != 2:
+        errors.append(f'two bumps of a new scope left version {version}, expected 2')
+    return errors
+
+def check_concurrency(hold=1.0, readers=4):
+    """Run the checks against the configured (throwaway) database; return the failures.
+
+    The database is replaced with a synthetic history first.
+    """
+    from app import app, db, User, RaceResult
+    from synthetic_data import generate
+    from sqlalchemy import text
+
+    generate(3, 10)
+    with app.app_context():
+        sqlite = db.engine.dialect.name == 'sqlite'
+    if not sqlite:
+        return check_new_scope_bumps(app, db, hold)
+    with app.app_context():
+        admin = User(username='admin', is_admin=True)
+        admin.set_password('admin')
+        db.session.add(admin)
+        db.session.commit()
+        result_id = db.session.query(RaceResult.result_id).first()[0]
+        journal_mode = db.session.execute(text('PRAGMA journal_mode')).scalar()
+    print(f"profile: {app.config['SQLITE_PROFILE']}, journal_mode: {journal_mode}")
+
+    locked = threading.Event()
+    done = threading.Event()
+    reads, errors = [], []
+
+    def hold_write_lock():
+        with app.app_context():
+            with db.engine.connect() as connection:
+                # EXCLUSIVE is the lock every rollback-journal commit takes;
+                # in WAL mode it only excludes other writers
+                connection.exec_driver_sql('BEGIN EXCLUSIVE')
+                connection.execute(text("UPDATE race_result SET gap_to_leader = 'HELD' WHERE result_id = :id"),
+                                   {'id': result_id})
+                locked.set()
+                time.sleep(hold)
+                connection.commit()
+        done.set()
+
+    def read_while_locked():
+        client = app.test_client()
+        locked.wait()
+        while not done.is_set():
+            for route in ('/api/drivers/standings', '/api/race-results', '/api/races/1/report'):
+                app.extensions['response_cache'].clear()
+                started = time.perf_counter()
+                response = client.get(route)
+                elapsed = time.perf_counter() - started
+                if response.status_code != 200:
+                    errors.append(f'GET {route}: {response.status_code} {response.get_data(as_text=True)[:200]}')
+                elif not done.is_set():
+                    reads.append(elapsed)
+
+    write = {}
+    writer_client = app.test_client()
+    writer_client.post('/api/auth/login', json={'username': 'admin', 'password': 'admin'})
+
+    def second_writer():
+        locked.wait()
+        started = time.perf_counter()
+        response = writer_client.put(f'/api/race-results/{result_id}', json={'gap_to_leader': '+0.500'})
+        write['seconds'] = time.perf_counter() - started
+        write['status'] = response.status_code
+        write['finished_after_lock'] = done.is_set()
+        if response.status_code != 200:
+            errors.append(f'PUT: {response.status_code} {response.get_data(as_text=True)[:200]}')
+
+    threads = [threading.Thread(target=hold_write_lock), threading.Thread(target=second_writer)]
+    threads += [threading.Thread(target=read_while_locked) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    slowest = max(reads) if reads else None
+    print(f'reads during the write: {len(reads)}, slowest {slowest * 1000:.1f} ms' if reads else 'no reads completed')
+    print(f"second write: status {write.get('status')} after {write.get('seconds', 0):.2f} s")
+
+    failures = list(errors) + check_new_scope_bumps(app, db, hold)
+    if not reads:
+        failures.append('no read completed while the write lock was held')
+    elif slowest > hold / 2:
+        failures.append(f'a read took {slowest:.2f} s, it waited for the writer')
+    if write.get('status') == 200 and not write['finished_after_lock']:
+        failures.append('second write finished while the lock was still held')
+
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--hold', type=float, default=1.0, help='Seconds the first writer keeps its lock.')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--database-url', help='Run against this (throwaway!) database; its contents are replaced.')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'concurrency.db')}"
+    failures = check_concurrency(args.hold, args.readers)
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+from app import app, db, refresh_derived_data, encode_cursor, results_snapshot
+from sqlalchemy import event, text
+import re
+import sys
+
+# Keyset-paginated list endpoints: besides staying on indexes, a page must
+# not sort every matching row to find its first limit + 1
+PAGINATED_ROUTES = [
+    '/api/race-results',
+    '/api/race-results?season=2025&driver_id=1',
+    '/api/race-results?team_id=1&status=Finished',
+    '/api/race-results?cursor=' + encode_cursor(['2025-03-23', 2, 4, 11]),
+]
+
+# Read endpoints whose SQL must stay on indexes as history grows
+HOT_ROUTES = [
+    '/api/drivers/standings',
+    '/api/teams/standings',
+    '/api/dashboard',
+    '/api/season/statistics',
+    '/api/race-results/1',
+    '/api/races/1/report',
+    '/api/races/1/stints',
+    '/api/races/1/undercuts',
+    '/api/pit-stops/summary',
+    '/api/races/1/qualifying',
+    '/api/qualifying/head-to-head',
+    '/api/drivers/1/current-team',
+] + PAGINATED_ROUTES
+
+# Tables that grow with every race. Walking a whole index of one of these is
+# as bad as a table scan unless a LIMIT stops the walk early.
+HISTORY_TABLES = {'race', 'race_result'}
+
+def capture_statements(action):
+    """Run action() and return every (sql, params) it sends to the database"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            captured.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return captured
+
+def query_plan(statement, parameters):
+    """Return the EXPLAIN QUERY PLAN rows SQLite would use for a statement"""
+    with db.engine.connect() as conn:
+        return conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+
+def table_scans(statement, parameters):
+    """Return the EXPLAIN QUERY PLAN lines that read a whole table"""
+    plan = [row[-1] for row in query_plan(statement, parameters)]
+    # Scanning a CTE or subquery reads rows the query already narrowed down
+    derived = set(re.findall(r'(?:WITH|,)\s*(\w+)\s+AS\s*\(', statement, re.IGNORECASE))
+    # A LIMIT only stops an index walk early if no sort has to see every row first
+    bounded = re.search(r'\bLIMIT\b', statement, re.IGNORECASE) and not temp_sorts(plan)
+    scans = []
+    for line in plan:
+        if not line.startswith('SCAN') or line.startswith('SCAN ('):
+            continue
+        table = line.split()[1]
+        if table in derived:
+            continue
+        # "SCAN t USING [COVERING] INDEX ..." walks an index in order; that is
+        # fine for small tables, and for history tables only when bounded
+        if 'INDEX' not in line or (table in HISTORY_TABLES and not bounded):
+            scans.append(line)
+    return scans
+
+def temp_sorts(plan):
+    """Return the plan lines that sort the whole result before any row is returned"""
+    return [line for line in plan if line.startswith('USE TEMP B-TREE FOR ORDER BY')]
+
+def check_query_plans():
+    failures = []
+    client = app.test_client()
+
+    # Building the analytics snapshot is a deliberate full read that only
+    # happens after a write, so build it before watching per-request SQL
+    results_snapshot()
+    db.session.rollback()
+
+    for route in HOT_ROUTES:
+        statements = capture_statements(lambda: client.get(route))
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+                continue
+            for scan in table_scans(statement, parameters):
+                failures.append((route, scan, statement))
+            if route in PAGINATED_ROUTES:
+                plan = [row[-1] for row in query_plan(statement, parameters)]
+                for sort in temp_sorts(plan):
+                    failures.append((route, sort, statement))
+
+    # Write-path maintenance runs inside a transaction that is rolled back
+    def refresh():
+        with app.app_context():
+            refresh_derived_data(db.session.connection(), {1}, {1}, {1}, {1})
+            db.session.rollback()
+    for statement, parameters in capture_statements(refresh):
+        for scan in table_scans(statement, parameters):
+            failures.append(('refresh_derived_data', scan, statement))
+
+    return failures
+
+if __name__ == '__main__':
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            print("Query plans are only checked against SQLite.")
+            sys.exit(0)
+        failures = check_query_plans()
+    for source, scan, statement in failures:
+        print(f"{source}: {scan}\n    {' '.join(statement.split())}")
+    if failures:
+        print(f"{len(failures)} hot query plan(s) fall back to a table scan or a full sort.")
+        sys.exit(1)
+    print("All hot queries use indexes.")
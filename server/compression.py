@@ -0,0 +1,37 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is always available
+    brotli = None
+
+# Preferred first when the client accepts several equally
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/html', 'text/plain'}
+
+# Cached bodies too are compressed on the request that misses, which
+# follows every invalidation: brotli 11 or gzip 9 would cost that request
+# tens of milliseconds to save about a tenth of the bytes
+LEVELS = {'gzip': 6, 'br': 5}
+
+
+def negotiate(accept_encodings):
+    """Best encoding for a request's Accept-Encoding header, or None"""
+    return accept_encodings.best_match(ENCODINGS)
+
+
+def compress(body, encoding):
+    level = LEVELS[encoding]
+    if encoding == 'br':
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def encoded_etag(etag, encoding):
+    """Strong ETag of the encoded representation of a body"""
+    return f'{etag}-{encoding}'
+
+
+def etag_variants(etag):
+    return [etag] + [encoded_etag(etag, encoding) for encoding in ENCODINGS]
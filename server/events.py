@@ -0,0 +1,114 @@
+from collections import deque
+import json
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Sent instead of the events a slow client fell too far behind on; the
+# client should reload what it shows rather than apply further deltas
+RESYNC = b'event: resync\ndata: {}\n\n'
+HEARTBEAT = b': heartbeat\n\n'
+
+
+def format_event(name, data, dumps=json.dumps):
+    """Encode one Server-Sent Events message; dumps must not emit newlines"""
+    return f'event: {name}\ndata: {dumps(data)}\n\n'.encode('utf-8')
+
+
+class Subscription:
+    """One client's bounded queue of encoded messages"""
+    __slots__ = ('messages', 'overflowed')
+
+    def __init__(self, max_messages):
+        self.messages = deque(maxlen=max_messages)
+        self.overflowed = False
+
+
+class EventPublisher:
+    """Fans encoded events out from one publisher thread to many streaming clients.
+
+    publish() only hands the event to the publisher thread, so a committing
+    request never waits on the clients. That thread encodes each event once
+    and appends the same bytes to every client's bounded queue. Waiting
+    clients block on a single condition, so an idle stream costs no CPU
+    until the next event or heartbeat. A client whose queue fills up loses
+    its pending events and gets one RESYNC.
+    """
+
+    def __init__(self, max_messages=100, max_clients=200, dumps=json.dumps):
+        self.max_messages = max_messages
+        self.dumps = dumps
+        self.max_clients = max_clients
+        self._subscriptions = set()
+        self._condition = threading.Condition()
+        self._inbox = queue.SimpleQueue()
+        self._thread = None
+        self.published = 0
+        self.resyncs = 0
+
+    @property
+    def clients(self):
+        return len(self._subscriptions)
+
+    def subscribe(self):
+        """Register a client; returns None once max_clients are connected"""
+        with self._condition:
+            if len(self._subscriptions) >= self.max_clients:
+                return None
+            subscription = Subscription(self.max_messages)
+            self._subscriptions.add(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription):
+        with self._condition:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, name, data):
+        if not self._subscriptions:
+            return
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='event-publisher', daemon=True)
+                self._thread.start()
+        self._inbox.put((name, data))
+
+    def _run(self):
+        while True:
+            name, data = self._inbox.get()
+            try:
+                message = format_event(name, data, self.dumps)
+            except Exception as e:
+                logger.warning("Dropping unencodable %s event: %s", name, e)
+                continue
+            self._fan_out(message)
+
+    def _fan_out(self, message):
+        with self._condition:
+            for subscription in self._subscriptions:
+                if len(subscription.messages) == self.max_messages:
+                    subscription.messages.clear()
+                    subscription.overflowed = True
+                subscription.messages.append(message)
+            self.published += 1
+            self._condition.notify_all()
+
+    def wait(self, subscription, timeout):
+        """Return the client's pending messages, or [HEARTBEAT] after `timeout` seconds"""
+        with self._condition:
+            if not subscription.messages:
+                self._condition.wait(timeout)
+            if not subscription.messages:
+                return [HEARTBEAT]
+            messages = list(subscription.messages)
+            subscription.messages.clear()
+            if subscription.overflowed:
+                # The queue was cleared on overflow; what is left came after it
+                subscription.overflowed = False
+                self.resyncs += 1
+                messages.insert(0, RESYNC)
+            return messages
+
+    def stats(self):
+        return {'clients': self.clients, 'published': self.published, 'resyncs': self.resyncs}
@@ -1,5 +1,8 @@
-from app import app, db, Driver, Team, Circuit, Race, RaceResult, Car, DriverTeamContract
+from app import (app, db, Driver, Team, Circuit, Race, RaceResult, Car, DriverTeamContract, SprintResult, PitStop,
+                 install_scoring_systems, bump_data_versions)
 from datetime import datetime, date
+from load_history import load_history
+import sys
 
 def init_db():
     with app.app_context():
@@ -265,6 +268,25 @@ def init_db():
         db.session.add_all(races)
         db.session.commit()
 
+        # Scoring systems and the Chinese GP sprint go in first, so the race
+        # results below are scored by the rules as they are written
+        install_scoring_systems(db.session.connection())
+        sprint_results = [
+            SprintResult(race_id=2, driver_id=driver_id, finish_position=position, status='Finished')
+            for position, driver_id in (
+                (1, 5),   # Hamilton
+                (2, 8),   # Piastri
+                (3, 1),   # Verstappen
+                (4, 3),   # Russell
+                (5, 6),   # Leclerc
+                (7, 4),   # Antonelli
+                (8, 7),   # Norris
+                (14, 2)   # Lawson
+            )
+        ]
+        db.session.add_all(sprint_results)
+        db.session.commit()
+
         # Add Race Results (2025 season results)
         results = [
             # Australian GP Results
@@ -444,7 +466,7 @@ def init_db():
                 car_id=3,
                 grid_position=6,
                 finish_position=None,
-                points_earned=4.0,  # No points for DSQ
+                points_earned=4.0,  # Sprint points only; the DSQ race scores nothing
                 laps_completed=56,
                 status='DSQ',
                 gap_to_leader='DSQ'
@@ -465,6 +487,36 @@ def init_db():
         db.session.add_all(results)
         db.session.commit()
 
+        # Add Pit Stops (race_id, driver_id, stop_number, lap, pit lane seconds, tyre fitted)
+        pit_stops = [
+            # Australian GP: the field switched to intermediates when the rain returned
+            (1, 7, 1, 34, 21.9, 'INTERMEDIATE'),  # Norris
+            (1, 8, 1, 34, 22.6, 'INTERMEDIATE'),  # Piastri
+            (1, 8, 2, 44, 22.3, 'INTERMEDIATE'),  # Piastri, after going off
+            (1, 1, 1, 34, 22.1, 'INTERMEDIATE'),  # Verstappen
+            (1, 2, 1, 34, 22.8, 'INTERMEDIATE'),  # Lawson
+            (1, 3, 1, 34, 22.4, 'INTERMEDIATE'),  # Russell
+            (1, 4, 1, 35, 23.0, 'INTERMEDIATE'),  # Antonelli
+            (1, 5, 1, 43, 22.9, 'INTERMEDIATE'),  # Hamilton
+            (1, 6, 1, 43, 23.4, 'INTERMEDIATE'),  # Leclerc
+            # Chinese GP: mostly one stop onto hards
+            (2, 8, 1, 13, 21.6, 'HARD'),  # Piastri
+            (2, 7, 1, 14, 21.8, 'HARD'),  # Norris
+            (2, 3, 1, 13, 22.0, 'HARD'),  # Russell
+            (2, 1, 1, 19, 22.3, 'HARD'),  # Verstappen
+            (2, 4, 1, 18, 22.5, 'HARD'),  # Antonelli
+            (2, 6, 1, 15, 22.4, 'HARD'),  # Leclerc
+            (2, 5, 1, 13, 22.9, 'HARD'),  # Hamilton
+            (2, 2, 1, 9, 23.1, 'HARD'),  # Lawson
+            (2, 2, 2, 30, 22.8, 'MEDIUM')  # Lawson
+        ]
+        db.session.add_all([
+            PitStop(race_id=race_id, driver_id=driver_id, stop_number=stop_number, lap_number=lap,
+                    stop_time=stop_time, tire_compound=compound)
+            for race_id, driver_id, stop_number, lap, stop_time, compound in pit_stops
+        ])
+        db.session.commit()
+
         # Add Driver Team Contracts (2025 season)
         contracts = [
             DriverTeamContract(
@@ -525,8 +577,15 @@ def init_db():
             )
         ]
         db.session.add_all(contracts)
+        # Everything the seed wrote, including the teams, drivers and races
+        bump_data_versions(db.session.connection(), {'results', 'races', 'drivers', 'teams'})
         db.session.commit()
 
 if __name__ == '__main__':
-    init_db()
+    if len(sys.argv) > 1:
+        # Load real history from an Ergast CSV archive instead of the demo seed
+        counts = load_history(sys.argv[1])
+        print(', '.join(f"{key}: {value}" for key, value in counts.items()))
+    else:
+        init_db()
     print("Database initialized successfully!") 
\ No newline at end of file
@@ -0,0 +1,254 @@
+from app import (app, db, Driver, Team, Circuit, Race, RaceResult, Car, Qualifying, PitStop, SprintResult,
+                 refresh_derived_data, bump_data_versions, install_scoring_systems)
+from sqlalchemy import insert, text
+from datetime import date
+import csv
+import os
+import sys
+import time
+
+# Rows per executemany; keeps memory flat while streaming the larger files
+BATCH_SIZE = 5000
+
+# Ergast status labels that map onto our Finished/DNF/DSQ/DNS vocabulary
+DSQ_STATUSES = {'Disqualified', 'Excluded'}
+DNS_STATUSES = {'Did not start', 'Did not qualify', 'Did not prequalify', 'Withdrew', 'Not classified'}
+
+def read_csv(data_dir, name, required=True):
+    """Yield rows of an Ergast CSV file as dicts, with \\N turned into None"""
+    path = os.path.join(data_dir, name)
+    if not os.path.exists(path):
+        if required:
+            raise FileNotFoundError(f"Missing {name} in {data_dir}")
+        return
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield {key: (None if value in ('\\N', '') else value) for key, value in row.items()}
+
+def to_int(value):
+    return int(value) if value is not None else None
+
+def to_float(value):
+    return float(value) if value is not None else None
+
+def lap_time_seconds(value):
+    """Convert an Ergast lap time such as '1:26.572' to seconds"""
+    if value is None:
+        return None
+    minutes, _, seconds = value.rpartition(':')
+    return int(minutes or 0) * 60 + float(seconds)
+
+def classify_status(status):
+    if status is None:
+        return 'DNF'
+    if status == 'Finished' or status.startswith('+'):
+        return 'Finished'
+    if status in DSQ_STATUSES:
+        return 'DSQ'
+    if status in DNS_STATUSES:
+        return 'DNS'
+    return 'DNF'
+
+def insert_batches(connection, table, rows):
+    """Insert rows with one executemany per BATCH_SIZE rows; returns the count"""
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            connection.execute(insert(table), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        connection.execute(insert(table), batch)
+        total += len(batch)
+    return total
+
+def reset_sequences(connection):
+    """Move PostgreSQL id sequences past ids that were inserted explicitly"""
+    if connection.dialect.name != 'postgresql':
+        return
+    quote = connection.dialect.identifier_preparer.quote
+    for table in db.metadata.sorted_tables:
+        if len(table.primary_key.columns) != 1:
+            continue
+        column = next(iter(table.primary_key.columns))
+        sequence = connection.execute(
+            text("SELECT pg_get_serial_sequence(:table, :column)"),
+            {'table': quote(table.name), 'column': column.name}
+        ).scalar()
+        if sequence:
+            connection.execute(text(
+                f"SELECT setval(:sequence, COALESCE(MAX({quote(column.name)}), 0) + 1, false) FROM {quote(table.name)}"
+            ), {'sequence': sequence})
+
+def circuit_rows(data_dir):
+    for row in read_csv(data_dir, 'circuits.csv'):
+        yield {
+            'circuit_id': int(row['circuitId']),
+            'name': row['name'],
+            'location': row['location'] or 'Unknown',
+            'country': row['country'] or 'Unknown',
+            'length_km': 0.0  # not part of the Ergast archive
+        }
+
+def race_rows(data_dir):
+    for row in read_csv(data_dir, 'races.csv'):
+        yield {
+            'race_id': int(row['raceId']),
+            'season': int(row['year']),
+            'round_number': int(row['round']),
+            'grand_prix_name': row['name'],
+            'circuit_id': int(row['circuitId']),
+            'date': date.fromisoformat(row['date'])
+        }
+
+def driver_rows(data_dir):
+    rows = list(read_csv(data_dir, 'drivers.csv'))
+    # Numbers and codes are unique in our schema but were reused over the
+    # decades; the most recent driver keeps them
+    taken_numbers, taken_codes = set(), set()
+    for row in sorted(rows, key=lambda r: int(r['driverId']), reverse=True):
+        number = to_int(row['number'])
+        code = row['code']
+        row['number'] = number if number not in taken_numbers else None
+        row['code'] = code if code not in taken_codes else None
+        taken_numbers.add(number)
+        taken_codes.add(code)
+    for row in rows:
+        yield {
+            'driver_id': int(row['driverId']),
+            'name': f"{row['forename']} {row['surname']}",
+            'nationality': row['nationality'] or 'Unknown',
+            'date_of_birth': date.fromisoformat(row['dob']) if row['dob'] else date(1900, 1, 1),
+            'number': row['number'],
+            'code': row['code'],
+            'active_status': False
+        }
+
+def team_rows(data_dir):
+    for row in read_csv(data_dir, 'constructors.csv'):
+        yield {
+            'team_id': int(row['constructorId']),
+            'name': row['name'],
+            'nationality': row['nationality'] or 'Unknown'
+        }
+
+def result_rows(data_dir, statuses, cars, race_seasons, sprint_points):
+    for row in read_csv(data_dir, 'results.csv'):
+        race_id = int(row['raceId'])
+        team_id = int(row['constructorId'])
+        position = to_int(row['position'])
+        grid = to_int(row['grid'])
+        if position == 1:
+            gap = 'WINNER'
+        else:
+            gap = row['time'] or statuses.get(to_int(row['statusId']))
+        yield {
+            'result_id': int(row['resultId']),
+            'race_id': race_id,
+            'driver_id': int(row['driverId']),
+            'team_id': team_id,
+            'car_id': cars[(team_id, race_seasons[race_id])],
+            'grid_position': grid or None,  # 0 means a pit lane start
+            'finish_position': position,
+            # Sprint points count towards the weekend's race result here
+            'points_earned': (to_float(row['points']) or 0.0) + sprint_points.get((race_id, int(row['driverId'])), 0.0),
+            'laps_completed': to_int(row['laps']),
+            'status': classify_status(statuses.get(to_int(row['statusId']))),
+            'gap_to_leader': gap[:20] if gap else None,
+            'fastest_lap': row.get('rank') == '1'
+        }
+
+def sprint_rows(data_dir, statuses):
+    for row in read_csv(data_dir, 'sprint_results.csv', required=False):
+        yield {
+            'race_id': int(row['raceId']),
+            'driver_id': int(row['driverId']),
+            'finish_position': to_int(row['position']),
+            'status': classify_status(statuses.get(to_int(row['statusId']))),
+            'points': to_float(row['points']) or 0.0
+        }
+
+def qualifying_rows(data_dir):
+    for row in read_csv(data_dir, 'qualifying.csv', required=False):
+        yield {
+            'qualifying_id': int(row['qualifyId']),
+            'race_id': int(row['raceId']),
+            'driver_id': int(row['driverId']),
+            'q1_time': lap_time_seconds(row['q1']),
+            'q2_time': lap_time_seconds(row['q2']),
+            'q3_time': lap_time_seconds(row['q3']),
+            'final_position': to_int(row['position'])
+        }
+
+def pit_stop_rows(data_dir):
+    for row in read_csv(data_dir, 'pit_stops.csv', required=False):
+        milliseconds = to_int(row['milliseconds'])
+        yield {
+            'race_id': int(row['raceId']),
+            'driver_id': int(row['driverId']),
+            'stop_number': int(row['stop']),
+            'lap_number': int(row['lap']),
+            'stop_time': milliseconds / 1000.0 if milliseconds is not None else to_float(row['duration'])
+        }
+
+def load_history(data_dir):
+    """Replace the database contents with an Ergast-format CSV archive.
+
+    Everything is written with Core executemany inserts on one connection,
+    so no ORM objects are built and no per-row session hooks run; standings
+    and the denormalized counters are recomputed once at the end.
+    """
+    started = time.perf_counter()
+    counts = {}
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        statuses = {int(r['statusId']): r['status'] for r in read_csv(data_dir, 'status.csv', required=False)}
+
+        with db.engine.begin() as connection:
+            counts['circuits'] = insert_batches(connection, Circuit.__table__, circuit_rows(data_dir))
+            races = list(race_rows(data_dir))
+            counts['races'] = insert_batches(connection, Race.__table__, races)
+            counts['drivers'] = insert_batches(connection, Driver.__table__, driver_rows(data_dir))
+            counts['teams'] = insert_batches(connection, Team.__table__, team_rows(data_dir))
+
+            # The archive has no cars, so each constructor gets one per season
+            race_seasons = {race['race_id']: race['season'] for race in races}
+            entries = sorted({
+                (int(r['constructorId']), race_seasons[int(r['raceId'])])
+                for r in read_csv(data_dir, 'results.csv')
+            })
+            cars = {entry: car_id for car_id, entry in enumerate(entries, start=1)}
+            counts['cars'] = insert_batches(connection, Car.__table__, (
+                {'car_id': car_id, 'team_id': team_id, 'season': season}
+                for (team_id, season), car_id in cars.items()
+            ))
+
+            sprints = list(sprint_rows(data_dir, statuses))
+            sprint_points = {(r['race_id'], r['driver_id']): r.pop('points') for r in sprints}
+            counts['sprints'] = insert_batches(connection, SprintResult.__table__, sprints)
+            counts['results'] = insert_batches(
+                connection, RaceResult.__table__, result_rows(data_dir, statuses, cars, race_seasons, sprint_points)
+            )
+            counts['qualifying'] = insert_batches(connection, Qualifying.__table__, qualifying_rows(data_dir))
+            counts['pit_stops'] = insert_batches(connection, PitStop.__table__, pit_stop_rows(data_dir))
+
+            reset_sequences(connection)
+            # Installed for `flask recompute-points`; the archive's own points
+            # are kept, as they include shared drives and half-points races
+            install_scoring_systems(connection)
+            refresh_derived_data(connection)
+            bump_data_versions(connection, {'results', 'races', 'drivers', 'teams'})
+
+    counts['seconds'] = round(time.perf_counter() - started, 2)
+    return counts
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python load_history.py <ergast-csv-directory>")
+        sys.exit(1)
+    counts = load_history(sys.argv[1])
+    print(', '.join(f"{key}: {value}" for key, value in counts.items()))
@@ -0,0 +1,43 @@
+"""Add indexes for the hot read and standings queries
+
+Revision ID: 3c7d2a91f0b4
+Revises: e95a478e15cf
+Create Date: 2026-10-18 10:12:44.381920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c7d2a91f0b4'
+down_revision = 'e95a478e15cf'
+branch_labels = None
+depends_on = None
+
+
+# Databases built by db.create_all() already have these, hence if_not_exists
+INDEXES = [
+    ('ix_race_season_date', 'race', ['season', 'date']),
+    ('ix_race_date_id', 'race', ['date', 'race_id']),
+    ('ix_race_result_race_position', 'race_result', ['race_id', 'finish_position']),
+    ('ix_race_result_driver_totals', 'race_result',
+     ['driver_id', 'race_id', 'points_earned', 'finish_position', 'grid_position']),
+    ('ix_race_result_team_totals', 'race_result',
+     ['team_id', 'race_id', 'points_earned', 'finish_position', 'grid_position']),
+    ('ix_race_result_car_id', 'race_result', ['car_id']),
+    ('ix_car_team_season', 'car', ['team_id', 'season']),
+    ('ix_driver_team_contract_driver_status', 'driver_team_contract', ['driver_id', 'status']),
+    ('ix_driver_standing_season_points', 'driver_standing', ['season', 'points']),
+    ('ix_team_standing_season_points', 'team_standing', ['season', 'points']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
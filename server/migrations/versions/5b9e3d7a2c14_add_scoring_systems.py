@@ -0,0 +1,75 @@
+"""Add scoring systems, sprint results and the fastest lap flag
+
+Revision ID: 5b9e3d7a2c14
+Revises: 8f41b6c2d913
+Create Date: 2026-10-18 16:41:08.203517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e3d7a2c14'
+down_revision = '8f41b6c2d913'
+branch_labels = None
+depends_on = None
+
+
+# The app's create_all() at import may already have made the new tables
+def upgrade():
+    op.create_table(
+        'scoring_system',
+        sa.Column('scoring_system_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('fastest_lap_points', sa.Float(), nullable=False),
+        sa.Column('fastest_lap_max_position', sa.Integer(), nullable=True),
+        sa.Column('dsq_scores_zero', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('scoring_system_id'),
+        sa.UniqueConstraint('name'),
+        if_not_exists=True
+    )
+    op.create_table(
+        'scoring_position',
+        sa.Column('scoring_system_id', sa.Integer(), nullable=False),
+        sa.Column('session', sa.String(length=10), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('points', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['scoring_system_id'], ['scoring_system.scoring_system_id']),
+        sa.PrimaryKeyConstraint('scoring_system_id', 'session', 'position'),
+        if_not_exists=True
+    )
+    op.create_table(
+        'season_scoring',
+        sa.Column('first_season', sa.Integer(), nullable=False),
+        sa.Column('last_season', sa.Integer(), nullable=True),
+        sa.Column('scoring_system_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['scoring_system_id'], ['scoring_system.scoring_system_id']),
+        sa.PrimaryKeyConstraint('first_season'),
+        if_not_exists=True
+    )
+    op.create_table(
+        'sprint_result',
+        sa.Column('race_id', sa.Integer(), nullable=False),
+        sa.Column('driver_id', sa.Integer(), nullable=False),
+        sa.Column('finish_position', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(['driver_id'], ['driver.driver_id']),
+        sa.ForeignKeyConstraint(['race_id'], ['race.race_id']),
+        sa.PrimaryKeyConstraint('race_id', 'driver_id'),
+        if_not_exists=True
+    )
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('race_result')}
+    if 'fastest_lap' in columns:
+        return
+    with op.batch_alter_table('race_result', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('fastest_lap', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('race_result', schema=None) as batch_op:
+        batch_op.drop_column('fastest_lap')
+    op.drop_table('sprint_result', if_exists=True)
+    op.drop_table('season_scoring', if_exists=True)
+    op.drop_table('scoring_position', if_exists=True)
+    op.drop_table('scoring_system', if_exists=True)
@@ -0,0 +1,43 @@
+"""Add stored reports for finalized races
+
+Revision ID: 8f41b6c2d913
+Revises: 3c7d2a91f0b4
+Create Date: 2026-10-18 14:02:17.550213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f41b6c2d913'
+down_revision = '3c7d2a91f0b4'
+branch_labels = None
+depends_on = None
+
+
+# Databases built by db.create_all() already have these, hence if_not_exists
+INDEXES = [
+    ('ix_qualifying_race_position', 'qualifying', ['race_id', 'final_position']),
+    ('ix_pit_stop_race_driver_stop', 'pit_stop', ['race_id', 'driver_id', 'stop_number']),
+]
+
+
+def upgrade():
+    op.create_table(
+        'race_report',
+        sa.Column('race_id', sa.Integer(), nullable=False),
+        sa.Column('report', sa.Text(), nullable=False),
+        sa.Column('finalized_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['race_id'], ['race.race_id']),
+        sa.PrimaryKeyConstraint('race_id'),
+        if_not_exists=True
+    )
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table('race_report', if_exists=True)
@@ -0,0 +1,56 @@
+"""Add the precomputed qualifying session and summary tables
+
+Revision ID: a6c4e8f1d205
+Revises: 5b9e3d7a2c14
+Create Date: 2026-10-18 19:02:37.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c4e8f1d205'
+down_revision = '5b9e3d7a2c14'
+branch_labels = None
+depends_on = None
+
+
+# The app's create_all() at import may already have made the new tables;
+# fill them for existing qualifying data with `flask rebuild-standings`
+def upgrade():
+    op.create_table(
+        'qualifying_session',
+        sa.Column('race_id', sa.Integer(), nullable=False),
+        sa.Column('pole_driver_id', sa.Integer(), nullable=False),
+        sa.Column('pole_team_id', sa.Integer(), nullable=True),
+        sa.Column('pole_time', sa.Float(), nullable=True),
+        sa.Column('entries', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['pole_driver_id'], ['driver.driver_id']),
+        sa.ForeignKeyConstraint(['pole_team_id'], ['team.team_id']),
+        sa.ForeignKeyConstraint(['race_id'], ['race.race_id']),
+        sa.PrimaryKeyConstraint('race_id'),
+        if_not_exists=True
+    )
+    op.create_table(
+        'qualifying_summary',
+        sa.Column('race_id', sa.Integer(), nullable=False),
+        sa.Column('driver_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.Column('position', sa.Integer(), nullable=True),
+        sa.Column('best_time', sa.Float(), nullable=True),
+        sa.Column('gap_to_pole', sa.Float(), nullable=True),
+        sa.Column('teammate_id', sa.Integer(), nullable=True),
+        sa.Column('ahead_of_teammate', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['driver_id'], ['driver.driver_id']),
+        sa.ForeignKeyConstraint(['race_id'], ['race.race_id']),
+        sa.ForeignKeyConstraint(['team_id'], ['team.team_id']),
+        sa.ForeignKeyConstraint(['teammate_id'], ['driver.driver_id']),
+        sa.PrimaryKeyConstraint('race_id', 'driver_id'),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_table('qualifying_summary', if_exists=True)
+    op.drop_table('qualifying_session', if_exists=True)
@@ -0,0 +1,40 @@
+"""Give existing databases a data epoch for their ETags
+
+Revision ID: d2b7f90c4e31
+Revises: a6c4e8f1d205
+Create Date: 2026-10-18 21:14:52.630417
+
+"""
+from datetime import datetime, timezone
+import secrets
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b7f90c4e31'
+down_revision = 'a6c4e8f1d205'
+branch_labels = None
+depends_on = None
+
+
+# New databases get their epoch when data_version is created; this covers
+# the ones created before the epoch existed
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('data_version'):
+        return
+    data_version = sa.table(
+        'data_version', sa.column('scope', sa.String), sa.column('version', sa.Integer),
+        sa.column('updated_at', sa.DateTime)
+    )
+    exists = bind.execute(sa.select(data_version.c.scope).where(data_version.c.scope == 'epoch')).first()
+    if exists is None:
+        op.execute(data_version.insert().values(
+            scope='epoch', version=secrets.randbelow(2 ** 31 - 1) + 1, updated_at=datetime.now(timezone.utc)
+        ))
+
+
+def downgrade():
+    pass
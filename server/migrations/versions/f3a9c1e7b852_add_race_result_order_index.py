@@ -0,0 +1,27 @@
+"""Add the results list ordering index
+
+Revision ID: f3a9c1e7b852
+Revises: d2b7f90c4e31
+Create Date: 2026-10-18 16:05:12.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c1e7b852'
+down_revision = 'd2b7f90c4e31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Must match RESULT_ORDER_POSITION in app.py, or the planner ignores it
+    op.create_index('ix_race_result_race_order', 'race_result',
+                    ['race_id', sa.text('coalesce(finish_position, 1000000)'), 'result_id'],
+                    unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_race_result_race_order', table_name='race_result', if_exists=True)
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import threading
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash operations are already queued"""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a small thread pool with a cap on queued work.
+
+    bcrypt releases the GIL while it hashes, so at most `workers` cores are
+    ever busy with passwords and the remaining request threads keep serving
+    reads. Once `max_pending` operations are running or queued, further
+    calls fail immediately with PasswordHasherBusy rather than piling up.
+    """
+
+    def __init__(self, bcrypt, rounds=12, workers=2, max_pending=8, timeout=10):
+        self.bcrypt = bcrypt
+        self.rounds = rounds
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hasher')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.rejected = 0
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise PasswordHasherBusy('Too many password checks in progress')
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise PasswordHasherBusy('Password check timed out')
+
+    def hash(self, password):
+        return self._run(self.bcrypt.generate_password_hash, password, self.rounds).decode('utf-8')
+
+    def check(self, password_hash, password):
+        return self._run(self.bcrypt.check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True if the hash was made with a different cost than the configured one"""
+        try:
+            return int(password_hash.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
@@ -0,0 +1,33 @@
+"""World Championship points systems, by season range.
+
+`race` and `sprint` list the points for 1st, 2nd, ... place. The fastest lap
+bonus goes to the driver credited with the fastest lap, and only if they
+finish within `fastest_lap_max_position` when that is set. Dropped scores,
+shared drives and half-points races are not modelled.
+"""
+
+SCORING_SYSTEMS = [
+    {'name': '1950-1959', 'first_season': 1950, 'last_season': 1959,
+     'race': [8, 6, 4, 3, 2], 'fastest_lap_points': 1},
+    {'name': '1960', 'first_season': 1960, 'last_season': 1960,
+     'race': [8, 6, 4, 3, 2, 1]},
+    {'name': '1961-1990', 'first_season': 1961, 'last_season': 1990,
+     'race': [9, 6, 4, 3, 2, 1]},
+    {'name': '1991-2002', 'first_season': 1991, 'last_season': 2002,
+     'race': [10, 6, 4, 3, 2, 1]},
+    {'name': '2003-2009', 'first_season': 2003, 'last_season': 2009,
+     'race': [10, 8, 6, 5, 4, 3, 2, 1]},
+    {'name': '2010-2018', 'first_season': 2010, 'last_season': 2018,
+     'race': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]},
+    {'name': '2019-2020', 'first_season': 2019, 'last_season': 2020,
+     'race': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1], 'fastest_lap_points': 1, 'fastest_lap_max_position': 10},
+    {'name': '2021', 'first_season': 2021, 'last_season': 2021,
+     'race': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1], 'fastest_lap_points': 1, 'fastest_lap_max_position': 10,
+     'sprint': [3, 2, 1]},
+    {'name': '2022-2024', 'first_season': 2022, 'last_season': 2024,
+     'race': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1], 'fastest_lap_points': 1, 'fastest_lap_max_position': 10,
+     'sprint': [8, 7, 6, 5, 4, 3, 2, 1]},
+    # Open-ended: applies to every later season until a new system is added
+    {'name': '2025-', 'first_season': 2025, 'last_season': None,
+     'race': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1], 'sprint': [8, 7, 6, 5, 4, 3, 2, 1]},
+]
@@ -0,0 +1,103 @@
+from operator import itemgetter
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib provider is used instead
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Keeps the stock provider's output conventions (sorted keys, RFC 822
+    dates, compact unless debugging) but encodes straight to UTF-8 bytes,
+    several times faster than the json module on large lists.
+    """
+
+    def _options(self, indent=False):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        option = self._options(indent=bool(kwargs.get('indent')))
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+
+JSON_PROVIDERS = {
+    'stdlib': DefaultJSONProvider,
+    'orjson': OrjsonProvider,
+}
+
+def json_provider(app):
+    """Instantiate the provider named by JSON_PROVIDER ('auto', 'orjson' or 'stdlib')"""
+    name = app.config.get('JSON_PROVIDER', 'auto')
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'stdlib'
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson is not installed")
+    return JSON_PROVIDERS[name](app)
+
+def row_encoder(columns, fields):
+    """Build a function that turns a result row into a dict.
+
+    `columns` are the row's column names in select order. `fields` maps each
+    output key to a column name, to a (function, column, ...) tuple whose
+    return value is used instead, or to a nested dict of the same form.
+    Plain columns are read with a single itemgetter over row positions, so
+    there are no attribute lookups per row; computed and nested fields follow
+    them in the dict.
+    """
+    position = {name: i for i, name in enumerate(columns)}
+    keys, positions, computed = [], [], []
+    for key, spec in fields.items():
+        if isinstance(spec, str):
+            keys.append(key)
+            positions.append(position[spec])
+        elif isinstance(spec, dict):
+            computed.append((key, row_encoder(columns, spec)))
+        else:
+            function, *names = spec
+            computed.append((key, _apply(function, [position[name] for name in names])))
+
+    if not positions:
+        plain = lambda row: {}
+    elif len(positions) == 1:
+        get, key = itemgetter(positions[0]), keys[0]
+        plain = lambda row: {key: get(row)}
+    else:
+        get, keys = itemgetter(*positions), tuple(keys)
+        plain = lambda row: dict(zip(keys, get(row)))
+    if not computed:
+        return plain
+
+    def encode(row):
+        encoded = plain(row)
+        for key, value in computed:
+            encoded[key] = value(row)
+        return encoded
+    return encode
+
+def _apply(function, positions):
+    """function called with the values at `positions` of a row"""
+    if len(positions) == 1:
+        get = itemgetter(positions[0])
+        return lambda row: function(get(row))
+    get = itemgetter(*positions)
+    return lambda row: function(*get(row))
@@ -0,0 +1,176 @@
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+from analytics import MISSING
+
+# Sampled position for a race the driver did not finish; sorts after any
+# real position, so every simulated race is a permutation of the field
+NOT_CLASSIFIED = 10000
+
+
+def championship_field(snapshot, season, form_races=10):
+    """Everything a season simulation needs, taken from a ResultsSnapshot.
+
+    The field is every driver with a result in the season, scored from their
+    last `form_races` results across all seasons: each row of `form` holds
+    finishing positions (NOT_CLASSIFIED for retirements, DSQs and DNSs),
+    padded past `form_count`. Drivers race for the team of their latest
+    result that season. Returns None if the season has no results yet.
+    """
+    in_season = snapshot.season == season
+    if not in_season.any():
+        return None
+    driver_ids = np.unique(snapshot.driver_id[in_season])
+    team_by_driver = {}
+    for driver_id, team_id in zip(snapshot.driver_id[in_season], snapshot.team_id[in_season]):
+        team_by_driver[int(driver_id)] = int(team_id)  # rows are in date order, so the last one wins
+    team_ids = np.unique(snapshot.team_id[in_season])
+
+    classified = (snapshot.finish_position != MISSING) & ~snapshot.status_mask('DSQ')
+    positions = np.where(classified, snapshot.finish_position, NOT_CLASSIFIED)
+    # Only results up to the end of this season count as form
+    history = snapshot.season <= season
+    form = np.full((len(driver_ids), form_races), NOT_CLASSIFIED, dtype=np.int32)
+    form_count = np.zeros(len(driver_ids), dtype=np.int32)
+    for i, driver_id in enumerate(driver_ids):
+        recent = positions[history & (snapshot.driver_id == driver_id)][-form_races:]
+        form[i, :len(recent)] = recent
+        form_count[i] = len(recent)
+
+    driver_index = np.searchsorted(driver_ids, snapshot.driver_id[in_season])
+    team_index = np.searchsorted(team_ids, snapshot.team_id[in_season])
+    won = (snapshot.finish_position[in_season] == 1) & snapshot.status_mask('Finished')[in_season]
+    points = snapshot.points[in_season]
+
+    completed = len(np.unique(snapshot.race_id[in_season]))
+    scheduled = int(np.count_nonzero(snapshot.race_seasons == season))
+    return {
+        'season': season,
+        'driver_ids': driver_ids,
+        'team_ids': team_ids,
+        'driver_team': np.searchsorted(team_ids, [team_by_driver[int(d)] for d in driver_ids]),
+        'form': form,
+        'form_count': form_count,
+        'driver_points': np.bincount(driver_index, weights=points, minlength=len(driver_ids)),
+        'driver_wins': np.bincount(driver_index, weights=won, minlength=len(driver_ids)),
+        'team_points': np.bincount(team_index, weights=points, minlength=len(team_ids)),
+        'team_wins': np.bincount(team_index, weights=won, minlength=len(team_ids)),
+        'completed_rounds': completed,
+        'remaining_rounds': max(scheduled - completed, 0)
+    }
+
+
+def simulate_chunk(field, points_table, rounds, runs, seed_sequence):
+    """Simulate `runs` completions of a season; returns per-driver and per-team sums.
+
+    Each driver's finishing position in every remaining round is drawn from
+    their recent form, ties and collisions are broken by a random jitter and
+    the field is re-ranked, so each simulated race is a valid classification.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    form, form_count = field['form'], field['form_count']
+    drivers = len(form)
+    teams = len(field['team_ids'])
+
+    # Points by classified position, 0 beyond the end of the table
+    award = np.zeros(drivers + 1)
+    table = np.asarray(points_table[:drivers], dtype=np.float64)
+    award[1:len(table) + 1] = table
+
+    season_points = np.zeros((runs, drivers))
+    season_wins = np.zeros((runs, drivers))
+    if rounds and drivers:
+        pick = (rng.random((runs, rounds, drivers)) * np.maximum(form_count, 1)).astype(np.intp)
+        sampled = form[np.arange(drivers), pick]
+        order = np.argsort(sampled + rng.random(sampled.shape), axis=2)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(1, drivers + 1), axis=2)
+        finished = (sampled != NOT_CLASSIFIED) & (form_count > 0)
+        season_points = np.where(finished, award[rank], 0.0).sum(axis=1)
+        season_wins = (finished & (rank == 1)).sum(axis=1)
+
+    driver_points = field['driver_points'] + season_points
+    driver_wins = field['driver_wins'] + season_wins
+    membership = np.zeros((drivers, teams))
+    membership[np.arange(drivers), field['driver_team']] = 1.0
+    team_points = field['team_points'] + season_points @ membership
+    team_wins = field['team_wins'] + season_wins @ membership
+
+    # Level on points goes to the one with more wins, as in the sporting code
+    driver_champion = np.argmax(driver_points + driver_wins * 1e-4, axis=1)
+    team_champion = np.argmax(team_points + team_wins * 1e-4, axis=1)
+    return {
+        'driver_titles': np.bincount(driver_champion, minlength=drivers),
+        'team_titles': np.bincount(team_champion, minlength=teams),
+        'driver_points': driver_points.sum(axis=0),
+        'team_points': team_points.sum(axis=0)
+    }
+
+
+class ChampionshipSimulator:
+    """Runs season simulations in fixed-size chunks across a process pool.
+
+    Every chunk gets its own child of the seed's SeedSequence, so a seed
+    gives the same result whatever the number of workers. The pool is
+    started on first use and reused by later requests.
+    """
+
+    def __init__(self, workers=1, chunk_size=5000):
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def run(self, field, points_table, rounds, runs, seed=0):
+        sizes = [self.chunk_size] * (runs // self.chunk_size)
+        if runs % self.chunk_size:
+            sizes.append(runs % self.chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = [(field, points_table, rounds, size, seed_sequence) for size, seed_sequence in zip(sizes, seeds)]
+        if self.workers > 1 and len(args) > 1:
+            chunks = list(self._pool().map(simulate_chunk, *zip(*args)))
+        else:
+            chunks = [simulate_chunk(*chunk) for chunk in args]
+        return {key: sum(chunk[key] for chunk in chunks) for key in chunks[0]} if chunks else None
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+class RunThrottle:
+    """Lets each key start one run per `interval` seconds, within this process"""
+
+    def __init__(self, interval, max_keys=10000):
+        self.interval = interval
+        self.max_keys = max_keys
+        self._started = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """Record a run for key and return 0, or return the whole seconds until it may run"""
+        now = time.monotonic()
+        with self._lock:
+            wait = self._started.get(key, -math.inf) + self.interval - now
+            if wait > 0:
+                return math.ceil(wait)
+            if len(self._started) >= self.max_keys:
+                self._started = {k: t for k, t in self._started.items() if t + self.interval > now}
+            self._started[key] = now
+            return 0
@@ -0,0 +1,156 @@
+from app import (app, db, Driver, Team, Circuit, Race, RaceResult, Car, Qualifying, PitStop,
+                 DriverTeamContract, refresh_derived_data, bump_data_versions, install_scoring_systems,
+                 recompute_points)
+from load_history import insert_batches, reset_sequences
+from datetime import date, timedelta
+import argparse
+import random
+
+DRIVERS_PER_TEAM = 2
+COMPOUNDS = ['SOFT', 'MEDIUM', 'HARD']
+
+def generate(seasons, races_per_season, drivers=20, last_season=2025, seed=0):
+    """Replace the database contents with a deterministic synthetic history.
+
+    The same arguments always produce the same rows: `seasons` seasons
+    ending at `last_season`, each with `races_per_season` races entered by
+    `drivers` drivers, including qualifying, pit stops and contracts.
+    Returns the number of rows written per table.
+    """
+    rng = random.Random(seed)
+    # Separate stream, so picking fastest laps leaves every other row as it was
+    lap_rng = random.Random(seed + 1)
+    teams = max(1, drivers // DRIVERS_PER_TEAM)
+    first_season = last_season - seasons + 1
+    counts = {}
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        with db.engine.begin() as connection:
+            counts['teams'] = insert_batches(connection, Team.__table__, (
+                {'team_id': t, 'name': f'Team {t}', 'nationality': 'British', 'first_entry_year': first_season}
+                for t in range(1, teams + 1)
+            ))
+            counts['drivers'] = insert_batches(connection, Driver.__table__, (
+                {'driver_id': d, 'name': f'Driver {d}', 'nationality': 'British',
+                 'date_of_birth': date(1990, 1, 1) + timedelta(days=d * 97),
+                 'number': d, 'code': f'{d:03d}', 'first_race_date': date(first_season, 3, 1)}
+                for d in range(1, drivers + 1)
+            ))
+            counts['circuits'] = insert_batches(connection, Circuit.__table__, (
+                {'circuit_id': c, 'name': f'Circuit {c}', 'location': f'City {c}', 'country': 'Country',
+                 'length_km': round(rng.uniform(3.3, 7.0), 3), 'number_of_laps': rng.randint(44, 78)}
+                for c in range(1, races_per_season + 1)
+            ))
+
+            cars = {}
+            car_rows = []
+            for season in range(first_season, last_season + 1):
+                for team in range(1, teams + 1):
+                    cars[(team, season)] = len(car_rows) + 1
+                    car_rows.append({'car_id': len(car_rows) + 1, 'team_id': team, 'season': season,
+                                     'model_name': f'T{team}-{season}'})
+            counts['cars'] = insert_batches(connection, Car.__table__, car_rows)
+
+            # Drivers change team every few seasons; one contract per stint
+            line_ups = {}
+            contract_rows = []
+            order = list(range(1, drivers + 1))
+            for season in range(first_season, last_season + 1):
+                if (season - first_season) % 3 == 0:
+                    rng.shuffle(order)
+                for i, driver in enumerate(order):
+                    line_ups[(season, driver)] = i // DRIVERS_PER_TEAM % teams + 1
+            for driver in range(1, drivers + 1):
+                start = first_season
+                for season in range(first_season, last_season + 1):
+                    team = line_ups[(season, driver)]
+                    if season == last_season or line_ups[(season + 1, driver)] != team:
+                        contract_rows.append({
+                            'driver_id': driver, 'team_id': team,
+                            'start_date': date(start, 1, 1), 'end_date': date(season, 12, 31),
+                            'status': 'Active' if season == last_season else 'Completed'
+                        })
+                        start = season + 1
+            counts['contracts'] = insert_batches(connection, DriverTeamContract.__table__, contract_rows)
+
+            race_rows, result_rows, qualifying_rows, pit_rows = [], [], [], []
+            race_id = 0
+            for season in range(first_season, last_season + 1):
+                # Each season has a pecking order that shapes the results
+                pace = {d: rng.gauss(0, 1) for d in range(1, drivers + 1)}
+                for round_number in range(1, races_per_season + 1):
+                    race_id += 1
+                    laps = rng.randint(50, 70)
+                    race_rows.append({
+                        'race_id': race_id, 'season': season, 'round_number': round_number,
+                        'grand_prix_name': f'Grand Prix {round_number}', 'circuit_id': round_number,
+                        'date': date(season, 3, 1) + timedelta(days=7 * round_number),
+                        'weather_conditions': rng.choice(['Clear', 'Cloudy', 'Rainy']),
+                        'safety_car_appearances': rng.randint(0, 3), 'red_flags': int(rng.random() < 0.1)
+                    })
+                    grid = sorted(pace, key=lambda d: pace[d] + rng.gauss(0, 0.6), reverse=True)
+                    finish = sorted(pace, key=lambda d: pace[d] + rng.gauss(0, 0.9), reverse=True)
+                    for position, driver in enumerate(grid, start=1):
+                        base = 80 + round_number % 7
+                        qualifying_rows.append({
+                            'race_id': race_id, 'driver_id': driver, 'final_position': position,
+                            'q1_time': round(base + 0.05 * position + rng.random() * 0.2, 3),
+                            'q2_time': round(base - 0.3 + 0.05 * position, 3) if position <= 15 else None,
+                            'q3_time': round(base - 0.6 + 0.05 * position, 3) if position <= 10 else None
+                        })
+                    classified = 0
+                    race_results = len(result_rows)
+                    for driver in finish:
+                        status = 'DNF' if rng.random() < 0.08 else 'Finished'
+                        if status == 'Finished':
+                            classified += 1
+                        position = classified if status == 'Finished' else None
+                        team = line_ups[(season, driver)]
+                        result_rows.append({
+                            'race_id': race_id, 'driver_id': driver, 'team_id': team,
+                            'car_id': cars[(team, season)],
+                            'grid_position': grid.index(driver) + 1,
+                            'finish_position': position,
+                            'points_earned': 0.0,  # scored below by the season's scoring system
+                            'laps_completed': laps if status == 'Finished' else rng.randint(1, laps - 1),
+                            'status': status,
+                            'gap_to_leader': 'WINNER' if position == 1 else (
+                                f'+{rng.uniform(1, 90):.3f}' if status == 'Finished' else 'DNF'),
+                            'fastest_lap': False
+                        })
+                        stops = sorted(rng.sample(range(8, laps - 5), rng.randint(1, 3)))
+                        for stop_number, lap in enumerate(stops, start=1):
+                            pit_rows.append({
+                                'race_id': race_id, 'driver_id': driver, 'stop_number': stop_number,
+                                'lap_number': lap, 'stop_time': round(rng.uniform(19.5, 26.0), 3),
+                                'tire_compound': rng.choice(COMPOUNDS)
+                            })
+                    finishers = [row for row in result_rows[race_results:] if row['status'] == 'Finished']
+                    lap_rng.choice(finishers)['fastest_lap'] = True
+
+            counts['races'] = insert_batches(connection, Race.__table__, race_rows)
+            counts['results'] = insert_batches(connection, RaceResult.__table__, result_rows)
+            counts['qualifying'] = insert_batches(connection, Qualifying.__table__, qualifying_rows)
+            counts['pit_stops'] = insert_batches(connection, PitStop.__table__, pit_rows)
+
+            reset_sequences(connection)
+            install_scoring_systems(connection)
+            recompute_points(connection)
+            refresh_derived_data(connection)
+            bump_data_versions(connection, {'results', 'races', 'drivers', 'teams'})
+
+    return counts
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replace the database with synthetic race history.')
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--races', type=int, default=20, help='Races per season.')
+    parser.add_argument('--drivers', type=int, default=20)
+    parser.add_argument('--last-season', type=int, default=2025)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    counts = generate(args.seasons, args.races, args.drivers, args.last_season, args.seed)
+    print(', '.join(f"{key}: {value}" for key, value in counts.items()))
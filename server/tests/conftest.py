@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py reads DATABASE_URL at import, so point it at a throwaway database
+# before any test module imports it: TEST_DATABASE_URL (e.g. a scratch
+# PostgreSQL database, whose contents are replaced) or a temporary SQLite file
+os.environ['DATABASE_URL'] = (os.environ.get('TEST_DATABASE_URL')
+                              or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'tests.db')}")
+# Cheap hashes; the rounds only matter against a real attacker
+os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, User
+from synthetic_data import generate
+
+
+def using_sqlite():
+    with app.app_context():
+        return db.engine.dialect.name == 'sqlite'
+
+
+@pytest.fixture
+def history():
+    """Replace the database with two synthetic seasons of four races"""
+    generate(2, 4)
+    app.extensions['response_cache'].clear()
+    # User ids are reused by the new database
+    app.extensions['user_cache'].clear()
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def log_in(client, username, is_admin=False):
+    """Create a user and log the test client in as them"""
+    with app.app_context():
+        user = User(username=username, is_admin=is_admin)
+        user.set_password('password')
+        db.session.add(user)
+        db.session.commit()
+    response = client.post('/api/auth/login', json={'username': username, 'password': 'password'})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return client
+
+
+@pytest.fixture
+def user_client(history, client):
+    return log_in(client, 'user')
+
+
+@pytest.fixture
+def admin_client(history, client):
+    return log_in(client, 'admin', is_admin=True)
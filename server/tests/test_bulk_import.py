@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+import app as app_module
+from app import app, db, Race, RaceResult, DriverStanding
+
+
+@pytest.fixture
+def new_race(history):
+    """An empty 2025 race and the line-up of the season's last race to fill it with"""
+    with app.app_context():
+        last = db.session.execute(select(Race).order_by(Race.date.desc())).scalars().first()
+        race = Race(season=2025, round_number=last.round_number + 1, grand_prix_name='Grand Prix New',
+                    circuit_id=last.circuit_id, date=date(2025, 12, 7))
+        db.session.add(race)
+        db.session.commit()
+        line_up = db.session.execute(
+            select(RaceResult.driver_id, RaceResult.team_id, RaceResult.car_id)
+            .where(RaceResult.race_id == last.race_id).order_by(RaceResult.driver_id)
+        ).all()
+        return race.race_id, [
+            {'driver_id': row.driver_id, 'team_id': row.team_id, 'car_id': row.car_id,
+             'finish_position': position, 'points_earned': max(0, 11 - position)}
+            for position, row in enumerate(line_up, start=1)
+        ]
+
+
+def result_count():
+    with app.app_context():
+        return db.session.execute(select(func.count()).select_from(RaceResult)).scalar()
+
+
+def standings():
+    with app.app_context():
+        return dict(db.session.execute(
+            select(DriverStanding.driver_id, DriverStanding.points).where(DriverStanding.season == 2025)
+        ).all())
+
+
+def test_bulk_import_inserts_every_race_and_refreshes_standings(user_client, new_race):
+    race_id, rows = new_race
+    before = standings()
+
+    response = user_client.post('/api/race-results/bulk', json={'races': [{'race_id': race_id, 'results': rows}]})
+    assert response.status_code == 201
+    assert response.get_json() == {'inserted': len(rows)}
+
+    listed = user_client.get(f'/api/race-results?race_id={race_id}').get_json()['results']
+    assert [row['driver_id'] for row in listed] == [row['driver_id'] for row in rows]
+    after = standings()
+    assert {driver_id: after[driver_id] - before[driver_id] for driver_id in after} == {
+        row['driver_id']: row['points_earned'] for row in rows
+    }
+
+
+def test_bulk_import_reports_every_invalid_row(user_client, new_race):
+    race_id, rows = new_race
+    first = rows[0]
+    payload = [
+        {**first, 'race_id': race_id},
+        {**rows[1], 'race_id': race_id, 'car_id': None},
+        {**rows[2], 'race_id': race_id, 'grid_position': '3'},
+        {**rows[3], 'race_id': race_id, 'points_earned': 'ten'},
+        {**rows[4], 'race_id': race_id, 'driver_id': 999},
+        {**first, 'race_id': race_id},
+        {**first, 'race_id': 1},
+        'not a result',
+    ]
+    count = result_count()
+
+    response = user_client.post('/api/race-results/bulk', json=payload)
+    assert response.status_code == 400
+    assert response.get_json()['errors'] == [
+        {'index': 1, 'error': 'Missing required field: car_id'},
+        {'index': 2, 'error': 'Field must be an integer: grid_position'},
+        {'index': 3, 'error': 'Field must be a number: points_earned'},
+        {'index': 4, 'error': 'Unknown driver_id: 999'},
+        {'index': 5, 'error': f"Driver {first['driver_id']} already has a result for race {race_id}"},
+        {'index': 6, 'error': f"Driver {first['driver_id']} already has a result for race 1"},
+        {'index': 7, 'error': 'Result must be an object'},
+    ]
+    assert result_count() == count
+
+
+def test_one_bad_row_writes_nothing(user_client, new_race):
+    race_id, rows = new_race
+    before = standings()
+    rows[-1]['team_id'] = 999
+
+    response = user_client.post('/api/race-results/bulk', json={'race_id': race_id, 'results': [
+        {'race_id': race_id, **row} for row in rows
+    ]})
+    assert response.status_code == 400
+    assert [error['index'] for error in response.get_json()['errors']] == [len(rows) - 1]
+    assert user_client.get(f'/api/race-results?race_id={race_id}').get_json()['results'] == []
+    assert standings() == before
+
+
+def test_a_failure_after_the_insert_rolls_the_whole_batch_back(user_client, new_race, monkeypatch):
+    race_id, rows = new_race
+    count, before = result_count(), standings()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('refresh failed')
+    monkeypatch.setattr(app_module, 'refresh_derived_data', fail)
+
+    response = user_client.post('/api/race-results/bulk', json=[{'race_id': race_id, **row} for row in rows])
+    assert response.status_code == 500
+    assert result_count() == count
+    assert standings() == before
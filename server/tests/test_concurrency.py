@@ -0,0 +1,7 @@
+from check_concurrency import check_concurrency
+
+
+def test_reads_and_writes_do_not_block_each_other():
+    # On PostgreSQL this runs only the concurrent data_version bump check
+    failures = check_concurrency(hold=1.0, readers=2)
+    assert not failures, '\n'.join(failures)
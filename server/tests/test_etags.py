@@ -0,0 +1,40 @@
+from synthetic_data import generate
+
+
+def test_unchanged_data_revalidates_with_304(client, history):
+    response = client.get('/api/drivers/standings?season=2025')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    revalidated = client.get('/api/drivers/standings?season=2025', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
+    assert revalidated.get_data() == b''
+
+
+def test_a_write_changes_the_etag_of_affected_responses_only(user_client):
+    etags = {season: user_client.get(f'/api/drivers/standings?season={season}').headers['ETag']
+             for season in (2024, 2025)}
+
+    result = user_client.get('/api/race-results?season=2024&limit=1').get_json()['results'][0]
+    assert user_client.put(f"/api/race-results/{result['result_id']}",
+                           json={'points_earned': result['points_earned'] + 10}).status_code == 200
+
+    changed = user_client.get('/api/drivers/standings?season=2024', headers={'If-None-Match': etags[2024]})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etags[2024]
+    standing = next(row for row in changed.get_json() if row['driver_id'] == result['driver_id'])
+    assert standing['total_points'] >= result['points_earned'] + 10
+
+    unchanged = user_client.get('/api/drivers/standings?season=2025', headers={'If-None-Match': etags[2025]})
+    assert unchanged.status_code == 304
+
+
+def test_a_rebuilt_database_never_matches_an_old_etag(client):
+    generate(2, 4)
+    etag = client.get('/api/drivers/standings?season=2025').headers['ETag']
+    # Same rows and the same data versions, but a new database
+    generate(2, 4)
+    response = client.get('/api/drivers/standings?season=2025', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,105 @@
+from sqlalchemy import insert, select
+
+from app import app, db, Qualifying, QualifyingSummary, RaceResult
+
+
+def race_drivers(race_id):
+    with app.app_context():
+        return db.session.execute(
+            select(RaceResult.driver_id).where(RaceResult.race_id == race_id).order_by(RaceResult.driver_id)
+        ).scalars().all()
+
+
+def stored_qualifying(race_id):
+    with app.app_context():
+        return db.session.execute(
+            select(Qualifying.driver_id, Qualifying.final_position)
+            .where(Qualifying.race_id == race_id).order_by(Qualifying.driver_id)
+        ).all()
+
+
+def test_invalid_rows_are_reported_and_nothing_is_replaced(user_client):
+    d = race_drivers(1)
+    before = stored_qualifying(1)
+    rows = [
+        {'driver_id': d[0], 'q1_time': 80.1, 'final_position': 1},
+        {'driver_id': '2', 'q1_time': 80.2},
+        {'driver_id': d[2], 'q1_time': -1},
+        {'driver_id': d[3], 'q1_time': 80.3, 'final_position': 0},
+        {'driver_id': 999, 'q1_time': 80.4},
+        {'driver_id': d[0], 'q1_time': 80.5},
+        {'driver_id': d[5], 'q1_time': 80.6, 'final_position': 1},
+        {'driver_id': d[6], 'q2_time': True},
+    ]
+
+    response = user_client.post('/api/races/1/qualifying', json={'results': rows})
+    assert response.status_code == 400
+    assert response.get_json()['errors'] == [
+        {'index': 1, 'error': 'Field must be an integer: driver_id'},
+        {'index': 2, 'error': 'Field must be a positive number: q1_time'},
+        {'index': 3, 'error': 'Field must be a positive integer: final_position'},
+        {'index': 4, 'error': 'Unknown driver_id: 999'},
+        {'index': 5, 'error': f'Driver {d[0]} appears more than once'},
+        {'index': 6, 'error': 'Position 1 appears more than once'},
+        {'index': 7, 'error': 'Field must be a positive number: q2_time'},
+    ]
+    assert stored_qualifying(1) == before
+
+
+def test_positions_must_be_given_for_all_drivers_or_none(user_client):
+    d = race_drivers(1)
+    response = user_client.post('/api/races/1/qualifying', json=[
+        {'driver_id': d[0], 'q1_time': 80.1, 'final_position': 1},
+        {'driver_id': d[1], 'q1_time': 80.2},
+    ])
+    assert response.status_code == 400
+    assert response.get_json()['errors'] == [
+        {'index': None, 'error': 'final_position must be given for every driver or for none'}
+    ]
+    assert user_client.post('/api/races/999/qualifying', json=[]).status_code == 404
+
+
+def test_missing_positions_are_derived_knockout_style(user_client):
+    d = race_drivers(1)
+    # A faster Q1 or Q2 time never beats reaching a later session
+    rows = [
+        {'driver_id': d[0], 'q1_time': 79.0},
+        {'driver_id': d[1], 'q1_time': 80.0, 'q2_time': 79.9, 'q3_time': 79.8},
+        {'driver_id': d[2]},
+        {'driver_id': d[3], 'q1_time': 80.1, 'q2_time': 79.1},
+        {'driver_id': d[4], 'q1_time': 80.2, 'q2_time': 80.0, 'q3_time': 79.5},
+        {'driver_id': d[5], 'q1_time': 78.5},
+    ]
+
+    response = user_client.post('/api/races/1/qualifying', json={'results': rows})
+    assert response.status_code == 201
+    assert response.get_json() == {'inserted': 6}
+
+    order = [d[4], d[1], d[3], d[5], d[0], d[2]]
+    assert stored_qualifying(1) == sorted((driver_id, order.index(driver_id) + 1) for driver_id in order)
+    classification = user_client.get('/api/races/1/qualifying').get_json()
+    assert [row['driver']['driver_id'] for row in classification['results']] == order
+    assert [row['position'] for row in classification['results']] == [1, 2, 3, 4, 5, 6]
+    assert classification['pole']['driver_id'] == d[4]
+    assert classification['pole']['time'] == 79.5
+    assert classification['entries'] == 6
+
+
+def test_a_duplicate_result_row_does_not_duplicate_the_summary(user_client):
+    with app.app_context():
+        entry = db.session.execute(select(RaceResult).where(RaceResult.race_id == 1)).scalars().first()
+        # Bypasses the API's duplicate check, like a raw import would
+        db.session.execute(insert(RaceResult.__table__).values(
+            race_id=1, driver_id=entry.driver_id, team_id=entry.team_id, car_id=entry.car_id, status='Finished'
+        ))
+        db.session.commit()
+    drivers = race_drivers(1)
+    response = user_client.post('/api/races/1/qualifying', json=[
+        {'driver_id': driver_id, 'q1_time': 80 + i / 10} for i, driver_id in enumerate(sorted(set(drivers)))
+    ])
+    assert response.status_code == 201
+    with app.app_context():
+        summary = db.session.execute(
+            select(QualifyingSummary.driver_id).where(QualifyingSummary.race_id == 1)
+        ).scalars().all()
+    assert sorted(summary) == sorted(set(drivers))
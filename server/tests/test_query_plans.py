@@ -0,0 +1,31 @@
+import pytest
+
+from app import app
+from check_query_plans import capture_statements, check_query_plans, query_plan
+from conftest import using_sqlite
+from synthetic_data import generate
+
+pytestmark = pytest.mark.skipif(not using_sqlite(), reason='query plans are only checked against SQLite')
+
+
+def test_hot_queries_use_indexes():
+    generate(2, 6)
+    with app.app_context():
+        failures = check_query_plans()
+    assert not failures, '\n'.join(f"{source}: {scan}\n    {' '.join(statement.split())}"
+                                   for source, scan, statement in failures)
+
+
+def test_results_cursor_page_seeks_without_sorting():
+    generate(2, 6)
+    client = app.test_client()
+    with app.app_context():
+        cursor = client.get('/api/race-results?limit=5').get_json()['next_cursor']
+        statements = capture_statements(lambda: client.get(f'/api/race-results?limit=5&cursor={cursor}'))
+        plans = [[row[-1] for row in query_plan(statement, parameters)]
+                 for statement, parameters in statements if 'FROM race_result' in statement]
+    assert len(plans) == 1
+    plan = plans[0]
+    assert plan[0].startswith('SEARCH race USING INDEX ix_race_date_id (date<?)'), plan
+    assert 'SEARCH race_result USING INDEX ix_race_result_race_order (race_id=?)' in plan, plan
+    assert not [line for line in plan if 'TEMP B-TREE' in line], plan
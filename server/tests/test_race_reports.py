@@ -0,0 +1,53 @@
+import json
+
+from sqlalchemy import select
+
+from app import app, db, RaceReport, render_race_report
+
+
+def stored_report(race_id):
+    with app.app_context():
+        return db.session.execute(select(RaceReport.report).where(RaceReport.race_id == race_id)).scalar()
+
+
+def test_only_admins_finalize_existing_races(user_client):
+    assert user_client.post('/api/races/1/finalize').status_code == 403
+    assert stored_report(1) is None
+
+
+def test_finalized_report_is_stored_and_served(admin_client):
+    live = admin_client.get('/api/races/1/report').get_json()
+    assert live['race_details']['finalized_at'] is None
+
+    assert admin_client.post('/api/races/1/finalize').status_code == 200
+    assert admin_client.post('/api/races/999/finalize').status_code == 404
+
+    report = admin_client.get('/api/races/1/report').get_json()
+    assert report == json.loads(stored_report(1))
+    assert report['race_details']['finalized_at'] is not None
+    assert report['results'] == live['results']
+
+
+def report_drivers(client, race_id):
+    return [row['driver']['name'] for row in client.get(f'/api/races/{race_id}/report').get_json()['results']]
+
+
+def test_result_changes_re_render_a_finalized_report(admin_client):
+    admin_client.post('/api/races/1/finalize')
+    finalized_at = admin_client.get('/api/races/1/report').get_json()['race_details']['finalized_at']
+    drivers = report_drivers(admin_client, 1)
+    first, second = admin_client.get('/api/race-results?race_id=1&limit=2').get_json()['results']
+    assert [first['driver_name'], second['driver_name']] == drivers[:2]
+
+    # Swap the first two finishers
+    for result, position in ((first, second['finish_position']), (second, first['finish_position'])):
+        response = admin_client.put(f"/api/race-results/{result['result_id']}", json={'finish_position': position})
+        assert response.status_code == 200
+
+    assert report_drivers(admin_client, 1) == [drivers[1], drivers[0]] + drivers[2:]
+    assert admin_client.get('/api/races/1/report').get_json()['race_details']['finalized_at'] == finalized_at
+    with app.app_context():
+        assert stored_report(1) == render_race_report(db.session.connection(), 1)
+
+    assert admin_client.delete(f"/api/race-results/{first['result_id']}").status_code == 204
+    assert report_drivers(admin_client, 1) == [drivers[1]] + drivers[2:]
@@ -0,0 +1,50 @@
+from cache import ResponseCache
+from app import app
+
+
+def test_invalidate_tags_drops_only_the_tagged_entries():
+    cache = ResponseCache()
+    cache.set('report:1', b'one', {'results', 'race:1'})
+    cache.set('report:2', b'two', {'results', 'race:2'})
+    cache.set('teams', b'teams', {'teams'})
+
+    cache.invalidate_tags({'race:1', 'drivers'})
+    assert cache.get('report:1') is None
+    assert cache.get('report:2') == b'two'
+    assert cache.get('teams') == b'teams'
+
+    cache.invalidate_tags({'results'})
+    assert cache.get('report:2') is None
+    assert cache.get('teams') == b'teams'
+    assert cache.stats()['invalidations'] == 2
+
+
+def test_miss_counts_stay_bounded():
+    cache = ResponseCache(max_entries=4)
+    for i in range(100):
+        cache.get(f'missing:{i}')
+    assert len(cache._misses) == 4
+    assert cache.stats()['misses'] == 100
+
+
+def cached_keys():
+    return set(app.extensions['response_cache'].stats()['keys'])
+
+
+def test_a_result_write_drops_only_the_responses_it_affects(user_client):
+    for route in ('/api/races/1/report', '/api/races/5/report', '/api/drivers/standings?season=2024',
+                  '/api/drivers/standings?season=2025'):
+        assert user_client.get(route).status_code == 200
+    before = cached_keys()
+    assert {key.split('@')[0] for key in before} >= {
+        'race-report:1', 'race-report:5', 'driver-standings:2024', 'driver-standings:2025'
+    }
+
+    # Race 1 is in 2024, race 5 in 2025
+    result = user_client.get('/api/race-results?race_id=1&limit=1').get_json()['results'][0]
+    response = user_client.put(f"/api/race-results/{result['result_id']}", json={'laps_completed': 1})
+    assert response.status_code == 200
+
+    dropped = {key.split('@')[0] for key in before - cached_keys()}
+    assert 'race-report:1' in dropped and 'driver-standings:2024' in dropped
+    assert not dropped & {'race-report:5', 'driver-standings:2025'}
@@ -0,0 +1,103 @@
+from sqlalchemy import select, update
+
+from app import (app, db, Race, RaceResult, DriverStanding, install_scoring_systems, race_points_table,
+                 recompute_points, rescore_seasons)
+
+
+def season_points(season):
+    """{result_id: points_earned} for every result of a season"""
+    rows = db.session.execute(
+        select(RaceResult.result_id, RaceResult.points_earned).join(Race).where(Race.season == season)
+    )
+    return dict(rows.all())
+
+
+def test_recompute_previews_then_applies_then_has_nothing_left(history):
+    with app.app_context():
+        scored = season_points(2025)
+        # Hand-entered points that disagree with the scoring system
+        winners = select(RaceResult.result_id).where(RaceResult.finish_position == 1)
+        db.session.execute(update(RaceResult).where(RaceResult.result_id.in_(winners)).values(points_earned=1))
+        db.session.commit()
+        edited = season_points(2025)
+        changed = {result_id for result_id in scored if scored[result_id] != edited[result_id]}
+        assert changed
+
+        preview = rescore_seasons([2025], preview=True)
+        assert {change.result_id for change in preview} == changed
+        assert all(change.season == 2025 and change.old_points == 1 for change in preview)
+        db.session.rollback()
+        assert season_points(2025) == edited
+
+        applied = rescore_seasons([2025])
+        assert [tuple(change) for change in applied] == [tuple(change) for change in preview]
+        assert season_points(2025) == scored
+        standings = db.session.execute(
+            select(DriverStanding.points).where(DriverStanding.season == 2025)
+        ).scalars().all()
+        assert sum(standings) == sum(scored.values())
+
+        assert rescore_seasons([2025]) == []
+
+
+def test_disqualification_scores_nothing_when_the_system_says_so(history):
+    with app.app_context():
+        connection = db.session.connection()
+        winner = db.session.execute(
+            select(RaceResult.result_id).join(Race)
+            .where(Race.season == 2025, RaceResult.finish_position == 1)
+        ).scalars().first()
+        db.session.execute(update(RaceResult).where(RaceResult.result_id == winner).values(status='DSQ'))
+
+        changes = recompute_points(connection, result_ids=[winner], preview=True)
+        assert [(change.result_id, change.points) for change in changes] == [(winner, 0)]
+
+        install_scoring_systems(connection, [{
+            'name': 'DSQ keeps points', 'first_season': 1950, 'race': [10, 6, 4, 3, 2, 1],
+            'dsq_scores_zero': False
+        }])
+        assert race_points_table(connection, 2025)[0] == 10
+        changes = recompute_points(connection, result_ids=[winner], preview=True)
+        assert [(change.result_id, change.points) for change in changes] == [(winner, 10)]
+        db.session.rollback()
+
+
+def race_points(race_id):
+    with app.app_context():
+        rows = db.session.execute(
+            select(RaceResult.result_id, RaceResult.points_earned).where(RaceResult.race_id == race_id)
+        )
+        return dict(rows.all())
+
+
+def test_submitted_points_are_stored_as_sent_by_default(user_client):
+    result_id = next(iter(race_points(1)))
+    response = user_client.put(f'/api/race-results/{result_id}', json={'points_earned': 3.5})
+    assert response.status_code == 200
+    assert response.get_json()['points_earned'] == 3.5
+    assert 'points_overridden' not in response.get_json()
+    assert race_points(1)[result_id] == 3.5
+
+
+def test_auto_scoring_rescores_only_the_written_result(user_client, monkeypatch):
+    monkeypatch.setitem(app.config, 'AUTO_SCORE_RESULTS', True)
+    # An archive race scored at half points, which no scoring system models
+    with app.app_context():
+        db.session.execute(
+            update(RaceResult).where(RaceResult.race_id == 1).values(points_earned=RaceResult.points_earned / 2)
+        )
+        db.session.commit()
+    archive = race_points(1)
+    with app.app_context():
+        winner = db.session.execute(
+            select(RaceResult.result_id).where(RaceResult.race_id == 1, RaceResult.finish_position == 1)
+        ).scalar_one()
+        full_points = race_points_table(db.session.connection(), 2024)[0]
+
+    response = user_client.put(f'/api/race-results/{winner}', json={'points_earned': archive[winner]})
+    assert response.status_code == 200
+    assert response.get_json()['points_overridden'] == {'submitted': archive[winner], 'points_earned': full_points}
+
+    after = race_points(1)
+    assert after.pop(winner) == full_points
+    assert after == {result_id: points for result_id, points in archive.items() if result_id != winner}
@@ -0,0 +1,46 @@
+import pytest
+
+from app import app
+from simulation import RunThrottle
+
+
+@pytest.fixture(autouse=True)
+def small_runs(monkeypatch):
+    monkeypatch.setitem(app.config, 'SIMULATION_DEFAULT_RUNS', 1000)
+    monkeypatch.setitem(app.extensions, 'simulation_throttle', RunThrottle(60))
+
+
+def test_anonymous_callers_get_only_the_default_run(client, history):
+    response = client.get('/api/championship/simulation?season=2025')
+    assert response.status_code == 200
+    assert response.get_json()['runs'] == 1000
+    for params in ('runs=500', 'seed=1', 'rounds=2', 'runs=1000&seed=0&rounds=3'):
+        response = client.get(f'/api/championship/simulation?season=2025&{params}')
+        assert response.status_code == 401
+
+
+def test_users_are_throttled_only_when_a_new_run_starts(user_client):
+    assert user_client.get('/api/championship/simulation?season=2025&runs=300000').status_code == 400
+
+    first = user_client.get('/api/championship/simulation?season=2025&seed=1')
+    assert first.status_code == 200
+    # A new seed is a new run
+    throttled = user_client.get('/api/championship/simulation?season=2025&seed=2')
+    assert throttled.status_code == 429
+    assert 0 < int(throttled.headers['Retry-After']) <= 60
+
+    # Cached runs, the earlier one and the default, are still served
+    again = user_client.get('/api/championship/simulation?season=2025&seed=1')
+    assert again.status_code == 200
+    assert again.get_json() == first.get_json()
+    assert user_client.get('/api/championship/simulation?season=2025').status_code == 200
+
+
+def test_run_throttle_is_per_key(monkeypatch):
+    clock = iter([100.0, 101.0, 102.0, 111.0])
+    monkeypatch.setattr('simulation.time.monotonic', lambda: next(clock))
+    throttle = RunThrottle(10)
+    assert throttle.acquire(1) == 0
+    assert throttle.acquire(1) == 9
+    assert throttle.acquire(2) == 0
+    assert throttle.acquire(1) == 0
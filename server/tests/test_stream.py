@@ -0,0 +1,92 @@
+import json
+import time
+
+import pytest
+
+from app import app, db, standings_positions
+from events import EventPublisher, HEARTBEAT, RESYNC, format_event
+
+
+def wait_until_published(publisher, count):
+    deadline = time.monotonic() + 5
+    while publisher.published < count:
+        assert time.monotonic() < deadline, 'publisher thread did not deliver'
+        time.sleep(0.01)
+
+
+def test_a_client_that_falls_behind_gets_one_resync():
+    publisher = EventPublisher(max_messages=2)
+    slow, fast = publisher.subscribe(), publisher.subscribe()
+
+    publisher.publish('results', {'n': 1})
+    wait_until_published(publisher, 1)
+    assert publisher.wait(fast, 0) == [format_event('results', {'n': 1})]
+    for n in (2, 3, 4):
+        publisher.publish('results', {'n': n})
+    wait_until_published(publisher, 4)
+
+    # Each queue was cleared on the event that overflowed it; only that event and later ones are kept
+    assert publisher.wait(slow, 0) == [RESYNC, format_event('results', {'n': 3}), format_event('results', {'n': 4})]
+    assert publisher.wait(fast, 0) == [RESYNC, format_event('results', {'n': 4})]
+    assert publisher.wait(slow, 0) == [HEARTBEAT]
+    assert publisher.stats() == {'clients': 2, 'published': 4, 'resyncs': 2}
+
+    publisher.publish('results', {'n': 5})
+    wait_until_published(publisher, 5)
+    assert publisher.wait(slow, 0) == [format_event('results', {'n': 5})]
+
+
+def test_streams_beyond_the_limit_are_refused(client, monkeypatch):
+    monkeypatch.setattr(app.extensions['event_publisher'], 'max_clients', 0)
+    response = client.get('/api/stream')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(app.config['STREAM_HEARTBEAT_SECONDS'])
+
+
+@pytest.fixture
+def subscription():
+    publisher = app.extensions['event_publisher']
+    subscription = publisher.subscribe()
+    yield subscription
+    publisher.unsubscribe(subscription)
+
+
+def next_event(subscription):
+    messages = app.extensions['event_publisher'].wait(subscription, 5)
+    assert len(messages) == 1 and messages[0] != HEARTBEAT
+    name, data = messages[0].decode('utf-8').strip().split('\n')
+    assert name == 'event: results'
+    return json.loads(data.removeprefix('data: '))
+
+
+def current_standings(season):
+    with app.app_context():
+        return standings_positions(db.session.connection(), {season})
+
+
+def test_a_result_change_streams_only_the_standings_it_moved(user_client, subscription):
+    before = current_standings(2024)
+    winner = user_client.get('/api/race-results?race_id=1&limit=1').get_json()['results'][0]
+    response = user_client.put(f"/api/race-results/{winner['result_id']}",
+                               json={'points_earned': winner['points_earned'] + 100})
+    assert response.status_code == 200
+
+    event = next_event(subscription)
+    after = current_standings(2024)
+    assert event['race_ids'] == [1]
+    assert event['deleted_result_ids'] == []
+    assert [result['result_id'] for result in event['results']] == [winner['result_id']]
+    assert event['results'][0]['points_earned'] == winner['points_earned'] + 100
+
+    [season] = event['standings']
+    assert season['season'] == 2024
+    for kind, key in (('drivers', 'driver_id'), ('teams', 'team_id')):
+        moved = {id_: value for id_, value in after[(2024, kind)].items() if before[(2024, kind)][id_] != value}
+        assert {row[key]: (row['position'], row['points']) for row in season[kind]} == moved
+    assert season['drivers'][0] == {'driver_id': winner['driver_id'], 'position': 1,
+                                    'points': after[(2024, 'drivers')][winner['driver_id']][1]}
+
+    assert user_client.delete(f"/api/race-results/{winner['result_id']}").status_code == 204
+    event = next_event(subscription)
+    assert event['results'] == []
+    assert event['deleted_result_ids'] == [winner['result_id']]
@@ -0,0 +1,43 @@
+from app import app, db, User
+
+
+def set_admin(username, is_admin):
+    with app.app_context():
+        user = User.query.filter_by(username=username).one()
+        user.is_admin = is_admin
+        db.session.commit()
+
+
+def is_admin(client):
+    status = client.get('/api/auth/status').get_json()
+    return status['authenticated'] and status['is_admin']
+
+
+def test_session_user_is_served_from_the_cache(user_client):
+    cache = app.extensions['user_cache']
+    user_client.get('/api/auth/status')
+    hits = cache.stats()['hits']
+    user_client.get('/api/auth/status')
+    assert cache.stats()['hits'] == hits + 1
+
+
+def test_a_role_change_applies_to_the_next_request(user_client):
+    preview = {'season': 2025, 'preview': True}
+    assert not is_admin(user_client)
+    assert user_client.post('/api/points/recompute', json=preview).status_code == 403
+
+    set_admin('user', True)
+    assert is_admin(user_client)
+    assert user_client.post('/api/points/recompute', json=preview).status_code == 200
+
+    set_admin('user', False)
+    assert not is_admin(user_client)
+    assert user_client.post('/api/points/recompute', json=preview).status_code == 403
+
+
+def test_a_deleted_user_is_logged_out(user_client):
+    assert user_client.get('/api/auth/status').get_json()['authenticated']
+    with app.app_context():
+        db.session.delete(User.query.filter_by(username='user').one())
+        db.session.commit()
+    assert user_client.get('/api/auth/status').get_json() == {'authenticated': False}